@@ -15,7 +15,14 @@ class ArticleModelForm(forms.ModelForm):
         fields = (
             "title",
             "text",
+            "publish_at",
         )
+        widgets = {
+            # Browsers only fill datetime-local inputs with values in their format.
+            "publish_at": forms.DateTimeInput(
+                format="%Y-%m-%dT%H:%M", attrs={"type": "datetime-local"}
+            ),
+        }
 
     def save(self, author=None, commit=True):
         if author:
@@ -0,0 +1,44 @@
+"""
+Management command publishing the scheduled drafts.
+"""
+import time
+from django.core.management.base import BaseCommand
+from articles.models import Article
+
+
+class Command(BaseCommand):
+    """
+    Publishes the due drafts in batches, once or every interval seconds.
+    """
+
+    help = "Publishes the drafts whose publishing time has come."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Seconds between runs, runs once if 0.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of articles published per UPDATE.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                published = Article.objects.publish_due(
+                    batch_size=options["batch_size"]
+                )
+                if published or not options["interval"]:
+                    self.stdout.write(
+                        self.style.SUCCESS("Published %d articles." % published)
+                    )
+                if not options["interval"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,42 @@
+"""
+Management command rendering the text of articles to html.
+"""
+from django.core.management.base import BaseCommand
+from articles.models import Article
+from articles.rendering import RENDERER_VERSION
+
+
+class Command(BaseCommand):
+    """
+    Renders the articles rendered by an older renderer in parallel.
+    """
+
+    help = "Renders the text of the articles rendered by an older renderer."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Renders every article, even the up to date ones.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of worker processes, defaults to the number of CPUs.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of articles rendered per batch.",
+        )
+
+    def handle(self, *args, **options):
+        articles = Article.objects.all()
+        if not options["all"]:
+            articles = articles.exclude(renderer_version=RENDERER_VERSION)
+        rendered = articles.render(
+            workers=options["workers"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(self.style.SUCCESS("Rendered %d articles." % rendered))
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:55
+
+import core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0002_auto_20201231_1319"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="article",
+            name="id",
+            field=models.UUIDField(
+                default=core.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
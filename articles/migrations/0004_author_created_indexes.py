@@ -0,0 +1,28 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0003_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("published_at__isnull", False)),
+                fields=["-created_at", "-id"],
+                name="article_published_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["author", "-created_at", "-id"],
+                name="article_author_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-18 10:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0004_author_created_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="renderer_version",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.16 on 2026-10-18 10:13
+
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+
+def excerpt(text, length=200):
+    """
+    Returns the start of text with its whitespace collapsed, truncated to
+    length characters, as core.models.excerpt did when written.
+    """
+    return Truncator(" ".join(text.split())).chars(length)
+
+
+def set_excerpts(apps, schema_editor):
+    """
+    Sets the excerpts of the existing articles.
+    """
+    Article = apps.get_model("articles", "Article")
+    batch = []
+    for article in Article.objects.only("pk", "text").iterator(1000):
+        article.excerpt = excerpt(article.text)
+        batch.append(article)
+        if len(batch) == 1000:
+            Article.objects.bulk_update(batch, ["excerpt"])
+            batch = []
+    Article.objects.bulk_update(batch, ["excerpt"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0005_rendered_html"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="excerpt",
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.RunPython(set_excerpts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.16 on 2026-10-18 10:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0006_excerpts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="publish_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Publishes the draft at this time if set.",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("published_at__isnull", True)),
+                fields=["publish_at", "id"],
+                name="article_scheduled_idx",
+            ),
+        ),
+    ]
@@ -1,33 +1,181 @@
 """
 Models for articles app.
 """
-import uuid
+from concurrent.futures import ProcessPoolExecutor
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Now
 from django.urls import reverse
 from django.utils import timezone
-from core.models import TimeStampedModel
+from core import page_cache
+from core.models import AuthoredQuerySet, ExcerptedModel, TimeStampedModel, uuid7
+from .rendering import RENDERER_VERSION, render_markdown
 
 
-class Article(TimeStampedModel):
+class ArticleQuerySet(AuthoredQuerySet):
+    """
+    QuerySet class for Article model.
+    """
+
+    excerpted_fields = ("text", "html")
+
+    def render(self, workers=None, batch_size=500):
+        """
+        Renders the text of the articles to html with the current renderer in
+        a pool of worker processes, returning the number of articles rendered.
+
+        Articles whose text changed while being rendered are left alone, they
+        were rendered when saved.
+        """
+        rendered, last = 0, None
+        executor = ProcessPoolExecutor(workers) if workers != 1 else None
+        try:
+            while True:
+                queryset = self.order_by("pk")
+                if last is not None:
+                    queryset = queryset.filter(pk__gt=last)
+                batch = list(queryset.values_list("pk", "text")[:batch_size])
+                if not batch:
+                    break
+                texts = [text for pk, text in batch]
+                if executor is None:
+                    htmls = map(render_markdown, texts)
+                else:
+                    htmls = executor.map(render_markdown, texts, chunksize=50)
+                with transaction.atomic():
+                    for (pk, text), html in zip(batch, htmls):
+                        rendered += Article.objects.filter(pk=pk, text=text).update(
+                            html=html, renderer_version=RENDERER_VERSION
+                        )
+                last = batch[-1][0]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        if rendered:
+            page_cache.invalidate(Article)
+        return rendered
+
+    def due(self, now=None):
+        """
+        Returns the drafts scheduled to be published by now, the earliest
+        first.
+        """
+        return self.filter(
+            published_at=None, publish_at__lte=now or timezone.now()
+        ).order_by("publish_at", "pk")
+
+    def publish_due(self, now=None, batch_size=500):
+        """
+        Publishes the due drafts with one UPDATE per batch and returns the
+        number of articles published.
+
+        update() doesn't send signals, so each batch is added to the search
+        index in bulk and the cached article pages are invalidated once.
+        """
+        from search.models import SearchEntry
+
+        now = now or timezone.now()
+        published = 0
+        while True:
+            pks = list(self.due(now).values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+            with transaction.atomic():
+                updated = Article.objects.filter(pk__in=pks, published_at=None).update(
+                    published_at=now, modified_at=Now()
+                )
+                rows = Article.objects.filter(pk__in=pks, published_at=now).values_list(
+                    "pk", "title", "created_at"
+                )
+                SearchEntry.objects.bulk_create(
+                    [
+                        SearchEntry(
+                            category="articles",
+                            object_id=pk,
+                            text=title,
+                            created_at=created_at,
+                        )
+                        for pk, title, created_at in rows
+                    ],
+                    ignore_conflicts=True,
+                )
+            page_cache.invalidate(Article)
+            published += updated
+        return published
+
+
+class Article(TimeStampedModel, ExcerptedModel):
     """
     Class for article model.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     title = models.CharField(max_length=255)
     text = models.TextField()
+    html = models.TextField(blank=True, editable=False)
+    renderer_version = models.PositiveSmallIntegerField(default=0, editable=False)
     author = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="articles"
     )
     published_at = models.DateTimeField(blank=True, null=True)
+    publish_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="Publishes the draft at this time if set.",
+    )
+
+    objects = ArticleQuerySet.as_manager()
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="article_published_idx",
+                condition=models.Q(published_at__isnull=False),
+            ),
+            models.Index(
+                fields=["author", "-created_at", "-id"],
+                name="article_author_created_idx",
+            ),
+            models.Index(
+                fields=["publish_at", "id"],
+                name="article_scheduled_idx",
+                condition=models.Q(published_at__isnull=True),
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._rendered_text = instance.__dict__.get("text")
+        return instance
+
+    def save(self, *args, **kwargs):
+        if (
+            self.renderer_version != RENDERER_VERSION
+            or getattr(self, "_rendered_text", None) != self.text
+        ):
+            self.render()
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {
+                    *kwargs["update_fields"],
+                    "html",
+                    "renderer_version",
+                }
+        super().save(*args, **kwargs)
+
+    def render(self):
+        """
+        Renders the text to html with the current renderer.
+        """
+        self.html = render_markdown(self.text)
+        self.renderer_version = RENDERER_VERSION
+        self._rendered_text = self.text
+
     def get_absolute_url(self):
         """
         Returns the absolute url of article.
@@ -46,4 +194,4 @@ class Article(TimeStampedModel):
         """
         Returns whether article is published or not.
         """
-        return self.published_at is not None
\ No newline at end of file
+        return self.published_at is not None
@@ -0,0 +1,126 @@
+"""
+Contains the renderer of article texts to HTML.
+
+Texts are written in a subset of Markdown: headings, paragraphs, block quotes,
+lists, fenced code blocks, code spans, emphasis and links. The source is
+escaped before being marked up, so the HTML is safe to render as is.
+
+RENDERER_VERSION is stamped on rendered articles and must be incremented when
+the output of render_markdown changes, so that render_articles re-renders them.
+"""
+import re
+from django.utils.html import escape
+
+RENDERER_VERSION = 3
+
+HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*$")
+UNORDERED_ITEM = re.compile(r"^[-*+]\s+(.*)$")
+ORDERED_ITEM = re.compile(r"^\d+[.)]\s+(.*)$")
+QUOTE = re.compile(r"^&gt;\s?(.*)$")
+FENCE = "```"
+# Block quotes nested deeper are rendered as the text of the innermost one.
+MAX_QUOTE_DEPTH = 8
+
+CODE_SPAN = re.compile(r"`([^`]+)`")
+# Spans can't hold the character starting them, so that a marker that is never
+# closed is only scanned up to the next one and rendering stays linear.
+STRONG = re.compile(r"\*\*(?=\S)([^*]+?)(?<=\S)\*\*")
+EMPHASIS = re.compile(r"(?<![\w*])\*(?=\S)([^*]+?)(?<=\S)\*(?![\w*])")
+LINK = re.compile(r"\[([^\[\]]+)\]\(((?:https?://|/)[^\s()\[\x00]*)\)")
+
+
+def _render_emphasis(text):
+    text = STRONG.sub(r"<strong>\1</strong>", text)
+    return EMPHASIS.sub(r"<em>\1</em>", text)
+
+
+def render_inline(text):
+    """
+    Returns the HTML of escaped text with its code spans, emphasis and links
+    marked up.
+
+    Code spans and links are replaced by placeholders while the emphasis is
+    marked up, so that it can't reach into their contents or urls.
+    """
+    spans = []
+
+    def protect(html):
+        spans.append(html)
+        return "\x00%d\x00" % (len(spans) - 1)
+
+    text = text.replace("\x00", "")
+    text = CODE_SPAN.sub(
+        lambda match: protect("<code>%s</code>" % match.group(1)), text
+    )
+    text = LINK.sub(
+        lambda match: protect(
+            '<a href="%s" rel="nofollow">%s</a>'
+            % (match.group(2), _render_emphasis(match.group(1)))
+        ),
+        text,
+    )
+    text = _render_emphasis(text)
+    # Links may hold code spans, so placeholders are restored until none is left.
+    while "\x00" in text:
+        text = re.sub("\x00(\\d+)\x00", lambda match: spans[int(match.group(1))], text)
+    return text
+
+
+def _render_list(lines, pattern, tag):
+    items = "".join(
+        "<li>%s</li>" % render_inline(pattern.match(line).group(1)) for line in lines
+    )
+    return "<%s>%s</%s>" % (tag, items, tag)
+
+
+def _render_heading(match):
+    level = len(match.group(1))
+    return "<h%d>%s</h%d>" % (level, render_inline(match.group(2)), level)
+
+
+def _render_block(lines, depth):
+    if all(UNORDERED_ITEM.match(line) for line in lines):
+        return _render_list(lines, UNORDERED_ITEM, "ul")
+    if all(ORDERED_ITEM.match(line) for line in lines):
+        return _render_list(lines, ORDERED_ITEM, "ol")
+    if depth < MAX_QUOTE_DEPTH and all(QUOTE.match(line) for line in lines):
+        quoted = [QUOTE.match(line).group(1) for line in lines]
+        return "<blockquote>%s</blockquote>" % _render_blocks(quoted, depth + 1)
+    return "<p>%s</p>" % "<br>".join(render_inline(line) for line in lines)
+
+
+def _render_blocks(lines, depth=0):
+    blocks, block, code = [], [], None
+    for line in lines:
+        if code is not None:
+            if line.strip() == FENCE:
+                blocks.append("<pre><code>%s</code></pre>" % "\n".join(code))
+                code = None
+            else:
+                code.append(line)
+        elif line.strip().startswith(FENCE):
+            if block:
+                blocks.append(_render_block(block, depth))
+            block, code = [], []
+        elif HEADING.match(line):
+            if block:
+                blocks.append(_render_block(block, depth))
+            blocks.append(_render_heading(HEADING.match(line)))
+            block = []
+        elif line.strip():
+            block.append(line.rstrip())
+        elif block:
+            blocks.append(_render_block(block, depth))
+            block = []
+    if code is not None:
+        blocks.append("<pre><code>%s</code></pre>" % "\n".join(code))
+    if block:
+        blocks.append(_render_block(block, depth))
+    return "\n".join(blocks)
+
+
+def render_markdown(text):
+    """
+    Returns the HTML of the Markdown text.
+    """
+    return _render_blocks(escape(text).replace("\r\n", "\n").split("\n"))
@@ -0,0 +1,59 @@
+"""
+Contains tests for management commands defined in articles app.
+"""
+import datetime
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from articles.factories import ArticleFactory
+from articles.models import Article
+from articles.rendering import RENDERER_VERSION
+
+
+class RenderArticlesTestCase(TestCase):
+    """
+    Test class for render_articles command.
+    """
+
+    def test_command_renders_outdated_articles(self):
+        """
+        Tests that the command renders the articles of older renderers in
+        worker processes.
+        """
+        outdated, current = ArticleFactory(text="*a*"), ArticleFactory()
+        Article.objects.filter(pk=outdated.pk).update(html="", renderer_version=0)
+        out = StringIO()
+        call_command("render_articles", workers=2, stdout=out)
+        outdated.refresh_from_db()
+        self.assertEqual(outdated.html, "<p><em>a</em></p>")
+        self.assertEqual(outdated.renderer_version, RENDERER_VERSION)
+        self.assertIn("Rendered 1 articles.", out.getvalue())
+
+    def test_command_renders_all_articles(self):
+        """
+        Tests that the command renders every article with --all.
+        """
+        ArticleFactory.create_batch(3)
+        out = StringIO()
+        call_command("render_articles", all=True, workers=1, batch_size=2, stdout=out)
+        self.assertIn("Rendered 3 articles.", out.getvalue())
+
+
+class PublishScheduledArticlesTestCase(TestCase):
+    """
+    Test class for publish_scheduled_articles command.
+    """
+
+    def test_command_publishes_due_drafts(self):
+        """
+        Tests that the command publishes the due drafts once without interval.
+        """
+        article = ArticleFactory(
+            publish_at=timezone.now() - datetime.timedelta(minutes=1)
+        )
+        out = StringIO()
+        call_command("publish_scheduled_articles", stdout=out)
+        article.refresh_from_db()
+        self.assertTrue(article.published)
+        self.assertIn("Published 1 articles.", out.getvalue())
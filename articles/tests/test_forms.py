@@ -1,8 +1,10 @@
 """
 Tests for forms defined in articles app.
 """
+import datetime
 from faker import Faker
 from django.test import TestCase
+from django.utils import timezone
 from articles.forms import ArticleModelForm
 from articles.models import Article
 from users.factories import UserFactory
@@ -26,3 +28,39 @@ class ArticleModelFormTestCase(TestCase):
         self.assertTrue(form.is_valid())
         form.save(author=user)
         self.assertEqual(Article.objects.count(), 1)
+
+    def test_publish_at_schedules_article(self):
+        """
+        Tests that a publishing time schedules the draft.
+        """
+        form = ArticleModelForm(
+            {
+                "title": fake.text(max_nb_chars=255),
+                "text": fake.text(max_nb_chars=1500),
+                "publish_at": "2030-01-01T09:00",
+            }
+        )
+        self.assertTrue(form.is_valid())
+        article = form.save(author=UserFactory())
+        self.assertIsNone(article.published_at)
+        self.assertEqual(article.publish_at.year, 2030)
+
+    def test_publish_at_survives_edit(self):
+        """
+        Tests that the publishing time is rendered in the format of
+        datetime-local inputs and kept when the form is saved again.
+        """
+        publish_at = timezone.make_aware(datetime.datetime(2030, 1, 1, 9, 0))
+        article = Article.objects.create(
+            author=UserFactory(), title="Title", text="Text", publish_at=publish_at
+        )
+        html = str(ArticleModelForm(instance=article)["publish_at"])
+        self.assertIn('value="2030-01-01T09:00"', html)
+        form = ArticleModelForm(
+            {"title": "Title", "text": "Text", "publish_at": "2030-01-01T09:00"},
+            instance=article,
+        )
+        self.assertTrue(form.is_valid())
+        form.save()
+        article.refresh_from_db()
+        self.assertEqual(article.publish_at, publish_at)
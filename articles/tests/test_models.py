@@ -1,11 +1,18 @@
 """
 Tests for models defined in article app.
 """
+import datetime
 import uuid
+from unittest import mock
 from faker import Faker
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from articles.factories import ArticleFactory
 from articles.models import Article
+from articles.rendering import RENDERER_VERSION
+from search.models import SearchEntry
 from users.factories import UserFactory
 
 fake = Faker()
@@ -76,4 +83,103 @@ class ArticleModelTestCase(TestCase):
         article = ArticleFactory()
         self.assertFalse(article.published)
         article.publish()
-        self.assertTrue(article.published)
\ No newline at end of file
+        self.assertTrue(article.published)
+
+
+class ArticleRenderingTestCase(TestCase):
+    """
+    Test class for the rendering of Article text.
+    """
+
+    def test_save_renders_text(self):
+        """
+        Tests that saving an article renders its text.
+        """
+        article = ArticleFactory(text="Some *text*")
+        self.assertEqual(article.html, "<p>Some <em>text</em></p>")
+        self.assertEqual(article.renderer_version, RENDERER_VERSION)
+
+    def test_edit_renders_text_again(self):
+        """
+        Tests that saving an edited text renders it again.
+        """
+        article = Article.objects.get(pk=ArticleFactory().pk)
+        article.text = "New text"
+        article.save()
+        article.refresh_from_db()
+        self.assertEqual(article.html, "<p>New text</p>")
+
+    def test_unchanged_text_is_not_rendered(self):
+        """
+        Tests that saving an article with an up to date html doesn't render it.
+        """
+        article = Article.objects.get(pk=ArticleFactory().pk)
+        with mock.patch.object(Article, "render") as render:
+            article.publish()
+        render.assert_not_called()
+
+    def test_render_queryset(self):
+        """
+        Tests that querysets render the text of their articles.
+        """
+        article = ArticleFactory(text="Some text")
+        Article.objects.update(html="", renderer_version=0)
+        self.assertEqual(Article.objects.render(workers=1), 1)
+        article.refresh_from_db()
+        self.assertEqual(article.html, "<p>Some text</p>")
+        self.assertEqual(article.renderer_version, RENDERER_VERSION)
+
+
+class ScheduledPublishingTestCase(TestCase):
+    """
+    Test class for the scheduled publishing of articles.
+    """
+
+    def setUp(self):
+        self.now = timezone.now()
+        self.past = self.now - datetime.timedelta(minutes=1)
+        self.future = self.now + datetime.timedelta(minutes=1)
+
+    def test_due_returns_scheduled_drafts(self):
+        """
+        Tests that due returns the drafts scheduled by now, the earliest first.
+        """
+        later = ArticleFactory(publish_at=self.past)
+        earlier = ArticleFactory(publish_at=self.past - datetime.timedelta(hours=1))
+        ArticleFactory(publish_at=self.future)
+        ArticleFactory(publish_at=self.past, published_at=self.past)
+        ArticleFactory()
+        self.assertEqual(list(Article.objects.due(self.now)), [earlier, later])
+
+    def test_publish_due_publishes_in_batches(self):
+        """
+        Tests that due drafts are published with one UPDATE and one cache
+        invalidation per batch.
+        """
+        due = ArticleFactory.create_batch(3, publish_at=self.past)
+        scheduled = ArticleFactory(publish_at=self.future)
+        with mock.patch("articles.models.page_cache.invalidate") as invalidate:
+            with CaptureQueriesContext(connection) as queries:
+                published = Article.objects.publish_due(self.now, batch_size=2)
+        updates = [query for query in queries if query["sql"].startswith("UPDATE")]
+        self.assertEqual(published, 3)
+        self.assertEqual(len(updates), 2)
+        self.assertEqual(invalidate.call_count, 2)
+        for article in due:
+            article.refresh_from_db()
+            self.assertEqual(article.published_at, self.now)
+        scheduled.refresh_from_db()
+        self.assertIsNone(scheduled.published_at)
+
+    def test_publish_due_indexes_articles(self):
+        """
+        Tests that published articles are added to the search index.
+        """
+        article = ArticleFactory(publish_at=self.past)
+        self.assertFalse(SearchEntry.objects.filter(object_id=article.pk).exists())
+        Article.objects.publish_due(self.now)
+        self.assertTrue(
+            SearchEntry.objects.filter(
+                category="articles", object_id=article.pk
+            ).exists()
+        )
@@ -0,0 +1,117 @@
+"""
+Tests for the renderer of article texts.
+"""
+import time
+from django.test import SimpleTestCase
+from articles.rendering import MAX_QUOTE_DEPTH, render_inline, render_markdown
+
+
+class RenderMarkdownTestCase(SimpleTestCase):
+    """
+    Test class for render_markdown.
+    """
+
+    def test_paragraphs(self):
+        """
+        Tests that blank lines separate paragraphs and lines are kept.
+        """
+        self.assertEqual(
+            render_markdown("one\ntwo\n\nthree"), "<p>one<br>two</p>\n<p>three</p>"
+        )
+
+    def test_headings(self):
+        """
+        Tests that lines starting with hashes are headings.
+        """
+        self.assertEqual(
+            render_markdown("## Title\ntext"), "<h2>Title</h2>\n<p>text</p>"
+        )
+
+    def test_lists(self):
+        """
+        Tests that blocks of items are lists.
+        """
+        self.assertEqual(render_markdown("- a\n- b"), "<ul><li>a</li><li>b</li></ul>")
+        self.assertEqual(render_markdown("1. a\n2. b"), "<ol><li>a</li><li>b</li></ol>")
+
+    def test_quotes(self):
+        """
+        Tests that blocks of quoted lines are block quotes.
+        """
+        self.assertEqual(
+            render_markdown("> a\n> b"), "<blockquote><p>a<br>b</p></blockquote>"
+        )
+
+    def test_code_blocks(self):
+        """
+        Tests that fenced code is kept as is.
+        """
+        self.assertEqual(
+            render_markdown("```\n*a*\n\n  b\n```"),
+            "<pre><code>*a*\n\n  b</code></pre>",
+        )
+
+    def test_inline_markup(self):
+        """
+        Tests that emphasis, code spans and links are marked up.
+        """
+        self.assertEqual(
+            render_inline("**a** *b* `*c*` [d](https://example.com)"),
+            "<strong>a</strong> <em>b</em> <code>*c*</code> "
+            '<a href="https://example.com" rel="nofollow">d</a>',
+        )
+
+    def test_html_is_escaped(self):
+        """
+        Tests that html in the text is escaped.
+        """
+        self.assertEqual(
+            render_markdown("<script>x</script>"),
+            "<p>&lt;script&gt;x&lt;/script&gt;</p>",
+        )
+
+    def test_unsafe_links_are_not_rendered(self):
+        """
+        Tests that only http and relative links are rendered.
+        """
+        self.assertEqual(
+            render_markdown("[a](javascript:alert(1))"),
+            "<p>[a](javascript:alert(1))</p>",
+        )
+
+    def test_emphasis_does_not_reach_into_links(self):
+        """
+        Tests that emphasis markers in urls are kept while link texts are
+        still marked up.
+        """
+        self.assertEqual(
+            render_inline("[*a*](https://example.com/*b*) *c*"),
+            '<a href="https://example.com/*b*" rel="nofollow"><em>a</em></a> '
+            "<em>c</em>",
+        )
+
+    def test_nul_characters_are_dropped(self):
+        """
+        Tests that NUL characters of the text can't be taken for placeholders.
+        """
+        self.assertEqual(render_inline("\x000\x00 `a`"), "0 <code>a</code>")
+
+    def test_unclosed_markers_render_in_linear_time(self):
+        """
+        Tests that markers that are never closed don't make rendering
+        quadratic.
+        """
+        for marker in ("**a ", "*a ", "[a ", "[a](/"):
+            with self.subTest(marker=marker):
+                start = time.monotonic()
+                html = render_markdown(marker * 8000)
+                self.assertLess(time.monotonic() - start, 0.5)
+                self.assertNotIn("<em>", html)
+
+    def test_quote_depth_is_bounded(self):
+        """
+        Tests that deeply nested block quotes are rendered up to
+        MAX_QUOTE_DEPTH.
+        """
+        html = render_markdown("> " * 10000 + "a")
+        self.assertEqual(html.count("<blockquote>"), MAX_QUOTE_DEPTH)
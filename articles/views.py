@@ -5,16 +5,19 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied
 from django.shortcuts import redirect, reverse
 from django.views.generic import CreateView, DetailView, UpdateView, ListView
+from core.cache import get_version
+from core.conditional import ConditionalGetMixin
+from core.pagination import CursorPaginationMixin
 from .forms import ArticleModelForm
 from .models import Article
 
 
-class ArticleList(ListView):
+class ArticleList(CursorPaginationMixin, ListView):
     """
     View class for listing articles.
     """
 
-    queryset = Article.objects.exclude(published_at=None)
+    queryset = Article.objects.exclude(published_at=None).for_list()
     paginate_by = 10
     context_object_name = "articles"
 
@@ -47,7 +50,7 @@ class ArticleEdit(UpdateView):
     def dispatch(self, request, *args, **kwargs):
         if not request.user.is_authenticated:
             return redirect(reverse("users:login"))
-        if self.get_object().author != request.user:
+        if self.get_object().author_id != request.user.pk:
             raise PermissionDenied
         return super().dispatch(request, *args, **kwargs)
 
@@ -58,15 +61,30 @@ class ArticleEdit(UpdateView):
         return redirect(article)
 
 
-class ArticleDetail(DetailView):
+class ArticleDetail(ConditionalGetMixin, DetailView):
     """
     View class for single article.
     """
 
     queryset = Article.objects.all()
 
+    def get_validators(self):
+        row = (
+            Article.objects.filter(pk=self.kwargs["pk"])
+            .values_list("modified_at", "renderer_version", "author_id")
+            .first()
+        )
+        if row is None:
+            return None
+        modified_at, renderer_version, author_id = row
+        return modified_at, (
+            modified_at,
+            renderer_version,
+            get_version("user:%s" % author_id),
+        )
+
 
-class DraftList(LoginRequiredMixin, ListView):
+class DraftList(LoginRequiredMixin, CursorPaginationMixin, ListView):
     """
     View class for logged-in user's drafts.
     """
@@ -75,6 +93,8 @@ class DraftList(LoginRequiredMixin, ListView):
     context_object_name = "articles"
 
     def get_queryset(self):
-        return Article.objects.filter(author=self.request.user).filter(
-            published_at=None
+        return (
+            Article.objects.filter(author=self.request.user)
+            .filter(published_at=None)
+            .for_list()
         )
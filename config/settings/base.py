@@ -43,16 +43,21 @@ INSTALLED_APPS = [
     "feeds.apps.FeedsConfig",
     "polls.apps.PollsConfig",
     "questions.apps.QuestionsConfig",
+    "search.apps.SearchConfig",
     "users.apps.UsersConfig",
 ]
 
 MIDDLEWARE = [
+    "core.middleware.ViewMetricsMiddleware",
+    "core.middleware.SlowQueryLogMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.ReplicaStickinessMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "users.middleware.CachedAuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "core.middleware.PageCacheMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
@@ -77,6 +82,101 @@ TEMPLATES = [
 WSGI_APPLICATION = "config.wsgi.application"
 
 
+# Database replicas
+
+DATABASE_ROUTERS = ["core.routers.ReplicaRouter"]
+
+# Aliases of the DATABASES entries reads are spread over, none by default.
+DATABASE_REPLICAS = []
+
+# Seconds the reads of a client stick to the primary database after it wrote.
+DATABASE_REPLICA_STICKINESS = env.int("DATABASE_REPLICA_STICKINESS", 5)
+
+
+# Cache
+# Any url supported by django-environ, e.g. pymemcache://127.0.0.1:11211 or
+# dbcache://cache_table, can be used to share the caches between processes.
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+    "template_fragments": env.cache(
+        "FRAGMENT_CACHE_URL", default="locmemcache://template_fragments"
+    ),
+    "pages": env.cache("PAGE_CACHE_URL", default="locmemcache://pages"),
+}
+
+# Fragments and the ETags of detail pages vary on versions of the objects they
+# show, e.g. their authors, which are bumped in the fragment cache when those
+# change. In production FRAGMENT_CACHE_URL must name a cache shared by the
+# processes, with a local memory cache a process doesn't see the versions
+# bumped by the others, so fragments are only cached and ETags only kept for
+# FRAGMENT_CACHE_LOCAL_TIMEOUT seconds.
+SHARED_FRAGMENT_CACHE = (
+    CACHES["template_fragments"]["BACKEND"]
+    != "django.core.cache.backends.locmem.LocMemCache"
+)
+FRAGMENT_CACHE_LOCAL_TIMEOUT = env.int("FRAGMENT_CACHE_LOCAL_TIMEOUT", 60)
+
+# Page cache
+# Pages under the prefixes of PAGE_CACHE_SECTIONS are cached for anonymous
+# users and invalidated when instances of the listed models are saved or
+# deleted. Pages are fresh for PAGE_CACHE_TIMEOUT seconds, 0 disables the
+# cache, then served stale for up to PAGE_CACHE_STALE seconds while one
+# request regenerates them. The generations of the sections are kept in the
+# page cache, so with a local memory cache writes only invalidate the pages of
+# their process and PAGE_CACHE_URL should name a shared cache in production.
+
+PAGE_CACHE_TIMEOUT = env.int("PAGE_CACHE_TIMEOUT", 30)
+PAGE_CACHE_STALE = env.int("PAGE_CACHE_STALE", 300)
+PAGE_CACHE_SECTIONS = {
+    "/articles/": ["articles.Article"],
+    "/feeds/": ["feeds.Feed"],
+    "/questions/": ["questions.Question", "questions.Answer"],
+}
+
+# Metrics
+# Views are measured over the last METRICS_WINDOWS windows of
+# METRICS_WINDOW_SECONDS seconds.
+
+METRICS_WINDOW_SECONDS = env.int("METRICS_WINDOW_SECONDS", 60)
+METRICS_WINDOWS = env.int("METRICS_WINDOWS", 10)
+
+# Bearer token letting Prometheus scrape the metrics, disabled when empty.
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+
+# Slow query log
+# Queries slower than SLOW_QUERY_THRESHOLD_MS milliseconds are logged with
+# their plans, 0 disables the log. The plans of SLOW_QUERY_ANALYZE_RATE of the
+# requests are captured with EXPLAIN ANALYZE, which runs the query again.
+
+SLOW_QUERY_THRESHOLD_MS = env.int("SLOW_QUERY_THRESHOLD_MS", 0)
+SLOW_QUERY_ANALYZE_RATE = env.float("SLOW_QUERY_ANALYZE_RATE", 0.0)
+SLOW_QUERY_LOG_FILE = env(
+    "SLOW_QUERY_LOG_FILE", default=str(BASE_DIR / "slow_queries.log")
+)
+
+if SLOW_QUERY_THRESHOLD_MS:
+    LOGGING = {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "handlers": {
+            "slow_queries": {
+                "class": "logging.handlers.RotatingFileHandler",
+                "filename": SLOW_QUERY_LOG_FILE,
+                "maxBytes": 10 * 1024 * 1024,
+                "backupCount": 5,
+                "delay": True,
+            },
+        },
+        "loggers": {
+            "core.slow_queries": {
+                "handlers": ["slow_queries"],
+                "level": "WARNING",
+                "propagate": False,
+            },
+        },
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/3.1/ref/settings/#auth-password-validators
 
@@ -124,3 +224,59 @@ LOGIN_URL = "/users/login/"
 
 LOGIN_REDIRECT_URL = "/"
 LOGOUT_REDIRECT_URL = "/"
+
+# Sessions are read from the cache and written through to the database, and
+# the users of sessions are cached for USER_CACHE_TIMEOUT seconds, so
+# authenticated requests usually don't query the database before the view.
+# Both need a default cache shared by the processes, with a local memory cache
+# ended sessions and changed users would live on in the other processes, so
+# sessions are read from the database and users aren't cached.
+SHARED_CACHE = (
+    CACHES["default"]["BACKEND"] != "django.core.cache.backends.locmem.LocMemCache"
+)
+SESSION_ENGINE = (
+    "django.contrib.sessions.backends.cached_db"
+    if SHARED_CACHE
+    else "django.contrib.sessions.backends.db"
+)
+AUTHENTICATION_BACKENDS = ["users.backends.HashingModelBackend"]
+USER_CACHE_TIMEOUT = env.int("USER_CACHE_TIMEOUT", 60) if SHARED_CACHE else 0
+
+# Password hashes are computed by PASSWORD_HASHING_WORKERS threads, at most
+# PASSWORD_HASHING_QUEUE more logins and signups wait for one and the others
+# are answered with 429 responses.
+PASSWORD_HASHING_WORKERS = env.int("PASSWORD_HASHING_WORKERS", 2)
+PASSWORD_HASHING_QUEUE = env.int("PASSWORD_HASHING_QUEUE", 8)
+
+# Login attempts are throttled with token buckets per email and per client
+# address refilled with one attempt every LOGIN_THROTTLE_REFILL_SECONDS
+# seconds, a burst of 0 disables the bucket. Buckets are kept in memory unless
+# LOGIN_THROTTLE_CACHE names a cache shared by the processes.
+# LOGIN_THROTTLE_PROXIES is the number of reverse proxies in front of the
+# server, the client address is then read from X-Forwarded-For instead of
+# REMOTE_ADDR. It must not exceed the number of trusted proxies appending to
+# the header, or clients could pick their address.
+LOGIN_THROTTLE_EMAIL_BURST = env.int("LOGIN_THROTTLE_EMAIL_BURST", 5)
+LOGIN_THROTTLE_IP_BURST = env.int("LOGIN_THROTTLE_IP_BURST", 20)
+LOGIN_THROTTLE_REFILL_SECONDS = env.int("LOGIN_THROTTLE_REFILL_SECONDS", 12)
+LOGIN_THROTTLE_CACHE = env("LOGIN_THROTTLE_CACHE", default="")
+LOGIN_THROTTLE_PROXIES = env.int("LOGIN_THROTTLE_PROXIES", 0)
+
+
+# Feeds
+
+# Authors with more followers than this are not fanned out on write, their
+# feeds are pulled into the followers' timelines at read time.
+FEEDS_FANOUT_LIMIT = env.int("FEEDS_FANOUT_LIMIT", 10000)
+
+# Number of recent feeds copied into a timeline when a user follows an author.
+FEEDS_TIMELINE_BACKFILL = env.int("FEEDS_TIMELINE_BACKFILL", 50)
+
+
+# Polls
+
+# Number of counter rows votes of a choice are spread over, 0 disables sharding.
+POLLS_VOTE_SHARDS = env.int("POLLS_VOTE_SHARDS", 0)
+
+# Seconds the summed shard counts of a poll may be stale for.
+POLLS_VOTE_STALENESS = env.int("POLLS_VOTE_STALENESS", 5)
@@ -21,3 +21,15 @@ DATABASES = {
         "PORT": env("DB_PORT"),
     }
 }
+
+# Read replicas with the same credentials as the primary,
+# e.g. DB_REPLICA_HOSTS=replica1.local,replica2.local
+
+for number, host in enumerate(env.list("DB_REPLICA_HOSTS", default=[]), start=1):
+    DATABASES["replica%d" % number] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
@@ -13,3 +13,25 @@ DATABASES = {
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
 ]
+
+# Query budgets
+QUERY_BUDGET_SEED_SIZE = env.int("QUERY_BUDGET_SEED_SIZE", 20)
+QUERY_BUDGET_MAX_TIME = env.float("QUERY_BUDGET_MAX_TIME", 0.5)
+
+# Sessions and users
+# Cached in the local memory cache since the tests run in one process.
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+USER_CACHE_TIMEOUT = 60
+
+# Fragment cache
+# Versions are seen by every test since the tests run in one process.
+SHARED_FRAGMENT_CACHE = True
+
+# Page cache
+# Disabled since cached pages would outlive the rolled back test data.
+PAGE_CACHE_TIMEOUT = 0
+
+# Login throttling
+# Disabled since the in-memory buckets would outlive the tests.
+LOGIN_THROTTLE_EMAIL_BURST = 0
+LOGIN_THROTTLE_IP_BURST = 0
@@ -22,6 +22,7 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("articles/", include("articles.urls")),
     path("feeds/", include("feeds.urls")),
+    path("metrics/", include("core.urls")),
     path("polls/", include("polls.urls")),
     path("questions/", include("questions.urls")),
     path("search/", include("search.urls")),
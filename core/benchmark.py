@@ -0,0 +1,85 @@
+"""
+Contains the benchmark of the read views run by the benchmark command.
+"""
+import statistics
+import time
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+
+def benchmark_urls(user):
+    """
+    Returns the label and the url of every read view, pointing at the latest
+    objects of the database and at the profile of user.
+    """
+    from articles.models import Article
+    from feeds.models import Feed
+    from polls.models import Question as Poll
+    from questions.models import Question
+
+    urls = [
+        ("feeds:home", reverse("feeds:home")),
+        ("articles:home", reverse("articles:home")),
+        ("questions:home", reverse("questions:home")),
+        ("polls:home", reverse("polls:home")),
+        ("users:network users", reverse("users:network", args=["users"])),
+        ("search:home all", reverse("search:home", args=["all"]) + "?q=the"),
+    ]
+    if user is not None:
+        urls += [
+            ("feeds:following", reverse("feeds:following")),
+            ("articles:drafts", reverse("articles:drafts")),
+            ("users:network followers", reverse("users:network", args=["followers"])),
+        ]
+        urls += [
+            (
+                "users:profile %s" % category,
+                reverse("users:profile", args=[user.pk, category]),
+            )
+            for category in ("feeds", "articles", "questions", "answers", "polls")
+        ]
+    objects = [
+        ("feeds:thread", Feed.objects.filter(parent=None)),
+        ("articles:detail", Article.objects.exclude(published_at=None)),
+        ("questions:detail", Question.objects.all()),
+        ("polls:detail", Poll.objects.all()),
+    ]
+    for name, queryset in objects:
+        obj = queryset.order_by("-created_at", "-pk").first()
+        if obj is not None:
+            urls.append((name, reverse(name, args=[obj.pk])))
+    return urls
+
+
+def run_benchmark(client, urls, requests=50, warmup=5):
+    """
+    Requests each url warmup times then requests times with client, and
+    returns the status, latency percentiles in milliseconds and mean number of
+    queries of each url.
+    """
+    results = []
+    for label, url in urls:
+        for _ in range(warmup):
+            client.get(url)
+        latencies, queries = [], []
+        for _ in range(requests):
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                response = client.get(url)
+                latencies.append((time.perf_counter() - started) * 1000)
+            queries.append(len(context))
+        percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        results.append(
+            {
+                "view": label,
+                "url": url,
+                "status": response.status_code,
+                "requests": requests,
+                "p50": percentiles[49],
+                "p95": percentiles[94],
+                "p99": percentiles[98],
+                "queries": statistics.mean(queries),
+            }
+        )
+    return results
@@ -0,0 +1,67 @@
+"""
+Contains helpers for caching rendered template fragments.
+"""
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+
+
+def fragment_cache():
+    """
+    Returns the cache template fragments are stored in.
+    """
+    try:
+        return caches["template_fragments"]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+def get_version(key, cache=None):
+    """
+    Returns the version of key kept in cache, the fragment cache by default,
+    fragments varying on it are invalidated when it's bumped.
+    """
+    cache = fragment_cache() if cache is None else cache
+    return cache.get("version:%s" % key, 0)
+
+
+def get_versions(keys):
+    """
+    Returns the versions of keys with one cache lookup.
+    """
+    versions = fragment_cache().get_many(["version:%s" % key for key in keys])
+    return [versions.get("version:%s" % key, 0) for key in keys]
+
+
+def bump_version(key, cache=None):
+    """
+    Increments the version of key kept in cache, the fragment cache by default.
+    """
+    cache = fragment_cache() if cache is None else cache
+    try:
+        cache.incr("version:%s" % key)
+    except ValueError:
+        cache.set("version:%s" % key, 1, None)
+
+
+def fragment_timeout(timeout):
+    """
+    Returns timeout, capped at FRAGMENT_CACHE_LOCAL_TIMEOUT seconds unless the
+    fragment cache is shared, since versions bumped by the other processes
+    aren't seen.
+    """
+    if settings.SHARED_FRAGMENT_CACHE:
+        return timeout
+    return min(timeout, settings.FRAGMENT_CACHE_LOCAL_TIMEOUT)
+
+
+def local_window():
+    """
+    Returns the number of the current window of FRAGMENT_CACHE_LOCAL_TIMEOUT
+    seconds for values varying on versions, or None if the fragment cache is
+    shared.
+    """
+    if settings.SHARED_FRAGMENT_CACHE:
+        return None
+    return int(time.time() // settings.FRAGMENT_CACHE_LOCAL_TIMEOUT)
@@ -0,0 +1,77 @@
+"""
+Contains conditional GET support for detail views.
+
+The validators of a page are computed with one query not loading the object,
+so unchanged pages are answered with 304 responses before the object is
+fetched or the template rendered.
+"""
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.crypto import md5
+from django.views.decorators.http import condition
+from core.cache import get_version, local_window
+
+
+class ConditionalGetMixin:
+    """
+    Mixin for DetailView subclasses sending ETag and Last-Modified headers and
+    answering conditional requests for unchanged pages with 304 responses.
+
+    Pages showing the requesting user, the ETag varies on the user and their
+    name, and Last-Modified is only sent to anonymous users.
+
+    Pages rendering a form set csrf_form, their ETag then varies on the CSRF
+    cookie so that pages holding a rotated token aren't reused, and they're
+    always rendered for clients without the cookie so that it gets set.
+
+    Unless the fragment cache is shared, the ETag also varies on the current
+    window of FRAGMENT_CACHE_LOCAL_TIMEOUT seconds and Last-Modified isn't
+    sent.
+    """
+
+    csrf_form = False
+
+    def get_validators(self):
+        """
+        Returns the last modification time of the page and the values its ETag
+        is computed from, or None if the object doesn't exist or the page
+        can't be validated.
+        """
+        raise NotImplementedError
+
+    def _get_validators(self):
+        if not hasattr(self, "_validators"):
+            self._validators = (None, None)
+            validators = self.get_validators()
+            if validators is not None:
+                last_modified, values = validators
+                user = getattr(self.request, "user", None)
+                if user is not None and user.is_authenticated:
+                    last_modified = None
+                    values += (user.pk, get_version("user:%s" % user.pk))
+                window = local_window()
+                if window is not None:
+                    # Versions bumped by other processes aren't seen, so the
+                    # ETag only holds for the current window.
+                    last_modified = None
+                    values += (window,)
+                if self.csrf_form:
+                    token = self.request.COOKIES.get(settings.CSRF_COOKIE_NAME)
+                    if token is None:
+                        return self._validators
+                    last_modified = None
+                    values += (token,)
+                etag = md5(repr(values).encode(), usedforsecurity=False).hexdigest()
+                self._validators = (last_modified, etag)
+        return self._validators
+
+    def dispatch(self, request, *args, **kwargs):
+        view = condition(
+            etag_func=lambda request, *args, **kwargs: self._get_validators()[1],
+            last_modified_func=lambda request, *args, **kwargs: (
+                self._get_validators()[0]
+            ),
+        )(super().dispatch)
+        response = view(request, *args, **kwargs)
+        patch_vary_headers(response, ("Cookie",))
+        return response
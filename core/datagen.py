@@ -0,0 +1,426 @@
+"""
+Contains the generator of large, reproducible datasets for benchmarks.
+
+Rows are inserted in batches with bulk_create, or with COPY on PostgreSQL.
+Activity follows a power law: a few users attract most of the followers and
+write most of the content, like on real social sites.
+"""
+import datetime
+import io
+import random
+from collections import defaultdict
+from contextlib import contextmanager
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import connections, router, transaction
+from django.utils import timezone
+from faker import Faker
+from core.models import excerpt, uuid7
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """
+    Lets the created_at and modified_at values of instances of models be saved
+    as set instead of being replaced by the current time.
+    """
+    fields = [
+        field
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    flags = [(field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, (auto_now, auto_now_add) in zip(fields, flags):
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_fields(model):
+    """
+    Returns the fields of model written by COPY, leaving out the ones whose
+    values are generated by the database, like auto-created primary keys.
+    """
+    return [field for field in model._meta.concrete_fields if not field.db_returning]
+
+
+def copy_payload(model, objs, connection):
+    """
+    Returns the COPY statement inserting objs and its tab separated data.
+    """
+    fields = copy_fields(model)
+    data = io.StringIO()
+    for obj in objs:
+        for field in fields:
+            if getattr(field, "auto_now", False) or getattr(
+                field, "auto_now_add", False
+            ):
+                field.pre_save(obj, add=True)
+        data.write(
+            "\t".join(
+                _copy_value(
+                    field.get_db_prep_save(getattr(obj, field.attname), connection)
+                )
+                for field in fields
+            )
+            + "\n"
+        )
+    data.seek(0)
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    sql = "COPY %s (%s) FROM STDIN" % (
+        connection.ops.quote_name(model._meta.db_table),
+        columns,
+    )
+    return sql, data
+
+
+def insert(model, objs, batch_size=5000):
+    """
+    Inserts objs with COPY on PostgreSQL and bulk_create elsewhere.
+    """
+    connection = connections[router.db_for_write(model)]
+    if connection.vendor != "postgresql":
+        model.objects.bulk_create(objs, batch_size=batch_size)
+        return
+    sql, data = copy_payload(model, objs, connection)
+    with connection.cursor() as cursor:
+        if hasattr(cursor.cursor, "copy_expert"):
+            cursor.cursor.copy_expert(sql, data)
+        else:
+            with cursor.cursor.copy(sql) as copy:
+                copy.write(data.getvalue())
+
+
+class DataGenerator:
+    """
+    Generates users, followerships and content with a seeded random generator,
+    so the same arguments produce the same dataset shape and text.
+    """
+
+    def __init__(self, seed=0, alpha=1.2, days=365, batch_size=5000, now=None):
+        self.random = random.Random(seed)
+        self.faker = Faker()
+        self.faker.seed_instance(seed)
+        self.alpha = alpha
+        self.batch_size = batch_size
+        self.now = now or timezone.now()
+        self.start = self.now - datetime.timedelta(days=days)
+        self.users = []
+        self.weights = []
+        self.followers = defaultdict(list)
+
+    def timestamp(self, after=None):
+        """
+        Returns a random time between after, or the start, and now.
+        """
+        after = after or self.start
+        return after + (self.now - after) * self.random.random()
+
+    def uuid(self, timestamp):
+        """
+        Returns a version 7 UUID for a row created at timestamp, its random
+        bits drawn from the seeded generator.
+        """
+        return uuid7(int(timestamp.timestamp() * 1000), self.random.getrandbits(80))
+
+    def author(self):
+        """
+        Returns the id of a user picked with a power law.
+        """
+        return self.random.choices(self.users, cum_weights=self.weights)[0]
+
+    def _set_users(self, users):
+        self.users = [user.pk for user in users]
+        self.weights, total = [], 0.0
+        for rank in range(1, len(self.users) + 1):
+            total += rank**-self.alpha
+            self.weights.append(total)
+
+    def batches(self, count):
+        """
+        Yields the sizes of the batches count rows are inserted in.
+        """
+        for offset in range(0, count, self.batch_size):
+            yield min(self.batch_size, count - offset)
+
+    def generate_users(self, count):
+        from users.models import User
+
+        password = make_password("password")
+        users = []
+        for size in self.batches(count):
+            batch = []
+            for number in range(size):
+                date_joined = self.timestamp()
+                batch.append(
+                    User(
+                        id=self.uuid(date_joined),
+                        email="user%d@example.com" % (len(users) + number),
+                        name=self.faker.name(),
+                        password=password,
+                        date_joined=date_joined,
+                    )
+                )
+            insert(User, batch, self.batch_size)
+            users.extend(batch)
+        self._set_users(users)
+        return len(users)
+
+    def generate_follows(self, per_user):
+        """
+        Makes each user follow per_user users on average, picked with a power
+        law so the follower counts are power law distributed.
+        """
+        from users.models import Followership
+
+        created, batch = 0, []
+        for follower in self.users:
+            count = int(self.random.expovariate(1 / per_user)) if per_user else 0
+            followees = set()
+            while len(followees) < min(count, len(self.users) - 1):
+                followee = self.author()
+                if followee != follower:
+                    followees.add(followee)
+            for followee in followees:
+                self.followers[followee].append(follower)
+            batch.extend(
+                Followership(
+                    follower_id=follower,
+                    followee_id=followee,
+                    start_date=self.timestamp(),
+                )
+                for followee in followees
+            )
+            if len(batch) >= self.batch_size:
+                created += self._insert_timestamped(Followership, batch)
+                batch = []
+        return created + self._insert_timestamped(Followership, batch)
+
+    def _insert_timestamped(self, model, objs):
+        with explicit_timestamps(model):
+            insert(model, objs, self.batch_size)
+        return len(objs)
+
+    def fan_out(self, feed):
+        """
+        Returns the timeline entries of feed like Feed.fan_out, marking it
+        fanned out, or pulled if its author has more than FEEDS_FANOUT_LIMIT
+        followers.
+        """
+        from feeds.models import TimelineEntry
+
+        owners = self.followers[feed.author_id]
+        if len(owners) > settings.FEEDS_FANOUT_LIMIT:
+            feed.pulled = True
+            return []
+        feed.fanned_out = True
+        return [
+            TimelineEntry(owner_id=owner, feed_id=feed.pk, created_at=feed.created_at)
+            for owner in owners + [feed.author_id]
+        ]
+
+    def generate_feeds(self, count, reply_ratio=0.3):
+        """
+        Creates feeds, reply_ratio of them being replies to earlier feeds, and
+        fans them out to the timelines of the followers of their authors.
+        """
+        from feeds.models import Feed, TimelineEntry
+
+        threads, entries, fanned_out = [], [], 0
+        for size in self.batches(count):
+            batch = []
+            for _ in range(size):
+                feed = Feed(
+                    text=self.faker.text(max_nb_chars=280),
+                    author_id=self.author(),
+                )
+                if threads and self.random.random() < reply_ratio:
+                    parent_id, thread_id, depth, parent_created_at = self.random.choice(
+                        threads
+                    )
+                    feed.parent_id, feed.thread_id = parent_id, thread_id
+                    feed.depth = depth + 1
+                    feed.created_at = self.timestamp(parent_created_at)
+                    feed.id = self.uuid(feed.created_at)
+                else:
+                    feed.created_at = self.timestamp()
+                    feed.id = feed.thread_id = self.uuid(feed.created_at)
+                feed.modified_at = feed.created_at
+                entries.extend(self.fan_out(feed))
+                batch.append(feed)
+            self._insert_timestamped(Feed, batch)
+            threads.extend(
+                (feed.pk, feed.thread_id, feed.depth, feed.created_at) for feed in batch
+            )
+            # Entries are inserted once their feeds are.
+            if len(entries) >= self.batch_size:
+                insert(TimelineEntry, entries, self.batch_size)
+                fanned_out, entries = fanned_out + len(entries), []
+        insert(TimelineEntry, entries, self.batch_size)
+        return len(threads), fanned_out + len(entries)
+
+    def generate_articles(self, count, draft_ratio=0.1):
+        from articles.models import Article
+
+        created = 0
+        for size in self.batches(count):
+            batch = []
+            for _ in range(size):
+                created_at = self.timestamp()
+                draft = self.random.random() < draft_ratio
+                article = Article(
+                    id=self.uuid(created_at),
+                    title=self.faker.sentence(),
+                    text="\n\n".join(self.faker.paragraphs(nb=5)),
+                    author_id=self.author(),
+                    published_at=None if draft else created_at,
+                    created_at=created_at,
+                    modified_at=created_at,
+                )
+                article.render()
+                article.excerpt = excerpt(article.text)
+                batch.append(article)
+            created += self._insert_timestamped(Article, batch)
+        return created
+
+    def generate_questions(self, count, answers):
+        """
+        Creates questions and answers spread over the questions.
+        """
+        from questions.models import Answer, Question
+
+        questions = []
+        for size in self.batches(count):
+            batch = []
+            for _ in range(size):
+                created_at = self.timestamp()
+                description = self.faker.paragraph()
+                batch.append(
+                    Question(
+                        id=self.uuid(created_at),
+                        title=self.faker.sentence().rstrip(".") + "?",
+                        description=description,
+                        excerpt=excerpt(description),
+                        author_id=self.author(),
+                        created_at=created_at,
+                        modified_at=created_at,
+                    )
+                )
+            self._insert_timestamped(Question, batch)
+            questions.extend((question.pk, question.created_at) for question in batch)
+        created = 0
+        for size in self.batches(answers if questions else 0):
+            batch = []
+            for _ in range(size):
+                question_id, question_created_at = self.random.choice(questions)
+                created_at = self.timestamp(question_created_at)
+                text = self.faker.paragraph()
+                batch.append(
+                    Answer(
+                        id=self.uuid(created_at),
+                        text=text,
+                        excerpt=excerpt(text),
+                        question_id=question_id,
+                        author_id=self.author(),
+                        created_at=created_at,
+                        modified_at=created_at,
+                    )
+                )
+            created += self._insert_timestamped(Answer, batch)
+        return len(questions), created
+
+    def generate_polls(self, count, votes, choices=4):
+        """
+        Creates polls with their choices and votes, each user voting at most
+        once per poll.
+        """
+        from polls.models import Choice, Question as Poll
+
+        polls = []
+        for size in self.batches(count):
+            batch, batch_choices = [], []
+            for _ in range(size):
+                created_at = self.timestamp()
+                poll = Poll(
+                    id=self.uuid(created_at),
+                    question_text=self.faker.sentence().rstrip(".") + "?",
+                    author_id=self.author(),
+                    created_at=created_at,
+                    modified_at=created_at,
+                )
+                poll_choices = [
+                    Choice(
+                        id=self.uuid(created_at),
+                        question_id=poll.pk,
+                        choice_text=self.faker.sentence(nb_words=3),
+                        created_at=created_at,
+                        modified_at=created_at,
+                    )
+                    for _ in range(choices)
+                ]
+                batch.append(poll)
+                batch_choices.extend(poll_choices)
+                polls.append((poll.pk, [choice.pk for choice in poll_choices]))
+            self._insert_timestamped(Poll, batch)
+            self._insert_timestamped(Choice, batch_choices)
+        voted, counts = set(), {}
+        for size in self.batches(votes if polls else 0):
+            batch = []
+            for _ in range(size):
+                poll_id, choice_ids = self.random.choice(polls)
+                user_id = self.author()
+                if (poll_id, user_id) in voted:
+                    continue
+                voted.add((poll_id, user_id))
+                batch.append(Poll.voters.through(question_id=poll_id, user_id=user_id))
+                choice_id = self.random.choice(choice_ids)
+                counts[choice_id] = counts.get(choice_id, 0) + 1
+            insert(Poll.voters.through, batch, self.batch_size)
+        Choice.objects.bulk_update(
+            [Choice(id=choice_id, votes=votes) for choice_id, votes in counts.items()],
+            ["votes"],
+            batch_size=self.batch_size,
+        )
+        return len(polls), len(voted)
+
+    def generate(
+        self, users, follows, feeds, articles, questions, answers, polls, votes
+    ):
+        """
+        Generates the whole dataset and rebuilds the derived tables, returning
+        the number of rows created per model.
+        """
+        from search.models import SearchEntry
+        from users.models import UserStats
+
+        counts = {}
+        with transaction.atomic():
+            counts["users"] = self.generate_users(users)
+            counts["followerships"] = self.generate_follows(follows)
+            counts["feeds"], counts["timeline_entries"] = self.generate_feeds(feeds)
+            counts["articles"] = self.generate_articles(articles)
+            counts["questions"], counts["answers"] = self.generate_questions(
+                questions, answers
+            )
+            counts["polls"], counts["votes"] = self.generate_polls(polls, votes)
+        UserStats.objects.rebuild(batch_size=self.batch_size)
+        SearchEntry.objects.rebuild(batch_size=self.batch_size)
+        return counts
@@ -0,0 +1,299 @@
+"""
+Contains the checks of the indexes serving the queries issued by the views.
+
+A query is served by an index when the index starts with the columns the query
+compares for equality, continues with the columns the query is ordered by, and
+has a condition, if any, implied by the filters of the query. Columns fixed
+by the condition needn't be indexed.
+
+The querysets of the paginated list views are built by calling the views and
+their paginators, so the checked queries are the ones the views issue.
+"""
+import itertools
+import uuid
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.db.models.sql.query import Query
+from django.db.models.sql.where import AND, WhereNode
+from django.http import HttpRequest
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.urls.converters import UUIDConverter
+from core.pagination import CursorPaginationMixin
+
+PLACEHOLDER = uuid.UUID(int=0)
+
+# Values of the string arguments of the list views, a shape is built for each.
+# Patterns with other string arguments are skipped.
+VIEW_ARGUMENTS = {
+    "users:profile": {
+        "category": ["feeds", "articles", "questions", "answers", "polls"]
+    },
+    "users:network": {"filter": ["followers", "followees", "users"]},
+}
+
+
+def list_views(patterns=None, namespace=None):
+    """
+    Yields the url name, the url arguments and the view class of each
+    paginated list view, with placeholder arguments.
+    """
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace != "admin":
+                yield from list_views(pattern.url_patterns, pattern.namespace)
+            continue
+        view_class = getattr(pattern.callback, "view_class", None)
+        if not isinstance(pattern, URLPattern) or not (
+            view_class and issubclass(view_class, CursorPaginationMixin)
+        ):
+            continue
+        name = "%s:%s" % (namespace, pattern.name) if namespace else pattern.name
+        values = {}
+        for argument, converter in pattern.pattern.converters.items():
+            if isinstance(converter, UUIDConverter):
+                values[argument] = [PLACEHOLDER]
+            else:
+                values[argument] = VIEW_ARGUMENTS.get(name, {}).get(argument)
+        if None in values.values():
+            continue
+        for combination in itertools.product(*values.values()):
+            yield name, dict(zip(values, combination)), view_class
+
+
+def view_querysets(name, kwargs, view_class):
+    """
+    Returns the querysets a list view reads its pages from for a placeholder
+    user, as returned by its get_queryset and ordered by its paginator.
+    """
+    request = HttpRequest()
+    request.method = "GET"
+    request.path = reverse(name, kwargs=kwargs)
+    request.user = get_user_model()(pk=PLACEHOLDER)
+    view = view_class()
+    view.setup(request, **kwargs)
+    queryset = view.get_queryset()
+    paginator = view.get_cursor_paginator(queryset, view.get_paginate_by(queryset))
+    # Ranked search results are read by offset and have no ordering to index.
+    return paginator.querysets() if hasattr(paginator, "querysets") else []
+
+
+def _lookups(node):
+    """
+    Yields the lookups of node and its children.
+    """
+    for child in node.children:
+        if isinstance(child, WhereNode):
+            yield from _lookups(child)
+        else:
+            yield child
+
+
+def subquery_shapes(queryset):
+    """
+    Returns querysets of the models the subqueries of queryset filter on, with
+    the filters of the subqueries, e.g. the followerships of
+    Feed.objects.pulled.
+    """
+    shapes = []
+    for lookup in _lookups(queryset.query.where):
+        if not isinstance(lookup.rhs, Query):
+            continue
+        models = {child.lhs.target.model for child in _lookups(lookup.rhs.where)}
+        if len(models) == 1:
+            shape = models.pop()._default_manager.all()
+            shape.query.where = lookup.rhs.where
+            shape.query.clear_ordering(force=True, clear_default=True)
+            shapes.append(shape)
+            shapes.extend(subquery_shapes(shape))
+    return shapes
+
+
+def query_shapes():
+    """
+    Returns the labels and the querysets the views and commands issue, with
+    placeholder values and the ordering used for pagination.
+
+    The querysets of the list views are built by the views themselves, the
+    ones of the other views and commands are listed here.
+    """
+    from articles.models import Article
+    from feeds.models import Feed
+    from questions.models import Question
+
+    shapes = [
+        ("feeds:thread", Feed.objects.thread(Feed(pk=PLACEHOLDER))),
+        ("questions:detail", Question(pk=PLACEHOLDER).answers.for_list()),
+        ("publish_scheduled_articles", Article.objects.due()),
+    ]
+    for name, kwargs, view_class in list_views():
+        label = " ".join(
+            [name]
+            + ["%s=%s" % item for item in kwargs.items() if item[1] != PLACEHOLDER]
+        )
+        for queryset in view_querysets(name, kwargs, view_class):
+            shapes.append(("%s %s" % (label, queryset.model._meta.label), queryset))
+            shapes.extend(
+                ("%s %s" % (label, subquery.model._meta.label), subquery)
+                for subquery in subquery_shapes(queryset)
+            )
+    return shapes
+
+
+def _conditions(node, negated=False):
+    """
+    Returns the values of the columns compared for equality, the nullness of
+    the columns and the columns compared to several values required by the
+    AND-ed lookups of node.
+
+    Lookups OR-ed on a single column, like author=user OR author IN (...),
+    compare it to several values.
+    """
+    equal, isnull, among = {}, {}, set()
+    negated ^= node.negated
+    if node.connector != AND and len(node.children) > 1:
+        if not negated and all(
+            not isinstance(child, WhereNode) and child.lookup_name in ("exact", "in")
+            for child in node.children
+        ):
+            columns = {child.lhs.target.column for child in node.children}
+            if len(columns) == 1:
+                among |= columns
+        return equal, isnull, among
+    for child in node.children:
+        if isinstance(child, WhereNode):
+            child_equal, child_isnull, child_among = _conditions(child, negated)
+            equal.update(child_equal)
+            isnull.update(child_isnull)
+            among |= child_among
+        elif child.lookup_name == "isnull":
+            isnull[child.lhs.target.column] = bool(child.rhs) != negated
+        elif child.lookup_name == "exact" and not negated:
+            equal[child.lhs.target.column] = child.rhs
+        elif child.lookup_name == "in" and not negated:
+            among.add(child.lhs.target.column)
+    return equal, isnull, among
+
+
+def _column(model, name):
+    """
+    Returns the column of field name of model, prefixed with "-" if descending.
+    """
+    descending = name.startswith("-")
+    name = name.lstrip("-")
+    field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+    return ("-" if descending else "") + field.column
+
+
+def _index_condition(model, condition):
+    """
+    Returns the lookups and values of the columns required by the condition of
+    a partial index, or None if the condition isn't made of exact and isnull
+    lookups.
+    """
+    required = {}
+    for child in condition.children:
+        if isinstance(child, Q):
+            return None
+        name, value = child
+        lookup = "exact"
+        if name.endswith("__isnull"):
+            name, lookup, value = name[: -len("__isnull")], "isnull", bool(value)
+        elif "__" in name:
+            return None
+        required[_column(model, name)] = (lookup, value)
+    if condition.negated:
+        if len(required) != 1 or lookup != "isnull":
+            return None
+        required = {column: ("isnull", not value) for column in required}
+    return required
+
+
+def model_indexes(model):
+    """
+    Returns the columns and the condition of each index of model, including the
+    indexes created for the primary key, foreign keys and unique constraints.
+    """
+    meta = model._meta
+    indexes = []
+    for index in meta.indexes:
+        condition = {}
+        if index.condition is not None:
+            condition = _index_condition(model, index.condition)
+            if condition is None:
+                continue
+        columns = [_column(model, name) for name in index.fields]
+        indexes.append((columns, condition))
+    for field in meta.local_fields:
+        if field.primary_key or field.unique or field.db_index:
+            indexes.append(([field.column], {}))
+    for constraint in meta.constraints:
+        if getattr(constraint, "fields", None) and constraint.condition is None:
+            columns = [_column(model, name) for name in constraint.fields]
+            indexes.append((columns, {}))
+    return indexes
+
+
+def is_served(queryset, columns, condition):
+    """
+    Returns whether the index with columns and condition serves queryset.
+
+    Columns compared to several values must follow the equality columns, the
+    rows of each value are then read from the index and sorted, which is cheap
+    since the values are few and select few rows.
+    """
+    equal, isnull, among = _conditions(queryset.query.where)
+    implied = {"exact": equal, "isnull": isnull}
+    for column, (lookup, value) in condition.items():
+        if column not in implied[lookup] or implied[lookup][column] != value:
+            return False
+    # The columns fixed by the condition of the index needn't be indexed.
+    equal = set(equal) - set(condition)
+    prefix = {column.lstrip("-") for column in columns[: len(equal)]}
+    if prefix != equal:
+        return False
+    rest = columns[len(equal) :]
+    if among:
+        return len(among) == 1 and [column.lstrip("-") for column in rest[:1]] == list(
+            among
+        )
+    ordering = _ordering(queryset)
+    rest = rest[: len(ordering)]
+    if ordering == rest:
+        return True
+    reverse = [name[1:] if name.startswith("-") else "-" + name for name in rest]
+    return ordering == reverse
+
+
+def _ordering(queryset):
+    """
+    Returns the columns queryset is ordered by.
+    """
+    query, model = queryset.query, queryset.model
+    ordering = query.order_by or (
+        model._meta.ordering if query.default_ordering else []
+    )
+    return [_column(model, name) for name in ordering]
+
+
+def suggested_columns(queryset):
+    """
+    Returns the columns of an index serving queryset.
+    """
+    equal, isnull, among = _conditions(queryset.query.where)
+    return sorted(equal) + sorted(among) + _ordering(queryset)
+
+
+def missing_indexes():
+    """
+    Returns the views whose queries aren't served by any index.
+    """
+    return [
+        (label, queryset)
+        for label, queryset in query_shapes()
+        if not any(
+            is_served(queryset, columns, condition)
+            for columns, condition in model_indexes(queryset.model)
+        )
+    ]
@@ -0,0 +1,75 @@
+"""
+Management command benchmarking the read views.
+"""
+import json
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from core.benchmark import benchmark_urls, run_benchmark
+from users.models import User
+
+
+class Command(BaseCommand):
+    """
+    Requests every read view with the test client and reports its latency
+    percentiles and number of queries.
+    """
+
+    help = "Reports p50/p95/p99 latency and queries of every read view."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests", type=int, default=50, help="Measured requests per view."
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=5, help="Unmeasured requests per view."
+        )
+        parser.add_argument(
+            "--user",
+            help="Email of the user the views are requested as, the first user "
+            "by email by default.",
+        )
+        parser.add_argument(
+            "--anonymous", action="store_true", help="Request the views logged out."
+        )
+        parser.add_argument("--json", help="File the results are written to as JSON.")
+
+    def handle(self, *args, **options):
+        if options["requests"] < 2:
+            raise CommandError("At least 2 requests per view are needed.")
+        client = Client()
+        user = None
+        if not options["anonymous"]:
+            users = User.objects.order_by("email")
+            if options["user"]:
+                users = users.filter(email=options["user"])
+            user = users.first()
+            if user is None:
+                raise CommandError("No user to request the views as.")
+            client.force_login(user)
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            results = run_benchmark(
+                client,
+                benchmark_urls(user),
+                requests=options["requests"],
+                warmup=options["warmup"],
+            )
+        self.stdout.write(
+            "%-28s %6s %9s %9s %9s %8s"
+            % ("view", "status", "p50 ms", "p95 ms", "p99 ms", "queries")
+        )
+        for result in results:
+            self.stdout.write(
+                "%-28s %6d %9.2f %9.2f %9.2f %8.1f"
+                % (
+                    result["view"],
+                    result["status"],
+                    result["p50"],
+                    result["p95"],
+                    result["p99"],
+                    result["queries"],
+                )
+            )
+        if options["json"]:
+            with open(options["json"], "w") as output:
+                json.dump(results, output, indent=2)
@@ -0,0 +1,28 @@
+"""
+Management command reporting the view queries not served by an index.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from core.indexes import missing_indexes, suggested_columns
+
+
+class Command(BaseCommand):
+    """
+    Checks the querysets issued by the views against the model indexes.
+    """
+
+    help = "Reports the queries issued by the views which no index serves."
+
+    def handle(self, *args, **options):
+        missing = missing_indexes()
+        for label, queryset in missing:
+            self.stdout.write(
+                "%s: no index on %s (%s)"
+                % (
+                    label,
+                    queryset.model._meta.db_table,
+                    ", ".join(suggested_columns(queryset)),
+                )
+            )
+        if missing:
+            raise CommandError("%d queries aren't served by an index." % len(missing))
+        self.stdout.write(self.style.SUCCESS("Every query is served by an index."))
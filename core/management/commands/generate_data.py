@@ -0,0 +1,65 @@
+"""
+Management command generating a large dataset for benchmarks.
+"""
+from django.core.management.base import BaseCommand
+from core.datagen import DataGenerator
+
+
+class Command(BaseCommand):
+    """
+    Fills the database with users, followerships and content.
+    """
+
+    help = "Generates a reproducible dataset with power law distributed activity."
+
+    def add_arguments(self, parser):
+        for name, default, help_text in (
+            ("users", 1000, "Number of users."),
+            ("follows", 20, "Mean number of users each user follows."),
+            ("feeds", 10000, "Number of feeds, including replies."),
+            ("articles", 1000, "Number of articles, including drafts."),
+            ("questions", 2000, "Number of questions."),
+            ("answers", 6000, "Number of answers."),
+            ("polls", 1000, "Number of polls."),
+            ("votes", 20000, "Number of votes, duplicate votes are dropped."),
+        ):
+            parser.add_argument(
+                "--%s" % name, type=int, default=default, help=help_text
+            )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Seed of the random generator."
+        )
+        parser.add_argument(
+            "--alpha",
+            type=float,
+            default=1.2,
+            help="Exponent of the power law of the activity of users.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of rows inserted per query.",
+        )
+
+    def handle(self, *args, **options):
+        generator = DataGenerator(
+            seed=options["seed"],
+            alpha=options["alpha"],
+            batch_size=options["batch_size"],
+        )
+        counts = generator.generate(
+            users=options["users"],
+            follows=options["follows"],
+            feeds=options["feeds"],
+            articles=options["articles"],
+            questions=options["questions"],
+            answers=options["answers"],
+            polls=options["polls"],
+            votes=options["votes"],
+        )
+        for name, count in counts.items():
+            self.stdout.write("%s: %d" % (name, count))
+        self.stdout.write(
+            self.style.SUCCESS("Generated %d rows." % sum(counts.values()))
+        )
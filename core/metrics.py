@@ -0,0 +1,173 @@
+"""
+Contains the in-process metrics of the views recorded by ViewMetricsMiddleware.
+
+Each view has a rolling histogram per metric holding the observations of the
+last METRICS_WINDOWS windows of METRICS_WINDOW_SECONDS seconds, so the summary
+reflects the recent traffic of the process rather than its whole lifetime.
+The histograms also count every observation of the process, Prometheus being
+exported these lifetime counters since it expects them never to decrease.
+"""
+import bisect
+import threading
+import time
+from collections import deque
+from django.conf import settings
+
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# The name, the buckets and the description of each metric.
+METRICS = (
+    ("latency_seconds", TIME_BUCKETS, "Time spent handling requests."),
+    ("queries", COUNT_BUCKETS, "Number of SQL queries per request."),
+    ("db_seconds", TIME_BUCKETS, "Time spent in SQL queries per request."),
+    ("template_seconds", TIME_BUCKETS, "Time spent rendering template responses."),
+)
+
+
+class RollingHistogram:
+    """
+    Histogram of the values observed during the last windows, also counting
+    every value observed.
+    """
+
+    def __init__(self, buckets, window, windows):
+        self.buckets = buckets
+        self.window = window
+        self.windows = deque(maxlen=windows)
+        self.lifetime_counts = [0] * (len(buckets) + 1)
+        self.lifetime_total = 0.0
+
+    def observe(self, value, now=None):
+        now = time.monotonic() if now is None else now
+        start = now - now % self.window
+        if not self.windows or self.windows[-1][0] != start:
+            self.windows.append([start, [0] * (len(self.buckets) + 1), 0.0])
+        bucket = bisect.bisect_left(self.buckets, value)
+        self.windows[-1][1][bucket] += 1
+        self.windows[-1][2] += value
+        self.lifetime_counts[bucket] += 1
+        self.lifetime_total += value
+
+    def snapshot(self, now=None):
+        """
+        Returns the count of values per bucket, the last one for the values
+        above every bucket, and the sum of the values still in the window.
+        """
+        now = time.monotonic() if now is None else now
+        oldest = now - now % self.window - self.window * (self.windows.maxlen - 1)
+        counts, total = [0] * (len(self.buckets) + 1), 0.0
+        for start, window_counts, window_total in self.windows:
+            if start >= oldest:
+                counts = [a + b for a, b in zip(counts, window_counts)]
+                total += window_total
+        return counts, total
+
+
+def quantile(buckets, counts, q):
+    """
+    Returns the upper bound of the bucket holding the q quantile of counts, or
+    None if it's above every bucket or there are no values.
+    """
+    rank, seen = q * sum(counts), 0
+    for bound, count in zip(buckets, counts):
+        seen += count
+        if count and seen >= rank:
+            return bound
+    return None
+
+
+class ViewMetrics:
+    """
+    Registry of the rolling histograms of every view.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def observe(self, view, **values):
+        """
+        Adds the values of one request to the histograms of view.
+        """
+        with self._lock:
+            histograms = self._histograms.get(view)
+            if histograms is None:
+                histograms = self._histograms[view] = {
+                    name: RollingHistogram(
+                        buckets,
+                        settings.METRICS_WINDOW_SECONDS,
+                        settings.METRICS_WINDOWS,
+                    )
+                    for name, buckets, description in METRICS
+                }
+            for name, value in values.items():
+                histograms[name].observe(value)
+
+    def snapshot(self, lifetime=False):
+        """
+        Returns the bucket counts and the sum of each metric of each view, over
+        the last windows or the lifetime of the process.
+        """
+        with self._lock:
+            return {
+                view: {
+                    name: (
+                        (list(histogram.lifetime_counts), histogram.lifetime_total)
+                        if lifetime
+                        else histogram.snapshot()
+                    )
+                    for name, histogram in histograms.items()
+                }
+                for view, histograms in sorted(self._histograms.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def summary(self):
+        """
+        Returns the number of requests, the percentiles of the latency and the
+        means of the other metrics of each view.
+        """
+        rows = []
+        for view, metrics in self.snapshot().items():
+            latency_counts, latency_sum = metrics["latency_seconds"]
+            requests = sum(latency_counts)
+            if not requests:
+                continue
+            row = {"view": view, "requests": requests}
+            for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+                row[name] = quantile(TIME_BUCKETS, latency_counts, q)
+            for name, buckets, description in METRICS:
+                row["mean_" + name] = metrics[name][1] / requests
+            rows.append(row)
+        return rows
+
+    def prometheus(self):
+        """
+        Returns the lifetime histograms in the Prometheus text exposition
+        format.
+        """
+        snapshot = self.snapshot(lifetime=True)
+        lines = []
+        for name, buckets, description in METRICS:
+            metric = "view_" + name
+            lines.append("# HELP %s %s" % (metric, description))
+            lines.append("# TYPE %s histogram" % metric)
+            for view, metrics in snapshot.items():
+                counts, total = metrics[name]
+                cumulative = 0
+                for bound, count in zip(buckets + ("+Inf",), counts):
+                    cumulative += count
+                    lines.append(
+                        '%s_bucket{view="%s",le="%s"} %d'
+                        % (metric, view, bound, cumulative)
+                    )
+                lines.append('%s_sum{view="%s"} %s' % (metric, view, repr(total)))
+                lines.append('%s_count{view="%s"} %d' % (metric, view, cumulative))
+        return "\n".join(lines) + "\n"
+
+
+view_metrics = ViewMetrics()
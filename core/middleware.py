@@ -0,0 +1,189 @@
+"""
+Contains middleware common to the whole project.
+"""
+import random
+import time
+from contextlib import ExitStack
+from django.conf import settings
+from django.contrib import messages
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from core import routers
+from core.metrics import view_metrics
+from core.page_cache import CachedPage, section
+from core.slow_queries import SlowQueryLogger
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Pins the reads of a client to the primary database for
+    DATABASE_REPLICA_STICKINESS seconds after it wrote, so that it sees its own
+    writes before they reach the replicas.
+
+    Unsafe requests and requests of clients holding the stickiness cookie read
+    from the primary. Should be placed before SessionMiddleware so that session
+    writes are noticed.
+    """
+
+    cookie_name = "use_primary"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        use_primary = (
+            request.method not in ("GET", "HEAD", "OPTIONS", "TRACE")
+            or self.cookie_name in request.COOKIES
+        )
+        token = routers.begin_request(use_primary)
+        try:
+            response = self.get_response(request)
+        finally:
+            written = routers.end_request(token)
+        if written:
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=settings.DATABASE_REPLICA_STICKINESS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class ViewMetricsMiddleware:
+    """
+    Records the latency, the number of queries, the time spent in queries and
+    the template render time of each request under its url name.
+
+    Should be placed first to include the time spent in the other middleware.
+    Only TemplateResponse rendering is counted as template render time.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = {"count": 0, "seconds": 0.0}
+
+        def record_query(execute, sql, params, many, context):
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                queries["count"] += 1
+                queries["seconds"] += time.perf_counter() - started
+
+        request.template_seconds = 0.0
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(record_query))
+            response = self.get_response(request)
+        latency = time.perf_counter() - started
+        match = request.resolver_match
+        if match is not None and match.view_name:
+            view_metrics.observe(
+                match.view_name,
+                latency_seconds=latency,
+                queries=queries["count"],
+                db_seconds=queries["seconds"],
+                template_seconds=request.template_seconds,
+            )
+        return response
+
+    def process_template_response(self, request, response):
+        started = time.perf_counter()
+
+        def rendered(response):
+            request.template_seconds = time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+        return response
+
+
+class SlowQueryLogMiddleware:
+    """
+    Logs the queries slower than SLOW_QUERY_THRESHOLD_MS milliseconds with
+    their plans, analyzed for a SLOW_QUERY_ANALYZE_RATE fraction of requests.
+
+    Disabled unless SLOW_QUERY_THRESHOLD_MS is set.
+    """
+
+    def __init__(self, get_response):
+        if not settings.SLOW_QUERY_THRESHOLD_MS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        analyze = random.random() < settings.SLOW_QUERY_ANALYZE_RATE
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(
+                    connection.execute_wrapper(
+                        SlowQueryLogger(
+                            connection,
+                            request,
+                            settings.SLOW_QUERY_THRESHOLD_MS,
+                            analyze=analyze,
+                        )
+                    )
+                )
+            return self.get_response(request)
+
+
+class PageCacheMiddleware:
+    """
+    Caches the pages of PAGE_CACHE_SECTIONS for anonymous users, keyed on the
+    path and query string. Stale pages are served while one request
+    regenerates them.
+
+    Should be placed after AuthenticationMiddleware and MessageMiddleware,
+    requests of logged in users and requests with pending messages bypass the
+    cache since their pages show the user or the messages. Disabled unless
+    PAGE_CACHE_TIMEOUT is set.
+    """
+
+    def __init__(self, get_response):
+        if not settings.PAGE_CACHE_TIMEOUT:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        prefix = section(request.path)
+        if (
+            request.method not in ("GET", "HEAD")
+            or prefix is None
+            or request.user.is_authenticated
+            or len(messages.get_messages(request))
+        ):
+            return self.get_response(request)
+        page = CachedPage(request, prefix)
+        cached = page.get()
+        if cached is not None:
+            response, fresh = cached
+            if fresh or not page.lock():
+                response["X-Page-Cache"] = "hit" if fresh else "stale"
+                return response
+            try:
+                response = self.get_response(request)
+                self.store(request, response, page)
+            finally:
+                page.unlock()
+            return response
+        response = self.get_response(request)
+        self.store(request, response, page)
+        return response
+
+    def store(self, request, response, page):
+        if (
+            request.method == "GET"
+            and response.status_code == 200
+            and not response.streaming
+            and not response.cookies
+            and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+            and not request.user.is_authenticated
+            and "private" not in response.get("Cache-Control", "")
+        ):
+            page.set(response)
+        response["X-Page-Cache"] = "miss"
@@ -2,8 +2,68 @@
 Contains models, managers, etc. common to the whole project.
 """
 
+import os
+import time
+import uuid
 from django.db import models
 from django.utils import timezone
+from django.utils.text import Truncator
+
+EXCERPT_LENGTH = 200
+
+
+def excerpt(text, length=EXCERPT_LENGTH):
+    """
+    Returns the start of text with its whitespace collapsed, truncated to
+    length characters.
+    """
+    return Truncator(" ".join(text.split())).chars(length)
+
+
+def uuid7(milliseconds=None, random_bits=None):
+    """
+    Returns a version 7 UUID, starting with the milliseconds since the epoch,
+    or milliseconds if given, and followed by 80 random bits, or random_bits.
+
+    Rows keyed by these UUIDs are inserted at the end of the primary key index
+    instead of at random places, unlike with uuid4.
+    """
+    if milliseconds is None:
+        milliseconds = time.time_ns() // 1000000
+    if random_bits is None:
+        random_bits = int.from_bytes(os.urandom(10), "big")
+    value = milliseconds << 80 | random_bits
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+class AuthoredQuerySet(models.QuerySet):
+    """
+    QuerySet class for models rendered in lists along with their authors.
+    """
+
+    list_related = ("author",)
+    # Large text fields summarized by an excerpt, and whether lists show the
+    # excerpt instead of loading them.
+    excerpted_fields = ()
+    list_excerpts = True
+
+    def for_list(self):
+        """
+        Returns the queryset with the relations rendered in lists selected and
+        the excerpted fields deferred if lists show the excerpts.
+        """
+        if self.list_excerpts:
+            return self.for_excerpts()
+        return self.select_related(*self.list_related)
+
+    def for_excerpts(self):
+        """
+        Returns the queryset with the relations rendered in lists selected and
+        the excerpted fields deferred.
+        """
+        return self.select_related(*self.list_related).defer(*self.excerpted_fields)
 
 
 class TimeStampedModel(models.Model):
@@ -15,4 +75,25 @@ class TimeStampedModel(models.Model):
     modified_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        abstract = True
\ No newline at end of file
+        abstract = True
+
+
+class ExcerptedModel(models.Model):
+    """
+    Model class storing an excerpt of its excerpt_field, updated on save.
+    """
+
+    excerpt_field = "text"
+
+    excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or self.excerpt_field in update_fields:
+            self.excerpt = excerpt(getattr(self, self.excerpt_field))
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "excerpt"}
+        super().save(*args, **kwargs)
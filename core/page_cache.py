@@ -0,0 +1,102 @@
+"""
+Contains the full page cache of anonymous users used by PageCacheMiddleware.
+
+Each section of PAGE_CACHE_SECTIONS has a generation bumped when the models
+it shows are written. Cached pages remember the generation they were rendered
+at and are stale once it changes or they're older than PAGE_CACHE_TIMEOUT.
+Generations are kept in the page cache, so that they're shared exactly when
+the pages are.
+"""
+import time
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+from django.utils.crypto import md5
+from core.cache import bump_version, get_version
+
+
+def page_cache():
+    """
+    Returns the cache pages are stored in.
+    """
+    try:
+        return caches["pages"]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+def section(path):
+    """
+    Returns the prefix of the section path belongs to, or None if pages at
+    path aren't cached.
+    """
+    for prefix in settings.PAGE_CACHE_SECTIONS:
+        if path.startswith(prefix):
+            return prefix
+    return None
+
+
+def sections(model):
+    """
+    Returns the prefixes of the sections showing instances of model.
+    """
+    return [
+        prefix
+        for prefix, labels in settings.PAGE_CACHE_SECTIONS.items()
+        if any(apps.get_model(label) is model for label in labels)
+    ]
+
+
+def invalidate(model):
+    """
+    Marks the cached pages of the sections showing instances of model stale.
+    """
+    for prefix in sections(model):
+        bump_version("pages:%s" % prefix, page_cache())
+
+
+class CachedPage:
+    """
+    Cached page at the full path of request.
+    """
+
+    def __init__(self, request, prefix):
+        self.key = (
+            "page:%s"
+            % md5(request.get_full_path().encode(), usedforsecurity=False).hexdigest()
+        )
+        self.lock_key = self.key + ":lock"
+        self.generation = get_version("pages:%s" % prefix, page_cache())
+
+    def get(self):
+        """
+        Returns the cached response and whether it's fresh, or None if there's
+        no cached response.
+        """
+        entry = page_cache().get(self.key)
+        if entry is None:
+            return None
+        generation, rendered_at, response = entry
+        fresh = (
+            generation == self.generation
+            and time.time() - rendered_at < settings.PAGE_CACHE_TIMEOUT
+        )
+        return response, fresh
+
+    def lock(self):
+        """
+        Returns whether the caller got to regenerate the page, other callers
+        serve the stale page until it's replaced or the lock expires.
+        """
+        return page_cache().add(self.lock_key, 1, settings.PAGE_CACHE_TIMEOUT)
+
+    def set(self, response):
+        page_cache().set(
+            self.key,
+            (self.generation, time.time(), response),
+            settings.PAGE_CACHE_TIMEOUT + settings.PAGE_CACHE_STALE,
+        )
+
+    def unlock(self):
+        page_cache().delete(self.lock_key)
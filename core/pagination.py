@@ -0,0 +1,255 @@
+"""
+Contains keyset (cursor) pagination for list views.
+
+Pages are fetched by filtering on the last row of the previous page instead of
+using an OFFSET, so the cost of a page doesn't depend on how deep it is and no
+COUNT query is needed.
+"""
+import base64
+import json
+from django.db.models import Q, QuerySet
+
+
+class InvalidCursor(Exception):
+    """
+    Raised when a cursor can't be decoded.
+    """
+
+
+class CursorPage:
+    """
+    A single page of objects returned by CursorPaginator.
+    """
+
+    def __init__(self, object_list, paginator, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return "<CursorPage of %d objects>" % len(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Paginates a queryset on its ordering fields with opaque cursors.
+
+    The ordering defaults to the model's ordering with the primary key appended
+    as a tie-breaker, e.g. ("-created_at", "-pk") for TimeStampedModel
+    subclasses. All the ordering fields must have the same direction.
+    """
+
+    def __init__(self, queryset, per_page, ordering=None):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        if isinstance(queryset, QuerySet):
+            self.ordering = self._get_ordering(queryset, ordering)
+        else:
+            self.ordering = ()
+
+    @staticmethod
+    def _get_ordering(queryset, ordering):
+        if ordering is None:
+            ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+            descending = bool(ordering) and ordering[0].startswith("-")
+            if not any(field.lstrip("-") in ("pk", "id") for field in ordering):
+                ordering.append("-pk" if descending else "pk")
+        ordering = tuple(ordering)
+        if len({field.startswith("-") for field in ordering}) > 1:
+            raise ValueError("Cursor ordering fields must have the same direction.")
+        return ordering
+
+    @property
+    def descending(self):
+        return bool(self.ordering) and self.ordering[0].startswith("-")
+
+    @property
+    def fields(self):
+        return [field.lstrip("-") for field in self.ordering]
+
+    def encode_cursor(self, obj, direction):
+        """
+        Returns an opaque cursor pointing at obj.
+        """
+        values = [getattr(obj, field) for field in self.fields]
+        payload = json.dumps(
+            {"d": direction, "v": [str(value) for value in values]},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        """
+        Returns the direction and the ordering values encoded in cursor.
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            direction, values = payload["d"], payload["v"]
+            if direction not in ("n", "p") or len(values) != len(self.fields):
+                raise ValueError
+            model_meta = self.queryset.model._meta
+            values = [
+                model_meta.pk.to_python(value)
+                if field == "pk"
+                else model_meta.get_field(field).to_python(value)
+                for field, value in zip(self.fields, values)
+            ]
+        except Exception as error:
+            raise InvalidCursor(cursor) from error
+        return direction, values
+
+    def _keyset_filter(self, values, forward, fields=None):
+        """
+        Returns a filter selecting the rows after values in the given direction,
+        comparing fields or the ordering fields.
+        """
+        fields = fields or self.fields
+        lookup = "lt" if forward == self.descending else "gt"
+        condition = Q()
+        for index, field in enumerate(fields):
+            equal = {fields[i]: values[i] for i in range(index)}
+            condition |= Q(**equal, **{"%s__%s" % (field, lookup): values[index]})
+        return condition
+
+    def querysets(self, ordering=None):
+        """
+        Returns the querysets pages are read from, in ordering or the ordering
+        of the paginator, before they're filtered on the cursor and sliced.
+        """
+        return [self.queryset.order_by(*(ordering or self.ordering))]
+
+    def fetch(self, ordering, values, forward):
+        """
+        Returns the objects after values in the given direction, up to one more
+        than a page to tell whether there are more.
+        """
+        queryset = self.querysets(ordering)[0]
+        if values is not None:
+            queryset = queryset.filter(self._keyset_filter(values, forward))
+        return list(queryset[: self.per_page + 1])
+
+    def page(self, cursor=None):
+        """
+        Returns the page pointed at by cursor, or the first page if None.
+        """
+        if not isinstance(self.queryset, QuerySet):
+            return CursorPage(list(self.queryset[: self.per_page]), self)
+
+        direction, values = ("n", None) if not cursor else self.decode_cursor(cursor)
+        forward = direction == "n"
+        if forward:
+            ordering = self.ordering
+        else:
+            ordering = tuple(
+                field[1:] if field.startswith("-") else "-" + field
+                for field in self.ordering
+            )
+        object_list = self.fetch(ordering, values, forward)
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+        if not forward:
+            object_list.reverse()
+
+        next_cursor = previous_cursor = None
+        if object_list:
+            if has_more or not forward:
+                next_cursor = self.encode_cursor(object_list[-1], "n")
+            if (has_more and not forward) or (forward and values is not None):
+                previous_cursor = self.encode_cursor(object_list[0], "p")
+        return CursorPage(object_list, self, next_cursor, previous_cursor)
+
+
+class OffsetCursorPaginator:
+    """
+    Paginates a queryset with opaque cursors holding an offset.
+
+    Meant for querysets ordered by computed values which can't be used as
+    keys, such as search ranks. Like CursorPaginator no COUNT query is issued.
+    """
+
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+
+    @staticmethod
+    def encode_cursor(offset):
+        return base64.urlsafe_b64encode(b"o:%d" % offset).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            prefix, offset = base64.urlsafe_b64decode(padded.encode()).split(b":")
+            if prefix != b"o" or int(offset) < 0:
+                raise ValueError
+        except Exception as error:
+            raise InvalidCursor(cursor) from error
+        return int(offset)
+
+    def page(self, cursor=None):
+        """
+        Returns the page pointed at by cursor, or the first page if None.
+        """
+        offset = self.decode_cursor(cursor) if cursor else 0
+        object_list = list(self.queryset[offset : offset + self.per_page + 1])
+        next_cursor = previous_cursor = None
+        if len(object_list) > self.per_page:
+            object_list = object_list[: self.per_page]
+            next_cursor = self.encode_cursor(offset + self.per_page)
+        if offset > 0:
+            previous_cursor = self.encode_cursor(max(offset - self.per_page, 0))
+        return CursorPage(object_list, self, next_cursor, previous_cursor)
+
+
+class CursorPaginationMixin:
+    """
+    Mixin for ListView subclasses replacing OFFSET pagination with cursors.
+
+    The cursor is read from the "cursor" query parameter, invalid cursors fall
+    back to the first page.
+    """
+
+    cursor_kwarg = "cursor"
+    cursor_ordering = None
+
+    def get_cursor_ordering(self, queryset):
+        """
+        Returns the ordering used for paginating queryset.
+        """
+        return self.cursor_ordering
+
+    def get_cursor_paginator(self, queryset, page_size):
+        """
+        Returns the paginator used for paginating queryset.
+        """
+        return CursorPaginator(
+            queryset, page_size, ordering=self.get_cursor_ordering(queryset)
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = self.get_cursor_paginator(queryset, page_size)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            page = paginator.page()
+        return (paginator, page, page.object_list, page.has_other_pages())
@@ -0,0 +1,69 @@
+"""
+Contains the database router spreading reads over read replicas.
+
+Writes always go to the default (primary) database. Reads go to a random
+replica of DATABASE_REPLICAS unless the current request is pinned to the
+primary by ReplicaStickinessMiddleware, or a transaction is open on it.
+"""
+import random
+from contextvars import ContextVar
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+_request_state = ContextVar("replica_request_state", default=None)
+
+
+def begin_request(use_primary):
+    """
+    Starts tracking the database usage of a request and returns a token for
+    end_request. Reads are pinned to the primary if use_primary is True.
+    """
+    return _request_state.set({"use_primary": use_primary, "written": False})
+
+
+def end_request(token):
+    """
+    Stops tracking the request started with token and returns whether the
+    request wrote to the primary.
+    """
+    state = _request_state.get()
+    _request_state.reset(token)
+    return bool(state and state["written"])
+
+
+class ReplicaRouter:
+    """
+    Routes reads to the read replicas and writes to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        if not replicas:
+            return None
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        state = _request_state.get()
+        if (state and state["use_primary"]) or connections[
+            DEFAULT_DB_ALIAS
+        ].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state["written"] = True
+            state["use_primary"] = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -0,0 +1,26 @@
+"""
+Contains signal receivers for core app.
+"""
+from django.apps import apps
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from core import page_cache
+
+
+def invalidate_pages(sender, raw=False, **kwargs):
+    """
+    Marks the cached pages showing instances of sender stale.
+    """
+    if not raw:
+        page_cache.invalidate(sender)
+
+
+def connect_page_cache():
+    """
+    Connects the receivers invalidating the cached pages.
+    """
+    for labels in settings.PAGE_CACHE_SECTIONS.values():
+        for label in labels:
+            model = apps.get_model(label)
+            post_save.connect(invalidate_pages, sender=model)
+            post_delete.connect(invalidate_pages, sender=model)
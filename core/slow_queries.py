@@ -0,0 +1,101 @@
+"""
+Contains the slow query log enabled by SLOW_QUERY_THRESHOLD_MS.
+
+Queries slower than the threshold are logged to the "core.slow_queries" logger
+as JSON lines with the view and template line issuing them and the plan of the
+query. Their parameters aren't logged since they may hold password hashes or
+session data.
+"""
+import json
+import logging
+import sys
+import time
+from django.db import DatabaseError, transaction
+from django.template.base import Node
+
+logger = logging.getLogger("core.slow_queries")
+
+EXPLAIN_PREFIXES = {
+    "postgresql": ("EXPLAIN ", "EXPLAIN ANALYZE "),
+    "sqlite": ("EXPLAIN QUERY PLAN ", "EXPLAIN QUERY PLAN "),
+    "mysql": ("EXPLAIN ", "EXPLAIN ANALYZE "),
+}
+
+
+def template_line():
+    """
+    Returns the template and line of the innermost template node being rendered
+    by the current thread, or None outside of template rendering.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        node = frame.f_locals.get("self")
+        if isinstance(node, Node) and node.token and node.origin:
+            return "%s:%d" % (node.origin.name, node.token.lineno)
+        frame = frame.f_back
+    return None
+
+
+class SlowQueryLogger:
+    """
+    Execute wrapper logging the queries of a request slower than threshold
+    milliseconds. Plans are captured with EXPLAIN ANALYZE if analyze is True.
+    """
+
+    def __init__(self, connection, request, threshold, analyze=False):
+        self.connection = connection
+        self.request = request
+        self.threshold = threshold
+        self.analyze = analyze
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        result = execute(sql, params, many, context)
+        duration = (time.perf_counter() - started) * 1000
+        if duration >= self.threshold:
+            self.log(sql, params, many, duration)
+        return result
+
+    def explain(self, sql, params):
+        """
+        Returns the plan of the query, analyzed if requested for SELECT queries,
+        or None if the query can't be explained.
+        """
+        prefixes = EXPLAIN_PREFIXES.get(self.connection.vendor)
+        if prefixes is None or not sql.lstrip().upper().startswith("SELECT"):
+            return None
+        prefix = prefixes[1] if self.analyze else prefixes[0]
+        # The EXPLAIN bypasses the execute wrappers, so that it isn't logged
+        # or counted as a query of the view by ViewMetricsMiddleware.
+        wrappers = self.connection.execute_wrappers
+        self.connection.execute_wrappers = []
+        try:
+            with transaction.atomic(using=self.connection.alias):
+                with self.connection.cursor() as cursor:
+                    cursor.execute(prefix + sql, params)
+                    return "\n".join(
+                        " ".join(str(column) for column in row)
+                        for row in cursor.fetchall()
+                    )
+        except DatabaseError as error:
+            return "EXPLAIN failed: %s" % error
+        finally:
+            self.connection.execute_wrappers = wrappers
+
+    def log(self, sql, params, many, duration):
+        match = self.request.resolver_match
+        logger.warning(
+            json.dumps(
+                {
+                    "duration_ms": round(duration, 3),
+                    "database": self.connection.alias,
+                    "sql": sql,
+                    "view": match.view_name if match is not None else None,
+                    "path": self.request.path,
+                    "template": template_line(),
+                    "plan": None if many else self.explain(sql, params),
+                    "analyzed": self.analyze,
+                },
+                default=str,
+            )
+        )
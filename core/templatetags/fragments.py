@@ -0,0 +1,25 @@
+"""
+Contains template tags and filters for cached template fragments.
+"""
+from django import template
+from core import cache
+
+register = template.Library()
+
+
+@register.filter
+def fragment_version(pk, namespace):
+    """
+    Returns the version of the object with pk in namespace, e.g.
+    {{ feed.author_id|fragment_version:"user" }}.
+    """
+    return cache.get_version("%s:%s" % (namespace, pk))
+
+
+@register.filter
+def fragment_timeout(timeout):
+    """
+    Returns the timeout fragments are cached for, e.g.
+    {% cache 604800|fragment_timeout feed_item ... %}.
+    """
+    return cache.fragment_timeout(timeout)
@@ -0,0 +1,57 @@
+"""
+Contains test utilities for guarding the number and duration of SQL queries.
+"""
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class _AssertQueryBudgetContext(CaptureQueriesContext):
+    def __init__(self, test_case, max_queries, max_time, connection):
+        self.test_case = test_case
+        self.max_queries = max_queries
+        self.max_time = max_time
+        super().__init__(connection)
+
+    @property
+    def elapsed(self):
+        """
+        Returns the total time in seconds spent in the captured queries.
+        """
+        return sum(float(query["time"]) for query in self.captured_queries)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None:
+            return
+        queries = "\n".join(
+            "%d. %s" % (number, query["sql"])
+            for number, query in enumerate(self.captured_queries, start=1)
+        )
+        self.test_case.assertLessEqual(
+            len(self),
+            self.max_queries,
+            "%d queries executed, the budget is %d\nCaptured queries were:\n%s"
+            % (len(self), self.max_queries, queries),
+        )
+        if self.max_time is not None:
+            self.test_case.assertLessEqual(
+                self.elapsed,
+                self.max_time,
+                "Queries took %.3fs, the budget is %.3fs\nCaptured queries were:\n%s"
+                % (self.elapsed, self.max_time, queries),
+            )
+
+
+class QueryBudgetMixin:
+    """
+    Mixin for TestCase subclasses asserting the SQL cost of a block of code.
+    """
+
+    def assertQueryBudget(self, max_queries, max_time=None, using=DEFAULT_DB_ALIAS):
+        """
+        Returns a context manager failing the test when the block executes more
+        than max_queries queries or spends more than max_time seconds in them.
+        """
+        return _AssertQueryBudgetContext(
+            self, max_queries, max_time, connections[using]
+        )
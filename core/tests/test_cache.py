@@ -0,0 +1,77 @@
+"""
+Tests for cached template fragments defined in core app.
+"""
+from unittest import mock
+from django.template.loader import render_to_string
+from django.test import TestCase, override_settings
+from core.cache import bump_version, fragment_cache, get_version
+from feeds.factories import FeedFactory
+from feeds.models import Feed
+from users.models import User
+
+
+class FragmentCacheTestCase(TestCase):
+    """
+    Test class for cached list item fragments.
+    """
+
+    def setUp(self):
+        fragment_cache().clear()
+
+    def render_feeds(self):
+        return render_to_string(
+            "feeds/_feed_list.html", {"feeds": list(Feed.objects.all())}
+        )
+
+    def test_bump_version_increments_version(self):
+        """
+        Tests that bump_version increments the version of a key.
+        """
+        self.assertEqual(get_version("test:1"), 0)
+        bump_version("test:1")
+        bump_version("test:1")
+        self.assertEqual(get_version("test:1"), 2)
+
+    def test_cached_items_are_rendered_without_queries(self):
+        """
+        Tests that rendering cached items doesn't load their authors again.
+        """
+        FeedFactory(text="first")
+        FeedFactory(text="second")
+        html = self.render_feeds()
+        feeds = list(Feed.objects.all())
+        with self.assertNumQueries(0):
+            cached_html = render_to_string("feeds/_feed_list.html", {"feeds": feeds})
+        self.assertEqual(cached_html, html)
+
+    def test_modified_item_is_rendered_again(self):
+        """
+        Tests that modifying an item invalidates its fragment.
+        """
+        feed = FeedFactory(text="first")
+        self.render_feeds()
+        feed.text = "changed"
+        feed.save()
+        self.assertIn("changed", self.render_feeds())
+
+    def test_renaming_author_invalidates_fragments(self):
+        """
+        Tests that renaming the author invalidates the fragments of their items.
+        """
+        feed = FeedFactory()
+        self.assertIn(feed.author.name, self.render_feeds())
+        author = User.objects.get(pk=feed.author_id)
+        author.name = "Renamed Author"
+        author.save()
+        self.assertIn("Renamed Author", self.render_feeds())
+
+    @override_settings(SHARED_FRAGMENT_CACHE=False, FRAGMENT_CACHE_LOCAL_TIMEOUT=60)
+    def test_local_fragments_expire_quickly(self):
+        """
+        Tests that fragments are cached for FRAGMENT_CACHE_LOCAL_TIMEOUT
+        seconds unless the fragment cache is shared.
+        """
+        FeedFactory()
+        with mock.patch.object(fragment_cache(), "set") as set_fragment:
+            self.render_feeds()
+        self.assertEqual(set_fragment.call_args.args[2], 60)
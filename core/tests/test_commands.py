@@ -0,0 +1,155 @@
+"""
+Contains tests for management commands defined in core app.
+"""
+import datetime
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from core.datagen import DataGenerator, copy_payload
+from feeds.models import Feed, TimelineEntry
+from polls.models import Choice, Question as Poll
+from users.models import Followership, User, UserStats
+
+
+class GenerateDataTestCase(TestCase):
+    """
+    Test class for generate_data command.
+    """
+
+    def generate(self, seed=0):
+        call_command(
+            "generate_data",
+            users=50,
+            follows=5,
+            feeds=100,
+            articles=20,
+            questions=20,
+            answers=40,
+            polls=10,
+            votes=100,
+            seed=seed,
+            batch_size=30,
+            stdout=StringIO(),
+        )
+
+    def test_command_creates_requested_rows(self):
+        """
+        Tests that the command creates the requested number of rows.
+        """
+        self.generate()
+        self.assertEqual(User.objects.count(), 50)
+        self.assertEqual(Feed.objects.count(), 100)
+        self.assertEqual(Poll.objects.count(), 10)
+        self.assertEqual(UserStats.objects.count(), 50)
+        voters = Poll.voters.through.objects.count()
+        self.assertEqual(sum(Choice.objects.values_list("votes", flat=True)), voters)
+
+    def test_replies_belong_to_the_thread_of_their_parent(self):
+        """
+        Tests that generated replies have the thread of their parent.
+        """
+        self.generate()
+        for feed in Feed.objects.exclude(parent=None).select_related("parent"):
+            self.assertEqual(feed.thread_id, feed.parent.thread_id)
+            self.assertEqual(feed.depth, feed.parent.depth + 1)
+            self.assertGreaterEqual(feed.created_at, feed.parent.created_at)
+
+    def test_followers_are_power_law_distributed(self):
+        """
+        Tests that the first users attract more followers than the others.
+        """
+        self.generate()
+        followers = list(
+            User.objects.annotate(count=Count("followers"))
+            .order_by("email")
+            .values_list("email", "count")
+        )
+        counts = dict(followers)
+        self.assertGreater(counts["user0@example.com"], counts["user49@example.com"])
+
+    @override_settings(FEEDS_FANOUT_LIMIT=3)
+    def test_feeds_are_fanned_out(self):
+        """
+        Tests that feeds are added to the timelines of their authors and their
+        followers, and that the feeds of authors with more than
+        FEEDS_FANOUT_LIMIT followers are marked pulled instead.
+        """
+        self.generate()
+        self.assertFalse(Feed.objects.pending().exists())
+        pulled = Feed.objects.filter(pulled=True).select_related("author")
+        self.assertTrue(pulled.exists())
+        for feed in pulled:
+            self.assertFalse(feed.fanned_out)
+            self.assertGreater(feed.author.followers.count(), 3)
+            self.assertFalse(feed.timeline_entries.exists())
+        for feed in Feed.objects.filter(fanned_out=True).select_related("author"):
+            owners = set(feed.author.followers.values_list("pk", flat=True))
+            owners.add(feed.author_id)
+            self.assertSetEqual(
+                set(feed.timeline_entries.values_list("owner_id", flat=True)), owners
+            )
+
+
+class DataGeneratorTestCase(TestCase):
+    """
+    Test class for DataGenerator.
+    """
+
+    def test_copy_payload_leaves_out_auto_created_keys(self):
+        """
+        Tests that COPY leaves the ids of models with auto-created primary keys
+        to the database.
+        """
+        followership = Followership(
+            followee_id=1, follower_id=2, start_date=timezone.now()
+        )
+        sql, data = copy_payload(Followership, [followership], connection)
+        self.assertNotIn(connection.ops.quote_name("id"), sql)
+        self.assertIn(connection.ops.quote_name("followee_id"), sql)
+        row = data.getvalue().rstrip("\n").split("\t")
+        self.assertEqual(len(row), 3)
+        self.assertNotIn("\\N", row)
+
+    def test_same_seed_gives_same_ids(self):
+        """
+        Tests that ids are drawn from the seeded generator.
+        """
+        now = timezone.now()
+        timestamp = now - datetime.timedelta(days=1)
+        first = DataGenerator(seed=1, now=now)
+        second = DataGenerator(seed=1, now=now)
+        ids = [first.uuid(timestamp) for _ in range(3)]
+        self.assertEqual(ids, [second.uuid(timestamp) for _ in range(3)])
+        self.assertEqual(len(set(ids)), 3)
+        self.assertEqual(ids[0].version, 7)
+
+
+class BenchmarkTestCase(TestCase):
+    """
+    Test class for benchmark command.
+    """
+
+    def test_command_reports_every_view(self):
+        """
+        Tests that the command reports the latency and queries of the views.
+        """
+        call_command(
+            "generate_data",
+            users=5,
+            follows=2,
+            feeds=5,
+            articles=5,
+            questions=5,
+            answers=5,
+            polls=5,
+            votes=5,
+            stdout=StringIO(),
+        )
+        out = StringIO()
+        call_command("benchmark", requests=2, warmup=0, stdout=out)
+        output = out.getvalue()
+        for view in ("feeds:home", "feeds:thread", "users:profile answers"):
+            self.assertRegex(output, r"%s +200 " % view)
@@ -0,0 +1,204 @@
+"""
+Tests for the conditional GET support of the detail views.
+"""
+from unittest import mock
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from articles.factories import ArticleFactory
+from polls.factories import ChoiceFactory, QuestionFactory as PollFactory
+from questions.factories import AnswerFactory, QuestionFactory
+from users.factories import UserFactory
+
+
+class ConditionalGetTestCase(TestCase):
+    """
+    Test class for ConditionalGetMixin.
+    """
+
+    def setUp(self):
+        self.article = ArticleFactory()
+        self.url = reverse("articles:detail", kwargs={"pk": self.article.pk})
+
+    def test_sends_validators(self):
+        """
+        Tests that detail pages are sent with an ETag, a Last-Modified header
+        and varying on the cookies.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+        self.assertIn("Cookie", response["Vary"])
+
+    def test_unchanged_page_is_not_modified(self):
+        """
+        Tests that requests with the current ETag are answered with a 304
+        response after the validator query only.
+        """
+        etag = self.client.get(self.url)["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_unchanged_page_is_not_modified_since(self):
+        """
+        Tests that requests with the current Last-Modified are answered with a
+        304 response.
+        """
+        last_modified = self.client.get(self.url)["Last-Modified"]
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_edited_page_is_modified(self):
+        """
+        Tests that editing the object changes the ETag.
+        """
+        etag = self.client.get(self.url)["ETag"]
+        self.article.title = "New title"
+        self.article.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_renamed_author_is_modified(self):
+        """
+        Tests that renaming the author changes the ETag.
+        """
+        etag = self.client.get(self.url)["ETag"]
+        self.article.author.name = "New name"
+        self.article.author.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_varies_on_user(self):
+        """
+        Tests that users get different ETags and no Last-Modified header.
+        """
+        anonymous = self.client.get(self.url)["ETag"]
+        self.client.force_login(UserFactory())
+        first = self.client.get(self.url)
+        self.client.force_login(UserFactory())
+        second = self.client.get(self.url)
+        self.assertNotIn("Last-Modified", first)
+        self.assertEqual(len({anonymous, first["ETag"], second["ETag"]}), 3)
+
+    def test_missing_object_is_not_found(self):
+        """
+        Tests that missing objects are still answered with 404 responses.
+        """
+        self.article.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, 404)
+
+    def test_new_answer_is_modified(self):
+        """
+        Tests that answering a question changes the ETag of its page.
+        """
+        question = QuestionFactory()
+        url = reverse("questions:detail", kwargs={"pk": question.pk})
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        AnswerFactory(question=question)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_renamed_answer_author_is_modified(self):
+        """
+        Tests that renaming the author of an answer changes the ETag of the
+        question page.
+        """
+        answer = AnswerFactory()
+        url = reverse("questions:detail", kwargs={"pk": answer.question.pk})
+        etag = self.client.get(url)["ETag"]
+        answer.author.name = "New name"
+        answer.author.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_form_page_without_csrf_cookie_is_rendered(self):
+        """
+        Tests that pages with a form are rendered for clients without a CSRF
+        cookie so that the cookie is set.
+        """
+        poll = PollFactory()
+        url = reverse("polls:detail", kwargs={"pk": poll.pk})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+        self.assertIn(settings.CSRF_COOKIE_NAME, response.cookies)
+
+    def test_rotated_csrf_token_is_modified(self):
+        """
+        Tests that the ETag of a page with a form changes when the CSRF token
+        is rotated by logging in again.
+        """
+        user = UserFactory(password="password")
+        poll = PollFactory()
+        url = reverse("polls:detail", kwargs={"pk": poll.pk})
+        credentials = {"username": user.email, "password": "password"}
+        self.client.post(reverse("users:login"), credentials)
+        self.client.get(url)
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.client.get(reverse("users:logout"))
+        self.client.post(reverse("users:login"), credentials)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_vote_is_modified(self):
+        """
+        Tests that voting on a poll changes the ETag of its page.
+        """
+        choice = ChoiceFactory(question=PollFactory())
+        url = reverse("polls:detail", kwargs={"pk": choice.question.pk})
+        self.client.get(url)
+        etag = self.client.get(url)["ETag"]
+        choice.question.vote(choice=choice, user=UserFactory())
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(POLLS_VOTE_SHARDS=4)
+    def test_sharded_poll_has_no_last_modified(self):
+        """
+        Tests that polls with sharded votes are sent without Last-Modified.
+        """
+        choice = ChoiceFactory(question=PollFactory())
+        url = reverse("polls:detail", kwargs={"pk": choice.question.pk})
+        self.client.get(url)
+        response = self.client.get(url)
+        self.assertIn("ETag", response)
+        self.assertNotIn("Last-Modified", response)
+
+    @override_settings(POLLS_VOTE_SHARDS=4, POLLS_VOTE_STALENESS=0)
+    def test_uncached_sharded_poll_has_no_validators(self):
+        """
+        Tests that polls with sharded votes whose totals aren't cached are
+        sent without validators and show every vote.
+        """
+        choice = ChoiceFactory(question=PollFactory())
+        url = reverse("polls:detail", kwargs={"pk": choice.question.pk})
+        self.client.get(url)
+        self.client.get(url)
+        choice.question.vote(choice=choice, user=UserFactory())
+        response = self.client.get(url, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+        self.assertNotIn("Last-Modified", response)
+        self.assertContains(response, '">1</label>')
+
+    @override_settings(SHARED_FRAGMENT_CACHE=False, FRAGMENT_CACHE_LOCAL_TIMEOUT=60)
+    def test_local_versions_expire_etag(self):
+        """
+        Tests that unless the fragment cache is shared, pages are sent without
+        Last-Modified and their ETag changes with every window of
+        FRAGMENT_CACHE_LOCAL_TIMEOUT seconds.
+        """
+        with mock.patch("core.cache.time.time", return_value=600):
+            response = self.client.get(self.url)
+            etag = response["ETag"]
+            self.assertNotIn("Last-Modified", response)
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+        with mock.patch("core.cache.time.time", return_value=660):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
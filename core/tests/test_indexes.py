@@ -0,0 +1,144 @@
+"""
+Tests for the index checks defined in core app.
+"""
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+from articles.models import Article
+from core.indexes import PLACEHOLDER, is_served, missing_indexes, query_shapes
+from feeds.models import Feed
+from users.models import User
+
+
+class IsServedTestCase(SimpleTestCase):
+    """
+    Test class for is_served.
+    """
+
+    def test_index_starting_with_filtered_and_ordered_columns_serves_query(self):
+        """
+        Tests that an index on the equality columns then the ordering serves.
+        """
+        queryset = Feed.objects.filter(author=PLACEHOLDER).order_by("-created_at")
+        self.assertTrue(is_served(queryset, ["author_id", "-created_at"], {}))
+
+    def test_index_in_reverse_order_serves_query(self):
+        """
+        Tests that an index scanned backwards serves the query.
+        """
+        queryset = Feed.objects.order_by("created_at", "pk")
+        self.assertTrue(is_served(queryset, ["-created_at", "-id"], {}))
+
+    def test_index_without_filtered_column_does_not_serve_query(self):
+        """
+        Tests that an index not starting with the equality columns doesn't serve.
+        """
+        queryset = Feed.objects.filter(author=PLACEHOLDER).order_by("-created_at")
+        self.assertFalse(is_served(queryset, ["-created_at"], {}))
+
+    def test_partial_index_serves_queries_implying_its_condition(self):
+        """
+        Tests that a partial index only serves queries implying its condition.
+        """
+        condition = {"published_at": ("isnull", False)}
+        published = Article.objects.exclude(published_at=None)
+        drafts = Article.objects.filter(published_at=None)
+        self.assertTrue(is_served(published, ["-created_at"], condition))
+        self.assertFalse(is_served(drafts, ["-created_at"], condition))
+        self.assertFalse(is_served(Article.objects.all(), ["-created_at"], condition))
+
+    def test_partial_index_fixes_its_equality_columns(self):
+        """
+        Tests that the columns fixed by the condition of a partial index needn't
+        be indexed.
+        """
+        queryset = Feed.objects.filter(fanned_out=False, author=PLACEHOLDER)
+        queryset = queryset.order_by("-created_at")
+        self.assertTrue(
+            is_served(
+                queryset, ["author_id", "-created_at"], {"fanned_out": ("exact", False)}
+            )
+        )
+        self.assertFalse(
+            is_served(
+                queryset, ["author_id", "-created_at"], {"fanned_out": ("exact", True)}
+            )
+        )
+        self.assertFalse(is_served(queryset, ["author_id", "-created_at"], {}))
+
+    def test_index_on_column_with_several_values_serves_query(self):
+        """
+        Tests that a query comparing a column to several values is served by an
+        index starting with that column.
+        """
+        user = User(pk=PLACEHOLDER)
+        queryset = Feed.objects.pulled(user).order_by("-created_at")
+        condition = {"fanned_out": ("exact", False)}
+        self.assertTrue(is_served(queryset, ["author_id", "-created_at"], condition))
+        self.assertFalse(is_served(queryset, ["-created_at"], condition))
+
+
+class QueryShapesTestCase(SimpleTestCase):
+    """
+    Test class for query_shapes.
+    """
+
+    def test_shapes_are_built_from_the_list_views(self):
+        """
+        Tests that the querysets of the paginated list views and of their
+        subqueries are checked.
+        """
+        labels = {label for label, queryset in query_shapes()}
+        for label in (
+            "feeds:following feeds.Feed",
+            "feeds:following feeds.TimelineEntry",
+            "feeds:following users.Followership",
+            "users:profile category=answers questions.Answer",
+            "users:network filter=followees users.User",
+            "users:network filter=users users.User",
+        ):
+            self.assertIn(label, labels)
+
+    def test_shapes_are_ordered_like_the_pages(self):
+        """
+        Tests that the querysets are ordered by their paginators.
+        """
+        shapes = dict(query_shapes())
+        self.assertEqual(
+            shapes["feeds:following feeds.TimelineEntry"].query.order_by,
+            ("-created_at", "-feed"),
+        )
+        self.assertEqual(
+            shapes["users:network filter=users users.User"].query.order_by,
+            ("name", "pk"),
+        )
+
+
+class CheckIndexesTestCase(SimpleTestCase):
+    """
+    Test class for check_indexes command.
+    """
+
+    def test_every_view_query_is_served_by_an_index(self):
+        """
+        Tests that the models have an index for every query of the views.
+        """
+        self.assertEqual(missing_indexes(), [])
+
+    def test_command_reports_missing_indexes(self):
+        """
+        Tests that the command lists the queries no index serves and fails.
+        """
+        queryset = Feed.objects.filter(text="").order_by("modified_at")
+        out = StringIO()
+        with mock.patch(
+            "core.management.commands.check_indexes.missing_indexes",
+            return_value=[("feeds.Test", queryset)],
+        ):
+            with self.assertRaisesMessage(CommandError, "1 queries"):
+                call_command("check_indexes", stdout=out)
+        self.assertIn(
+            "feeds.Test: no index on feeds_feed (text, modified_at)", out.getvalue()
+        )
@@ -0,0 +1,122 @@
+"""
+Tests for the view metrics defined in core app.
+"""
+from unittest import mock
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from core.metrics import RollingHistogram, ViewMetrics, quantile, view_metrics
+from feeds.factories import FeedFactory
+from users.factories import UserFactory
+
+
+class RollingHistogramTestCase(TestCase):
+    """
+    Test class for RollingHistogram.
+    """
+
+    def test_values_are_counted_in_their_buckets(self):
+        """
+        Tests that values are counted in the first bucket they fit in.
+        """
+        histogram = RollingHistogram((1, 10), window=60, windows=2)
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value, now=0)
+        self.assertEqual(histogram.snapshot(now=0), ([2, 1, 1], 56.5))
+
+    def test_values_of_expired_windows_are_dropped(self):
+        """
+        Tests that values older than the windows are no longer counted.
+        """
+        histogram = RollingHistogram((1, 10), window=60, windows=2)
+        histogram.observe(5, now=0)
+        histogram.observe(0.5, now=60)
+        self.assertEqual(histogram.snapshot(now=119), ([1, 1, 0], 5.5))
+        self.assertEqual(histogram.snapshot(now=120), ([1, 0, 0], 0.5))
+
+    def test_quantile_returns_upper_bound_of_bucket(self):
+        """
+        Tests that quantile returns the bound of the bucket of the quantile.
+        """
+        self.assertEqual(quantile((1, 10), [9, 1, 0], 0.5), 1)
+        self.assertEqual(quantile((1, 10), [9, 1, 0], 0.95), 10)
+        self.assertIsNone(quantile((1, 10), [0, 0, 1], 0.5))
+
+
+class ViewMetricsTestCase(TestCase):
+    """
+    Test class for ViewMetrics.
+    """
+
+    def test_prometheus_returns_cumulative_buckets(self):
+        """
+        Tests that prometheus renders the histograms in the text format.
+        """
+        metrics = ViewMetrics()
+        metrics.observe("feeds:home", queries=3)
+        metrics.observe("feeds:home", queries=30)
+        text = metrics.prometheus()
+        self.assertIn("# TYPE view_queries histogram", text)
+        self.assertIn('view_queries_bucket{view="feeds:home",le="5"} 1', text)
+        self.assertIn('view_queries_bucket{view="feeds:home",le="+Inf"} 2', text)
+        self.assertIn('view_queries_sum{view="feeds:home"} 33', text)
+        self.assertIn('view_queries_count{view="feeds:home"} 2', text)
+
+    @override_settings(METRICS_WINDOW_SECONDS=60, METRICS_WINDOWS=1)
+    def test_prometheus_counts_never_decrease(self):
+        """
+        Tests that prometheus exports lifetime counts, which don't drop when the
+        windows of the summary expire.
+        """
+        metrics = ViewMetrics()
+        with mock.patch("core.metrics.time.monotonic", return_value=0):
+            metrics.observe("feeds:home", latency_seconds=0.1, queries=3)
+        with mock.patch("core.metrics.time.monotonic", return_value=120):
+            metrics.observe("feeds:home", latency_seconds=0.1, queries=3)
+            self.assertEqual(metrics.summary()[0]["requests"], 1)
+            text = metrics.prometheus()
+        self.assertIn('view_queries_count{view="feeds:home"} 2', text)
+
+
+@override_settings(METRICS_TOKEN="secret")
+class ViewMetricsMiddlewareTestCase(TestCase):
+    """
+    Test class for ViewMetricsMiddleware and the metrics views.
+    """
+
+    def setUp(self):
+        view_metrics.reset()
+
+    def test_requests_are_recorded_under_url_name(self):
+        """
+        Tests that the queries and latency of requests are recorded.
+        """
+        FeedFactory()
+        self.client.get(reverse("feeds:home"))
+        metrics = view_metrics.snapshot()["feeds:home"]
+        self.assertEqual(sum(metrics["latency_seconds"][0]), 1)
+        self.assertGreaterEqual(metrics["queries"][1], 1)
+        self.assertGreater(metrics["template_seconds"][1], 0)
+
+    def test_metrics_are_shown_to_staff_only(self):
+        """
+        Tests that the metrics page is forbidden to users who aren't staff.
+        """
+        self.client.force_login(UserFactory())
+        response = self.client.get(reverse("core:metrics"))
+        self.assertEqual(response.status_code, 403)
+        self.client.force_login(UserFactory(is_staff=True))
+        self.client.get(reverse("feeds:home"))
+        response = self.client.get(reverse("core:metrics"))
+        self.assertContains(response, "feeds:home")
+
+    def test_prometheus_accepts_bearer_token(self):
+        """
+        Tests that the Prometheus metrics are available with the token.
+        """
+        self.client.get(reverse("feeds:home"))
+        response = self.client.get(reverse("core:prometheus"))
+        self.assertEqual(response.status_code, 403)
+        response = self.client.get(
+            reverse("core:prometheus"), HTTP_AUTHORIZATION="Bearer secret"
+        )
+        self.assertContains(response, 'view_latency_seconds_count{view="feeds:home"} 1')
@@ -0,0 +1,141 @@
+"""
+Tests for models defined in core app.
+"""
+import time
+import uuid
+from django.template.loader import render_to_string
+from django.test import TestCase
+from articles.factories import ArticleFactory
+from articles.models import Article
+from core.cache import fragment_cache
+from core.models import excerpt, uuid7
+from feeds.factories import FeedFactory
+from feeds.models import Feed
+from questions.factories import AnswerFactory, QuestionFactory
+from questions.models import Answer, Question
+
+
+class UUID7TestCase(TestCase):
+    """
+    Test class for uuid7.
+    """
+
+    def test_returns_version_7_uuids(self):
+        """
+        Tests that uuid7 returns RFC 4122 UUIDs of version 7.
+        """
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_uuids_are_ordered_by_creation_time(self):
+        """
+        Tests that UUIDs created in later milliseconds sort after earlier ones.
+        """
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        self.assertLess(first, second)
+        self.assertLess(first.hex, second.hex)
+
+    def test_uuids_are_unique(self):
+        """
+        Tests that UUIDs created in the same millisecond differ.
+        """
+        self.assertEqual(len({uuid7() for _ in range(1000)}), 1000)
+
+
+class AuthoredQuerySetTestCase(TestCase):
+    """
+    Test class for AuthoredQuerySet.
+    """
+
+    def setUp(self):
+        fragment_cache().clear()
+
+    def test_for_list_selects_authors(self):
+        """
+        Tests that for_list loads the authors with the same query.
+        """
+        FeedFactory.create_batch(10)
+        with self.assertNumQueries(1):
+            names = [feed.author.name for feed in Feed.objects.for_list()]
+        self.assertEqual(len(names), 10)
+
+    def test_rendering_a_page_of_feeds_costs_one_query(self):
+        """
+        Tests that rendering a page of feeds doesn't query each author.
+        """
+        FeedFactory.create_batch(10)
+        with self.assertNumQueries(1):
+            render_to_string(
+                "feeds/_feed_list.html", {"feeds": Feed.objects.for_list()[:10]}
+            )
+
+    def test_rendering_answers_of_a_question_costs_one_query(self):
+        """
+        Tests that rendering the answers of a question doesn't query each author.
+        """
+        question = QuestionFactory()
+        AnswerFactory.create_batch(10, question=question)
+        with self.assertNumQueries(1):
+            render_to_string(
+                "questions/_answer_list.html",
+                {"answers": Answer.objects.filter(question=question).for_list()},
+            )
+
+    def test_for_list_defers_excerpted_fields(self):
+        """
+        Tests that lists showing excerpts don't load the excerpted fields.
+        """
+        ArticleFactory()
+        QuestionFactory()
+        article = Article.objects.for_list().get()
+        question = Question.objects.for_list().get()
+        self.assertEqual(article.get_deferred_fields(), {"text", "html"})
+        self.assertEqual(question.get_deferred_fields(), {"description"})
+
+    def test_answer_lists_load_text(self):
+        """
+        Tests that answer lists load the text they show, unlike excerpts.
+        """
+        AnswerFactory()
+        self.assertFalse(Answer.objects.for_list().get().get_deferred_fields())
+        self.assertEqual(
+            Answer.objects.for_excerpts().get().get_deferred_fields(), {"text"}
+        )
+
+    def test_rendering_a_page_of_articles_costs_one_query(self):
+        """
+        Tests that rendering a page of articles doesn't load their text.
+        """
+        ArticleFactory.create_batch(10)
+        with self.assertNumQueries(1):
+            render_to_string(
+                "articles/_article_list.html",
+                {"articles": Article.objects.for_list()[:10]},
+            )
+
+
+class ExcerptedModelTestCase(TestCase):
+    """
+    Test class for ExcerptedModel.
+    """
+
+    def test_excerpt(self):
+        """
+        Tests that excerpts collapse whitespace and are truncated.
+        """
+        self.assertEqual(excerpt("a\n\n  b"), "a b")
+        self.assertEqual(excerpt("abcdef", length=4), "abc…")
+
+    def test_save_updates_excerpt(self):
+        """
+        Tests that the excerpt follows the excerpted field on save.
+        """
+        question = QuestionFactory(description="Old description")
+        self.assertEqual(question.excerpt, "Old description")
+        question.description = "New description"
+        question.save(update_fields=["description"])
+        question.refresh_from_db()
+        self.assertEqual(question.excerpt, "New description")
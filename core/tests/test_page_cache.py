@@ -0,0 +1,153 @@
+"""
+Tests for the page cache of anonymous users.
+"""
+import time
+from unittest import mock
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from articles.factories import ArticleFactory
+from core.cache import get_version
+from core.page_cache import CachedPage, invalidate, page_cache, section, sections
+from feeds.factories import FeedFactory
+from feeds.models import Feed
+from questions.factories import AnswerFactory
+from questions.models import Answer, Question
+from users.factories import UserFactory
+
+
+@override_settings(PAGE_CACHE_TIMEOUT=30, PAGE_CACHE_STALE=300)
+class PageCacheMiddlewareTestCase(TestCase):
+    """
+    Test class for PageCacheMiddleware.
+    """
+
+    def setUp(self):
+        caches["pages"].clear()
+        caches["template_fragments"].clear()
+        self.url = reverse("feeds:home")
+        FeedFactory()
+
+    def lock(self, url):
+        request = mock.Mock(get_full_path=lambda: url)
+        return CachedPage(request, section(url)).lock()
+
+    def test_caches_anonymous_pages(self):
+        """
+        Tests that pages are served from the cache without queries.
+        """
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(first["X-Page-Cache"], "miss")
+        self.assertEqual(second["X-Page-Cache"], "hit")
+        self.assertEqual(first.content, second.content)
+
+    def test_keys_on_query_string(self):
+        """
+        Tests that pages with different query strings are cached separately.
+        """
+        self.client.get(self.url)
+        response = self.client.get(self.url + "?cursor=abc")
+        self.assertEqual(response["X-Page-Cache"], "miss")
+
+    def test_bypasses_authenticated_users(self):
+        """
+        Tests that pages of logged in users are neither cached nor served from
+        the cache.
+        """
+        self.client.get(self.url)
+        user = UserFactory()
+        self.client.force_login(user)
+        response = self.client.get(self.url)
+        self.assertNotIn("X-Page-Cache", response)
+        self.assertContains(response, user.name)
+        self.client.logout()
+        self.assertEqual(self.client.get(self.url)["X-Page-Cache"], "hit")
+
+    def test_ignores_other_paths(self):
+        """
+        Tests that pages outside of the cached sections aren't cached.
+        """
+        response = self.client.get(reverse("polls:home"))
+        self.assertNotIn("X-Page-Cache", response)
+
+    def test_write_regenerates_page(self):
+        """
+        Tests that the page is regenerated after a write to its section.
+        """
+        self.client.get(self.url)
+        FeedFactory(text="New feed")
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Page-Cache"], "miss")
+        self.assertContains(response, "New feed")
+        self.assertEqual(self.client.get(self.url)["X-Page-Cache"], "hit")
+
+    def test_serves_stale_page_while_regenerating(self):
+        """
+        Tests that the stale page is served while another request holds the
+        regeneration lock.
+        """
+        self.client.get(self.url)
+        FeedFactory(text="New feed")
+        self.assertTrue(self.lock(self.url))
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Page-Cache"], "stale")
+        self.assertNotContains(response, "New feed")
+
+    def test_expired_page_is_stale(self):
+        """
+        Tests that pages are stale after PAGE_CACHE_TIMEOUT seconds.
+        """
+        self.client.get(self.url)
+        later = time.time() + 31
+        with mock.patch("core.page_cache.time.time", return_value=later):
+            response = self.client.get(self.url)
+        self.assertEqual(response["X-Page-Cache"], "miss")
+
+    def test_write_keeps_other_sections(self):
+        """
+        Tests that a write only invalidates the sections showing its model.
+        """
+        self.client.get(self.url)
+        ArticleFactory()
+        self.assertEqual(self.client.get(self.url)["X-Page-Cache"], "hit")
+
+    def test_answer_invalidates_questions(self):
+        """
+        Tests that answering a question invalidates the questions section.
+        """
+        url = reverse("questions:home")
+        self.client.get(url)
+        AnswerFactory()
+        self.assertEqual(self.client.get(url)["X-Page-Cache"], "miss")
+
+    def test_generations_are_kept_in_page_cache(self):
+        """
+        Tests that the generations of the sections are kept with the pages.
+        """
+        generation = get_version("pages:/feeds/", page_cache())
+        invalidate(Feed)
+        self.assertEqual(get_version("pages:/feeds/", page_cache()), generation + 1)
+        self.assertEqual(get_version("pages:/feeds/"), 0)
+
+
+class SectionsTestCase(TestCase):
+    """
+    Test class for the section helpers.
+    """
+
+    def test_section(self):
+        """
+        Tests that paths are matched to the prefix of their section.
+        """
+        self.assertEqual(section("/feeds/abc/"), "/feeds/")
+        self.assertIsNone(section("/polls/"))
+
+    def test_sections(self):
+        """
+        Tests that models are matched to the sections showing them.
+        """
+        self.assertEqual(sections(Feed), ["/feeds/"])
+        self.assertEqual(sections(Answer), ["/questions/"])
+        self.assertEqual(sections(Question), ["/questions/"])
@@ -0,0 +1,119 @@
+"""
+Tests for cursor pagination defined in core app.
+"""
+from django.test import RequestFactory, TestCase
+from core.pagination import CursorPaginator, InvalidCursor
+from feeds.factories import FeedFactory
+from feeds.models import Feed
+from feeds.views import FeedList
+from users.factories import UserFactory
+from users.models import User
+
+
+class CursorPaginatorTestCase(TestCase):
+    """
+    Test class for CursorPaginator.
+    """
+
+    def setUp(self):
+        self.feeds = [FeedFactory() for _ in range(5)]
+        self.feeds.reverse()
+
+    def test_ordering_defaults_to_model_ordering_with_pk(self):
+        """
+        Tests that ordering defaults to the model ordering followed by pk.
+        """
+        paginator = CursorPaginator(Feed.objects.all(), 2)
+        self.assertEqual(paginator.ordering, ("-created_at", "-pk"))
+        paginator = CursorPaginator(User.objects.all(), 2)
+        self.assertEqual(paginator.ordering, ("name", "pk"))
+
+    def test_first_page(self):
+        """
+        Tests that the first page has a next cursor but no previous cursor.
+        """
+        page = CursorPaginator(Feed.objects.all(), 2).page()
+        self.assertEqual(list(page), self.feeds[:2])
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+
+    def test_next_cursors_walk_through_all_objects(self):
+        """
+        Tests that following next cursors returns every object once in order.
+        """
+        paginator = CursorPaginator(Feed.objects.all(), 2)
+        page = paginator.page()
+        feeds = list(page)
+        while page.has_next():
+            page = paginator.page(page.next_cursor)
+            self.assertTrue(page.has_previous())
+            feeds.extend(page)
+        self.assertEqual(feeds, self.feeds)
+
+    def test_previous_cursor_returns_previous_page(self):
+        """
+        Tests that the previous cursor returns the previous page.
+        """
+        paginator = CursorPaginator(Feed.objects.all(), 2)
+        second_page = paginator.page(paginator.page().next_cursor)
+        third_page = paginator.page(second_page.next_cursor)
+        page = paginator.page(third_page.previous_cursor)
+        self.assertEqual(list(page), list(second_page))
+        self.assertTrue(page.has_next())
+        first_page = paginator.page(page.previous_cursor)
+        self.assertEqual(list(first_page), self.feeds[:2])
+        self.assertFalse(first_page.has_previous())
+
+    def test_ties_on_ordering_field_are_broken_by_pk(self):
+        """
+        Tests that objects with the same ordering value are neither skipped
+        nor repeated.
+        """
+        user = UserFactory(name="same")
+        for _ in range(4):
+            UserFactory(name="same")
+        paginator = CursorPaginator(User.objects.all(), 2)
+        page = paginator.page()
+        users = list(page)
+        while page.has_next():
+            page = paginator.page(page.next_cursor)
+            users.extend(page)
+        self.assertEqual(len(users), User.objects.count())
+        self.assertEqual(set(users), set(User.objects.all()))
+        self.assertIn(user, users)
+
+    def test_invalid_cursor_raises_invalid_cursor(self):
+        """
+        Tests that an invalid cursor raises InvalidCursor.
+        """
+        paginator = CursorPaginator(Feed.objects.all(), 2)
+        with self.assertRaises(InvalidCursor):
+            paginator.page("invalid")
+
+
+class CursorPaginationMixinTestCase(TestCase):
+    """
+    Test class for CursorPaginationMixin.
+    """
+
+    def test_cursor_query_parameter_selects_page(self):
+        """
+        Tests that the cursor query parameter selects the page.
+        """
+        feeds = [FeedFactory() for _ in range(11)]
+        response = FeedList.as_view()(RequestFactory().get(""))
+        page = response.context_data["page_obj"]
+        self.assertEqual(len(response.context_data["feeds"]), 10)
+        self.assertTrue(page.has_next())
+        response = FeedList.as_view()(
+            RequestFactory().get("", {"cursor": page.next_cursor})
+        )
+        self.assertEqual(list(response.context_data["feeds"]), [feeds[0]])
+
+    def test_invalid_cursor_returns_first_page(self):
+        """
+        Tests that an invalid cursor returns the first page.
+        """
+        feed = FeedFactory()
+        response = FeedList.as_view()(RequestFactory().get("", {"cursor": "x"}))
+        self.assertEqual(list(response.context_data["feeds"]), [feed])
@@ -0,0 +1,157 @@
+"""
+Tests for the number of SQL queries issued by every view in config.urls.
+
+The views are rendered against QUERY_BUDGET_SEED_SIZE users with a feed, an
+article, a question, an answer and a poll each, so query counts growing with
+the data, such as N+1 queries, exceed the budgets.
+"""
+from django.conf import settings
+from django.test import TestCase
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils import timezone
+from articles.factories import ArticleFactory
+from core.cache import fragment_cache
+from core.testing import QueryBudgetMixin
+from feeds.factories import FeedFactory
+from polls.factories import ChoiceFactory, QuestionFactory as PollFactory
+from questions.factories import AnswerFactory, QuestionFactory
+from users.factories import UserFactory
+
+# The url name, a function returning the url arguments from the test case, the
+# POST data from the test case or None for GET requests, the client requesting
+# the view, "user", "staff" or None for anonymous, the expected status code and
+# the maximum number of queries of each view. Requests of logged-in users cost
+# two queries for the session and user.
+BUDGETS = [
+    ("home", lambda data: {}, None, "user", 302, 0),
+    ("articles:home", lambda data: {}, None, "user", 200, 3),
+    ("articles:detail", lambda data: {"pk": data.article.pk}, None, "user", 200, 5),
+    ("articles:create", lambda data: {}, None, "user", 200, 2),
+    ("articles:drafts", lambda data: {}, None, "user", 200, 3),
+    ("articles:edit", lambda data: {"pk": data.draft.pk}, None, "user", 200, 4),
+    ("feeds:home", lambda data: {}, None, "user", 200, 3),
+    ("feeds:following", lambda data: {}, None, "user", 200, 3),
+    ("feeds:create", lambda data: {}, lambda data: {"text": "Hello"}, "user", 302, 15),
+    ("feeds:thread", lambda data: {"pk": data.feed.pk}, None, "user", 200, 4),
+    ("core:metrics", lambda data: {}, None, "staff", 200, 2),
+    ("core:prometheus", lambda data: {}, None, "staff", 200, 2),
+    ("polls:home", lambda data: {}, None, "user", 200, 3),
+    ("polls:create", lambda data: {}, None, "user", 200, 3),
+    ("polls:detail", lambda data: {"pk": data.poll.pk}, None, "user", 200, 6),
+    (
+        "polls:vote",
+        lambda data: {"pk": data.poll.pk},
+        lambda data: {"choice": data.choice.pk},
+        "user",
+        302,
+        9,
+    ),
+    ("questions:home", lambda data: {}, None, "user", 200, 3),
+    ("questions:create", lambda data: {}, None, "user", 200, 2),
+    ("questions:edit", lambda data: {"pk": data.question.pk}, None, "user", 200, 3),
+    ("questions:detail", lambda data: {"pk": data.question.pk}, None, "user", 200, 6),
+    ("questions:answer", lambda data: {"pk": data.question.pk}, None, "user", 200, 2),
+    (
+        "questions:answer_edit",
+        lambda data: {"question_pk": data.question.pk, "pk": data.answer.pk},
+        None,
+        "user",
+        200,
+        4,
+    ),
+    ("search:home", lambda data: {}, None, "user", 200, 5),
+    # One query for each category found in the results.
+    ("search:home", lambda data: {"category": "all"}, None, "user", 200, 10),
+    ("search:home", lambda data: {"category": "users"}, None, "user", 200, 5),
+    # Logged-in users are redirected away from the signup and login pages, so
+    # they are requested anonymously.
+    ("users:signup", lambda data: {}, None, None, 200, 0),
+    ("users:login", lambda data: {}, None, None, 200, 0),
+    ("users:logout", lambda data: {}, None, "user", 302, 4),
+    ("users:profile", lambda data: {"pk": data.user.pk}, None, "user", 200, 6),
+    (
+        "users:profile",
+        lambda data: {"pk": data.user.pk, "category": "answers"},
+        None,
+        "user",
+        200,
+        6,
+    ),
+    ("users:follow", lambda data: {"pk": data.other.pk}, None, "user", 302, 10),
+    ("users:unfollow", lambda data: {"pk": data.other.pk}, None, "user", 302, 10),
+    ("users:network", lambda data: {"filter": "followees"}, None, "user", 200, 3),
+    ("users:network", lambda data: {"filter": "users"}, None, "user", 200, 3),
+]
+
+
+def url_names(patterns, namespace=None):
+    """
+    Returns the names of the url patterns, skipping the admin site.
+    """
+    names = set()
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace != "admin":
+                names |= url_names(pattern.url_patterns, pattern.namespace)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            names.add(
+                "%s:%s" % (namespace, pattern.name) if namespace else pattern.name
+            )
+    return names
+
+
+class QueryBudgetTestCase(QueryBudgetMixin, TestCase):
+    """
+    Test class for the query budgets of the views.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.staff = UserFactory(is_staff=True)
+        cls.other = UserFactory()
+        cls.other.follow(user=cls.user)
+        for _ in range(settings.QUERY_BUDGET_SEED_SIZE):
+            author = UserFactory()
+            author.follow(user=cls.user)
+            cls.feed = FeedFactory(author=author)
+            FeedFactory(author=cls.user, parent=cls.feed)
+            cls.article = ArticleFactory(author=author, published_at=timezone.now())
+            cls.question = QuestionFactory(author=cls.user)
+            cls.answer = AnswerFactory(author=cls.user, question=cls.question)
+            AnswerFactory(author=author, question=cls.question)
+            cls.poll = PollFactory(author=author)
+            cls.choice = ChoiceFactory.create_batch(3, question=cls.poll)[0]
+        cls.draft = ArticleFactory(author=cls.user)
+
+    def setUp(self):
+        fragment_cache().clear()
+
+    def test_every_view_has_a_budget(self):
+        """
+        Tests that every url in config.urls has a query budget.
+        """
+        budgeted = {name for name, *rest in BUDGETS}
+        self.assertSetEqual(url_names(get_resolver().url_patterns) - budgeted, set())
+
+    def test_views_stay_within_their_budgets(self):
+        """
+        Tests that the views answer their clients with the expected status
+        within their budgets.
+        """
+        users = {"user": self.user, "staff": self.staff}
+        for name, kwargs, data, client, status, max_queries in BUDGETS:
+            url = reverse(name, kwargs=kwargs(self))
+            self.client.logout()
+            if client is not None:
+                self.client.force_login(users[client])
+            with self.subTest(url=url, client=client):
+                with self.assertQueryBudget(
+                    max_queries, settings.QUERY_BUDGET_MAX_TIME
+                ):
+                    if data is not None:
+                        response = self.client.post(url, data(self))
+                    else:
+                        params = {"q": "a"} if name == "search:home" else {}
+                        response = self.client.get(url, params)
+                self.assertEqual(response.status_code, status)
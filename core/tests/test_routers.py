@@ -0,0 +1,129 @@
+"""
+Tests for the database router and middleware defined in core app.
+
+TransactionTestCase is used since reads inside transactions, such as the ones
+wrapping TestCase tests, always go to the primary.
+"""
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TransactionTestCase, override_settings
+from core import routers
+from core.middleware import ReplicaStickinessMiddleware
+from core.routers import ReplicaRouter
+from feeds.models import Feed
+from users.factories import UserFactory
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaRouterTestCase(TransactionTestCase):
+    """
+    Test class for ReplicaRouter.
+    """
+
+    def test_reads_go_to_replicas(self):
+        """
+        Tests that reads outside of pinned requests go to a replica.
+        """
+        self.assertEqual(ReplicaRouter().db_for_read(Feed), "replica")
+
+    def test_writes_go_to_primary(self):
+        """
+        Tests that writes go to the primary database.
+        """
+        self.assertEqual(ReplicaRouter().db_for_write(Feed), "default")
+
+    def test_reads_without_replicas_are_not_routed(self):
+        """
+        Tests that reads are left to the default database without replicas.
+        """
+        with self.settings(DATABASE_REPLICAS=[]):
+            self.assertIsNone(ReplicaRouter().db_for_read(Feed))
+
+    def test_reads_in_transactions_go_to_primary(self):
+        """
+        Tests that reads inside a transaction on the primary go to the primary.
+        """
+        with transaction.atomic():
+            self.assertEqual(ReplicaRouter().db_for_read(Feed), "default")
+
+    def test_reads_of_pinned_requests_go_to_primary(self):
+        """
+        Tests that reads of requests pinned to the primary go to the primary.
+        """
+        token = routers.begin_request(use_primary=True)
+        try:
+            self.assertEqual(ReplicaRouter().db_for_read(Feed), "default")
+        finally:
+            routers.end_request(token)
+
+    def test_reads_after_a_write_go_to_primary(self):
+        """
+        Tests that reads of a request following its writes go to the primary.
+        """
+        router = ReplicaRouter()
+        token = routers.begin_request(use_primary=False)
+        try:
+            self.assertEqual(router.db_for_read(Feed), "replica")
+            router.db_for_write(Feed)
+            self.assertEqual(router.db_for_read(Feed), "default")
+        finally:
+            self.assertTrue(routers.end_request(token))
+
+    def test_replicas_are_not_migrated(self):
+        """
+        Tests that migrations are only applied to the primary.
+        """
+        self.assertFalse(ReplicaRouter().allow_migrate("replica", "feeds"))
+        self.assertIsNone(ReplicaRouter().allow_migrate("default", "feeds"))
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], DATABASE_REPLICA_STICKINESS=5)
+class ReplicaStickinessMiddlewareTestCase(TransactionTestCase):
+    """
+    Test class for ReplicaStickinessMiddleware.
+    """
+
+    def get_response(self, request):
+        self.read_db = ReplicaRouter().db_for_read(Feed)
+        if request.GET.get("write"):
+            ReplicaRouter().db_for_write(Feed)
+        return HttpResponse()
+
+    def test_safe_requests_read_from_replicas(self):
+        """
+        Tests that GET requests of clients which didn't write read replicas.
+        """
+        request = RequestFactory().get("/")
+        response = ReplicaStickinessMiddleware(self.get_response)(request)
+        self.assertEqual(self.read_db, "replica")
+        self.assertNotIn("use_primary", response.cookies)
+
+    def test_unsafe_requests_read_from_primary(self):
+        """
+        Tests that POST requests read from the primary.
+        """
+        request = RequestFactory().post("/")
+        ReplicaStickinessMiddleware(self.get_response)(request)
+        self.assertEqual(self.read_db, "default")
+
+    def test_writes_pin_the_client_to_primary(self):
+        """
+        Tests that a request writing sets the stickiness cookie and the next
+        requests of the client read from the primary.
+        """
+        request = RequestFactory().get("/", {"write": "1"})
+        response = ReplicaStickinessMiddleware(self.get_response)(request)
+        cookie = response.cookies["use_primary"]
+        self.assertEqual(cookie["max-age"], 5)
+        request = RequestFactory().get("/")
+        request.COOKIES["use_primary"] = cookie.value
+        ReplicaStickinessMiddleware(self.get_response)(request)
+        self.assertEqual(self.read_db, "default")
+
+    def test_related_reads_use_the_database_of_the_instance(self):
+        """
+        Tests that reads of related objects use the database of the instance.
+        """
+        user = UserFactory()
+        user._state.db = "default"
+        self.assertEqual(ReplicaRouter().db_for_read(Feed, instance=user), "default")
@@ -0,0 +1,87 @@
+"""
+Tests for the slow query log defined in core app.
+"""
+import json
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import resolve
+from core.cache import fragment_cache
+from core.metrics import view_metrics
+from core.middleware import SlowQueryLogMiddleware, ViewMetricsMiddleware
+from feeds.factories import FeedFactory
+from feeds.models import Feed
+
+
+@override_settings(SLOW_QUERY_THRESHOLD_MS=1e-9, SLOW_QUERY_ANALYZE_RATE=0)
+class SlowQueryLogMiddlewareTestCase(TestCase):
+    """
+    Test class for SlowQueryLogMiddleware.
+    """
+
+    def setUp(self):
+        fragment_cache().clear()
+
+    def get_records(self, get_response):
+        request = RequestFactory().get("/feeds/")
+        request.resolver_match = resolve("/feeds/")
+        with self.assertLogs("core.slow_queries") as logs:
+            SlowQueryLogMiddleware(get_response)(request)
+        return [json.loads(record.getMessage()) for record in logs.records]
+
+    def test_slow_queries_are_logged_with_their_plan(self):
+        """
+        Tests that queries above the threshold are logged with their plan.
+        """
+
+        def get_response(request):
+            list(Feed.objects.filter(text="Hello"))
+            return HttpResponse()
+
+        [record] = self.get_records(get_response)
+        self.assertIn("feeds_feed", record["sql"])
+        self.assertNotIn("params", record)
+        self.assertNotIn("Hello", json.dumps(record))
+        self.assertEqual(record["view"], "feeds:home")
+        self.assertIn("feeds_feed", record["plan"])
+        self.assertIsNone(record["template"])
+
+    def test_queries_issued_by_templates_are_logged_with_template_line(self):
+        """
+        Tests that queries issued while rendering a template log its line.
+        """
+        FeedFactory()
+
+        def get_response(request):
+            return HttpResponse(
+                render_to_string("feeds/_feed_list.html", {"feeds": Feed.objects.all()})
+            )
+
+        records = self.get_records(get_response)
+        self.assertRegex(records[0]["template"], r"feeds/_feed_list\.html:\d+$")
+
+    def test_explain_is_not_counted_as_view_query(self):
+        """
+        Tests that the EXPLAIN of a slow query isn't recorded as a query of the
+        view by ViewMetricsMiddleware.
+        """
+
+        def get_response(request):
+            list(Feed.objects.filter(text="Hello"))
+            return HttpResponse()
+
+        view_metrics.reset()
+        request = RequestFactory().get("/feeds/")
+        request.resolver_match = resolve("/feeds/")
+        with self.assertLogs("core.slow_queries"):
+            ViewMetricsMiddleware(SlowQueryLogMiddleware(get_response))(request)
+        self.assertEqual(view_metrics.snapshot()["feeds:home"]["queries"][1], 1)
+
+    def test_log_is_disabled_without_threshold(self):
+        """
+        Tests that the middleware isn't used unless a threshold is set.
+        """
+        with self.settings(SLOW_QUERY_THRESHOLD_MS=0):
+            with self.assertRaises(MiddlewareNotUsed):
+                SlowQueryLogMiddleware(lambda request: HttpResponse())
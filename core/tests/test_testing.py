@@ -0,0 +1,38 @@
+"""
+Tests for test utilities defined in core app.
+"""
+from django.test import TestCase
+from core.testing import QueryBudgetMixin
+from users.factories import UserFactory
+from users.models import User
+
+
+class QueryBudgetMixinTestCase(QueryBudgetMixin, TestCase):
+    """
+    Test class for QueryBudgetMixin.
+    """
+
+    def test_block_within_budget_passes(self):
+        """
+        Tests that a block executing as many queries as the budget passes.
+        """
+        UserFactory()
+        with self.assertQueryBudget(1):
+            list(User.objects.all())
+
+    def test_block_exceeding_query_budget_fails(self):
+        """
+        Tests that a block executing more queries than the budget fails.
+        """
+        with self.assertRaisesMessage(AssertionError, "2 queries executed"):
+            with self.assertQueryBudget(1):
+                list(User.objects.all())
+                list(User.objects.all())
+
+    def test_block_exceeding_time_budget_fails(self):
+        """
+        Tests that a block spending more time in queries than the budget fails.
+        """
+        with self.assertRaisesMessage(AssertionError, "Queries took"):
+            with self.assertQueryBudget(1, max_time=-1):
+                list(User.objects.all())
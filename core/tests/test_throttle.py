@@ -0,0 +1,114 @@
+"""
+Tests for the token buckets defined in core app.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from django.core.cache import caches
+from django.test import RequestFactory, SimpleTestCase
+from core.throttle import TokenBucket, client_ip, too_many_requests
+
+
+class TokenBucketTestCase(SimpleTestCase):
+    """
+    Test class for TokenBucket.
+    """
+
+    def test_consumes_burst_then_waits(self):
+        """
+        Tests that capacity requests pass before the next has to wait.
+        """
+        bucket = TokenBucket("test", 2, 10)
+        self.assertEqual(bucket.consume("key", now=0), 0)
+        self.assertEqual(bucket.consume("key", now=0), 0)
+        self.assertEqual(bucket.consume("key", now=0), 10)
+        self.assertEqual(bucket.consume("other", now=0), 0)
+
+    def test_refills(self):
+        """
+        Tests that a token is added every refill_seconds seconds.
+        """
+        bucket = TokenBucket("test", 1, 10)
+        bucket.consume("key", now=0)
+        self.assertEqual(bucket.consume("key", now=4), 6)
+        self.assertEqual(bucket.consume("key", now=10), 0)
+
+    def test_drops_full_local_buckets(self):
+        """
+        Tests that full in-memory buckets are dropped past max_local_buckets.
+        """
+        bucket = TokenBucket("test", 1, 10)
+        bucket.max_local_buckets = 1
+        bucket.consume("old", now=0)
+        bucket.consume("new", now=20)
+        self.assertEqual(list(bucket._buckets), ["new"])
+
+    def test_shared_cache(self):
+        """
+        Tests that buckets with a cache alias are shared through the cache.
+        """
+        caches["default"].clear()
+        TokenBucket("shared", 1, 10, cache="default").consume("key", now=0)
+        bucket = TokenBucket("shared", 1, 10, cache="default")
+        self.assertEqual(bucket.consume("key", now=0), 10)
+
+    def test_shared_buckets_are_atomic(self):
+        """
+        Tests that concurrent buckets of several processes sharing a cache grant
+        no more than capacity tokens.
+        """
+        caches["default"].clear()
+
+        def consume(_):
+            bucket = TokenBucket("atomic", 5, 10, cache="default")
+            return bucket.consume("key", now=0)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            waits = list(executor.map(consume, range(20)))
+        self.assertEqual(waits.count(0), 5)
+        self.assertEqual(set(waits) - {0}, {50})
+
+    def test_shared_buckets_refill_per_window(self):
+        """
+        Tests that shared buckets are refilled once their window has passed.
+        """
+        caches["default"].clear()
+        bucket = TokenBucket("window", 2, 10, cache="default")
+        bucket.consume("key", now=0)
+        bucket.consume("key", now=5)
+        self.assertEqual(bucket.consume("key", now=15), 5)
+        self.assertEqual(bucket.consume("key", now=20), 0)
+
+    def test_too_many_requests(self):
+        """
+        Tests that 429 responses round Retry-After up to whole seconds.
+        """
+        response = too_many_requests(2.5)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "3")
+
+
+class ClientIpTestCase(SimpleTestCase):
+    """
+    Test class for client_ip.
+    """
+
+    def test_reads_remote_addr_without_proxies(self):
+        """
+        Tests that X-Forwarded-For is ignored without proxies.
+        """
+        request = RequestFactory().get(
+            "", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="1.2.3.4"
+        )
+        self.assertEqual(client_ip(request), "10.0.0.1")
+
+    def test_reads_address_appended_by_proxies(self):
+        """
+        Tests that the address appended by the nearest of the trusted proxies
+        is returned, ignoring the addresses set by the client.
+        """
+        request = RequestFactory().get(
+            "",
+            REMOTE_ADDR="10.0.0.2",
+            HTTP_X_FORWARDED_FOR="6.6.6.6, 1.2.3.4, 10.0.0.1",
+        )
+        self.assertEqual(client_ip(request, proxies=1), "10.0.0.1")
+        self.assertEqual(client_ip(request, proxies=2), "1.2.3.4")
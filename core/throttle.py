@@ -0,0 +1,114 @@
+"""
+Contains the token buckets requests are throttled with.
+
+Buckets are kept in the memory of the process, or in a cache shared by the
+processes when a cache alias is given. Shared buckets are updated with atomic
+add and incr, so the cache must implement incr atomically like memcached and
+redis do.
+"""
+import math
+import threading
+import time
+from django.core.cache import caches
+from django.http import HttpResponse
+
+
+def client_ip(request, proxies=0):
+    """
+    Returns the address of the client of request behind proxies reverse
+    proxies.
+
+    Each proxy appends the address it got the request from to X-Forwarded-For,
+    so the client's is the proxies-th from the end, the addresses before it
+    being set by the client.
+    """
+    if proxies:
+        forwarded = request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")
+        forwarded = [address.strip() for address in forwarded if address.strip()]
+        if forwarded:
+            return forwarded[-min(proxies, len(forwarded))]
+    return request.META.get("REMOTE_ADDR")
+
+
+def too_many_requests(retry_after):
+    """
+    Returns a 429 response asking the client to retry after retry_after
+    seconds.
+    """
+    return HttpResponse(
+        "Too many requests, please retry later.",
+        status=429,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        content_type="text/plain",
+    )
+
+
+class TokenBucket:
+    """
+    Token buckets holding up to capacity tokens per key and refilled with one
+    token every refill_seconds seconds. Each request consumes a token.
+    """
+
+    # Number of in-memory buckets kept before the full ones are dropped.
+    max_local_buckets = 10000
+
+    def __init__(self, name, capacity, refill_seconds, cache=None):
+        self.name = name
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self.cache = caches[cache] if cache else None
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def _key(self, key):
+        return "throttle:%s:%s" % (self.name, key)
+
+    def _consume_shared(self, key, now):
+        """
+        Counts the tokens consumed from the cache per window of capacity times
+        refill_seconds seconds, which refills the same number of tokens.
+
+        The cache can't update the state of a bucket atomically, so the count
+        is kept in a counter created with add and incremented with incr.
+        """
+        period = self.capacity * self.refill_seconds
+        window = int(now // period)
+        cache_key = "%s:%d" % (self._key(key), window)
+        self.cache.add(cache_key, 0, period)
+        try:
+            count = self.cache.incr(cache_key)
+        except ValueError:
+            # The counter expired between add and incr.
+            self.cache.add(cache_key, 1, period)
+            count = 1
+        if count > self.capacity:
+            return (window + 1) * period - now
+        return 0
+
+    def _consume_local(self, key, now):
+        tokens, updated = self._buckets.get(key) or (self.capacity, now)
+        tokens = min(self.capacity, tokens + (now - updated) / self.refill_seconds)
+        wait = 0
+        if tokens < 1:
+            wait = (1 - tokens) * self.refill_seconds
+        else:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_local_buckets:
+            self._buckets = {
+                key: (tokens, updated)
+                for key, (tokens, updated) in self._buckets.items()
+                if tokens + (now - updated) / self.refill_seconds < self.capacity
+            }
+        return wait
+
+    def consume(self, key, now=None):
+        """
+        Consumes a token of the bucket of key, returning 0 or the seconds to
+        wait for a token if the bucket is empty.
+        """
+        now = time.time() if now is None else now
+        if self.cache is not None:
+            return self._consume_shared(key, now)
+        with self._lock:
+            return self._consume_local(key, now)
@@ -0,0 +1,11 @@
+"""
+Urls for core app.
+"""
+from django.urls import path
+from core.views import Metrics, PrometheusMetrics
+
+app_name = "core"
+urlpatterns = [
+    path("", Metrics.as_view(), name="metrics"),
+    path("prometheus/", PrometheusMetrics.as_view(), name="prometheus"),
+]
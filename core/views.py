@@ -1,3 +1,52 @@
-from django.shortcuts import render
+"""
+Views for core app.
+"""
+from django.conf import settings
+from django.contrib.auth.mixins import UserPassesTestMixin
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views import generic, View
+from core.metrics import view_metrics
 
-# Create your views here.
+
+class Metrics(UserPassesTestMixin, generic.TemplateView):
+    """
+    View class listing the recent metrics of the views, for staff only.
+    """
+
+    template_name = "core/metrics.html"
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get_context_data(self, **kwargs):
+        context_data = super().get_context_data(**kwargs)
+        context_data["rows"] = view_metrics.summary()
+        context_data["window"] = (
+            settings.METRICS_WINDOW_SECONDS * settings.METRICS_WINDOWS
+        )
+        return context_data
+
+
+class PrometheusMetrics(View):
+    """
+    View class exposing the metrics of the views to Prometheus.
+
+    Available to staff users and to scrapers sending METRICS_TOKEN as a bearer
+    token.
+    """
+
+    def has_access(self, request):
+        token = settings.METRICS_TOKEN
+        authorization = request.headers.get("Authorization", "")
+        if token and constant_time_compare(authorization, "Bearer %s" % token):
+            return True
+        return request.user.is_staff
+
+    def get(self, request, *args, **kwargs):
+        if not self.has_access(request):
+            raise PermissionDenied
+        return HttpResponse(
+            view_metrics.prometheus(), content_type="text/plain; version=0.0.4"
+        )
@@ -0,0 +1,44 @@
+"""
+Management command fanning out the new feeds.
+"""
+import time
+from django.core.management.base import BaseCommand
+from feeds.models import Feed
+
+
+class Command(BaseCommand):
+    """
+    Fans out the pending feeds in batches, once or every interval seconds.
+    """
+
+    help = "Adds the new feeds to the timelines of their authors' followers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Seconds between runs, runs once if 0.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of feeds fetched per query.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                processed = Feed.objects.fan_out_pending(
+                    batch_size=options["batch_size"]
+                )
+                if processed or not options["interval"]:
+                    self.stdout.write(
+                        self.style.SUCCESS("Fanned out %d feeds." % processed)
+                    )
+                if not options["interval"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
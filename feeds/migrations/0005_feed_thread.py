@@ -0,0 +1,59 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def index_threads(apps, schema_editor):
+    """
+    Sets the thread and depth of the existing feeds level by level.
+    """
+    Feed = apps.get_model("feeds", "Feed")
+    roots = Feed.objects.filter(parent=None)
+    for feed in roots.only("pk").iterator():
+        Feed.objects.filter(pk=feed.pk).update(thread=feed.pk, depth=0)
+    depth = 0
+    level = list(roots.values_list("pk", "pk"))
+    while level:
+        depth += 1
+        threads = dict(level)
+        level = list(
+            Feed.objects.filter(parent__in=list(threads)).values_list("pk", "parent")
+        )
+        for pk, parent in level:
+            Feed.objects.filter(pk=pk).update(thread=threads[parent], depth=depth)
+        level = [(pk, threads[parent]) for pk, parent in level]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("feeds", "0004_timelineentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feed",
+            name="depth",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="feed",
+            name="thread",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="thread_feeds",
+                to="feeds.feed",
+            ),
+        ),
+        migrations.RunPython(index_threads, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                fields=["thread", "created_at"], name="feed_thread_created_idx"
+            ),
+        ),
+    ]
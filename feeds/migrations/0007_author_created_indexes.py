@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("feeds", "0006_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(fields=["-created_at", "-id"], name="feed_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                fields=["author", "-created_at", "-id"], name="feed_author_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 4.2.16 on 2026-10-18 10:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fan_out_existing(apps, schema_editor):
+    """
+    Fans out the latest FEEDS_TIMELINE_BACKFILL feeds of each author written
+    before feeds were fanned out, older ones are left out of the timelines like
+    when following an author. Feeds of authors over the fan out limit are
+    marked pulled.
+    """
+    Feed = apps.get_model("feeds", "Feed")
+    TimelineEntry = apps.get_model("feeds", "TimelineEntry")
+    Followership = apps.get_model("users", "Followership")
+    limit = settings.FEEDS_FANOUT_LIMIT
+    pending = Feed.objects.filter(fanned_out=False, pulled=False)
+    authors = list(pending.order_by().values_list("author", flat=True).distinct())
+    for author in authors:
+        feeds = pending.filter(author=author)
+        owners = list(
+            Followership.objects.filter(followee=author).values_list(
+                "follower", flat=True
+            )[: limit + 1]
+        )
+        if len(owners) > limit:
+            feeds.update(pulled=True)
+            continue
+        owners.append(author)
+        latest = feeds.order_by("-created_at").values_list("pk", "created_at")[
+            : settings.FEEDS_TIMELINE_BACKFILL
+        ]
+        TimelineEntry.objects.bulk_create(
+            [
+                TimelineEntry(owner_id=owner, feed_id=pk, created_at=created_at)
+                for pk, created_at in latest
+                for owner in owners
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+        feeds.update(fanned_out=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("feeds", "0007_author_created_indexes"),
+        ("users", "0005_unique_followership"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="timelineentry",
+            name="timeline_owner_created_idx",
+        ),
+        migrations.AddField(
+            model_name="feed",
+            name="pulled",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                condition=models.Q(("fanned_out", False)),
+                fields=["author", "-created_at", "-id"],
+                name="feed_pulled_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                condition=models.Q(("fanned_out", False), ("pulled", False)),
+                fields=["created_at"],
+                name="feed_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="timelineentry",
+            index=models.Index(
+                fields=["owner", "-created_at", "-feed"],
+                name="timeline_owner_created_idx",
+            ),
+        ),
+        migrations.RunPython(fan_out_existing, migrations.RunPython.noop),
+    ]
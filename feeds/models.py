@@ -1,10 +1,59 @@
 """
 Models for feeds app.
 """
-import uuid
 from django.conf import settings
-from django.db import models
-from core.models import TimeStampedModel
+from django.db import models, transaction
+from django.urls import reverse
+from core.models import AuthoredQuerySet, TimeStampedModel, uuid7
+
+
+class FeedQuerySet(AuthoredQuerySet):
+    """
+    QuerySet class for Feed model.
+    """
+
+    def pulled(self, user):
+        """
+        Returns the feeds of the user and of the users they follow which are
+        not in the timeline entries, i.e. the feeds of authors with too many
+        followers to fan out and the feeds waiting to be fanned out.
+        """
+        return self.filter(fanned_out=False).filter(
+            models.Q(author=user) | models.Q(author__in=user.followees.values("pk"))
+        )
+
+    def pending(self):
+        """
+        Returns the feeds waiting to be fanned out.
+        """
+        return self.filter(fanned_out=False, pulled=False)
+
+    def fan_out_pending(self, batch_size=100):
+        """
+        Fans out the pending feeds oldest first and returns their number.
+        """
+        processed = 0
+        while True:
+            feeds = list(
+                self.pending()
+                .select_related("author")
+                .order_by("created_at")[:batch_size]
+            )
+            for feed in feeds:
+                feed.fan_out()
+            processed += len(feeds)
+            if len(feeds) < batch_size:
+                return processed
+
+    def thread(self, feed):
+        """
+        Returns all the feeds of the thread feed belongs to with one query.
+        """
+        return (
+            self.filter(thread_id=feed.thread_id or feed.pk)
+            .for_list()
+            .order_by("created_at")
+        )
 
 
 class Feed(TimeStampedModel):
@@ -12,7 +61,7 @@ class Feed(TimeStampedModel):
     Class for Feed model.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     text = models.CharField(max_length=280)
     author = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="feeds"
@@ -20,9 +69,162 @@ class Feed(TimeStampedModel):
     parent = models.ForeignKey(
         "self", on_delete=models.CASCADE, blank=True, null=True, related_name="children"
     )
+    thread = models.ForeignKey(
+        "self",
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        editable=False,
+        related_name="thread_feeds",
+    )
+    depth = models.PositiveIntegerField(default=0, editable=False)
+    fanned_out = models.BooleanField(default=False, editable=False)
+    pulled = models.BooleanField(default=False, editable=False)
+
+    objects = FeedQuerySet.as_manager()
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="feed_created_idx"),
+            models.Index(
+                fields=["author", "-created_at", "-id"], name="feed_author_created_idx"
+            ),
+            models.Index(
+                fields=["thread", "created_at"], name="feed_thread_created_idx"
+            ),
+            models.Index(
+                fields=["author", "-created_at", "-id"],
+                name="feed_pulled_idx",
+                condition=models.Q(fanned_out=False),
+            ),
+            models.Index(
+                fields=["created_at"],
+                name="feed_pending_idx",
+                condition=models.Q(fanned_out=False, pulled=False),
+            ),
+        ]
 
     def __str__(self):
         return self.text
+
+    def get_absolute_url(self):
+        """
+        Returns the url of the thread of the feed.
+        """
+        return reverse("feeds:thread", args=[self.pk])
+
+    def save(self, *args, **kwargs):
+        if self.thread_id is None:
+            if self.parent_id is None:
+                self.thread_id = self.pk
+                self.depth = 0
+            else:
+                self.thread_id = self.parent.thread_id or self.parent_id
+                self.depth = self.parent.depth + 1
+        super().save(*args, **kwargs)
+
+    def get_thread(self):
+        """
+        Returns the feeds of the thread in depth first order.
+
+        The whole thread is fetched with one query and ordered in linear time,
+        each feed keeps its depth in the thread for indentation.
+        """
+        feeds = list(Feed.objects.thread(self))
+        children = {}
+        for feed in feeds:
+            children.setdefault(feed.parent_id, []).append(feed)
+        roots = [feed for feed in feeds if feed.pk == feed.thread_id]
+        ordered = []
+        stack = list(reversed(roots))
+        while stack:
+            feed = stack.pop()
+            ordered.append(feed)
+            stack.extend(reversed(children.get(feed.pk, [])))
+        return ordered
+
+    def fan_out(self):
+        """
+        Adds the feed to the timelines of its author and the author's followers.
+
+        Feeds of authors with more than FEEDS_FANOUT_LIMIT followers are marked
+        pulled instead, the readers pull them at read time.
+        """
+        limit = settings.FEEDS_FANOUT_LIMIT
+        owners = list(self.author.followers.values_list("pk", flat=True)[: limit + 1])
+        if len(owners) > limit:
+            Feed.objects.filter(pk=self.pk).update(pulled=True)
+            self.pulled = True
+            return
+        owners.append(self.author.pk)
+        with transaction.atomic():
+            TimelineEntry.objects.bulk_create(
+                [
+                    TimelineEntry(owner_id=owner, feed=self, created_at=self.created_at)
+                    for owner in owners
+                ],
+                batch_size=1000,
+                ignore_conflicts=True,
+            )
+            Feed.objects.filter(pk=self.pk).update(fanned_out=True)
+        self.fanned_out = True
+
+
+class TimelineEntryManager(models.Manager):
+    """
+    Manager class for TimelineEntry model.
+    """
+
+    def backfill(self, owner, author):
+        """
+        Adds the latest fanned out feeds of author to the timeline of owner.
+        """
+        feeds = Feed.objects.filter(author=author, fanned_out=True)[
+            : settings.FEEDS_TIMELINE_BACKFILL
+        ]
+        return self.bulk_create(
+            [
+                TimelineEntry(owner=owner, feed=feed, created_at=feed.created_at)
+                for feed in feeds
+            ],
+            ignore_conflicts=True,
+        )
+
+    def purge(self, owner, author):
+        """
+        Removes the feeds of author from the timeline of owner.
+        """
+        return self.filter(owner=owner, feed__author=author).delete()
+
+
+class TimelineEntry(models.Model):
+    """
+    An entry of a feed in the home timeline of a user.
+    """
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="timeline_entries",
+    )
+    feed = models.ForeignKey(
+        Feed, on_delete=models.CASCADE, related_name="timeline_entries"
+    )
+    created_at = models.DateTimeField()
+
+    objects = TimelineEntryManager()
+
+    class Meta:
+        ordering = ["-created_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["owner", "feed"], name="unique_timeline_entry"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["owner", "-created_at", "-feed"],
+                name="timeline_owner_created_idx",
+            ),
+        ]
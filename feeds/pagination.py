@@ -0,0 +1,49 @@
+"""
+Contains the pagination of the home timelines.
+"""
+from core.pagination import CursorPaginator
+
+
+class TimelinePaginator(CursorPaginator):
+    """
+    Paginates a home timeline, merging the timeline entries of its owner with
+    the feeds pulled at read time.
+
+    Both are ordered on the creation time and the feed id, filtered on the
+    cursor and sliced on their own, so the entries are read with a range scan
+    of timeline_owner_created_idx. The pulled feeds are few since the feeds
+    of most authors are fanned out.
+    """
+
+    # Fields of TimelineEntry matching the ordering fields of the feeds.
+    entry_fields = {"created_at": "created_at", "id": "feed"}
+
+    def __init__(self, queryset, entries, per_page):
+        super().__init__(queryset, per_page, ordering=("-created_at", "-id"))
+        self.entries = entries
+
+    def querysets(self, ordering=None):
+        ordering = ordering or self.ordering
+        entries = self.entries.select_related("feed__author").order_by(
+            *[
+                ("-" if field.startswith("-") else "")
+                + self.entry_fields[field.lstrip("-")]
+                for field in ordering
+            ]
+        )
+        return super().querysets(ordering) + [entries]
+
+    def fetch(self, ordering, values, forward):
+        feeds = {feed.pk: feed for feed in super().fetch(ordering, values, forward)}
+        entries = self.querysets(ordering)[1]
+        if values is not None:
+            fields = [self.entry_fields[field] for field in self.fields]
+            entries = entries.filter(self._keyset_filter(values, forward, fields))
+        for entry in entries[: self.per_page + 1]:
+            feeds.setdefault(entry.feed_id, entry.feed)
+        object_list = sorted(
+            feeds.values(),
+            key=lambda feed: (feed.created_at, feed.pk),
+            reverse=forward == self.descending,
+        )
+        return object_list[: self.per_page + 1]
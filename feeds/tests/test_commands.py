@@ -0,0 +1,26 @@
+"""
+Contains tests for management commands defined in feeds app.
+"""
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from feeds.factories import FeedFactory
+from feeds.models import TimelineEntry
+
+
+class FanOutFeedsTestCase(TestCase):
+    """
+    Test class for fan_out_feeds command.
+    """
+
+    def test_command_fans_out_pending_feeds(self):
+        """
+        Tests that the command fans out the pending feeds once without interval.
+        """
+        feed = FeedFactory()
+        out = StringIO()
+        call_command("fan_out_feeds", batch_size=1, stdout=out)
+        feed.refresh_from_db()
+        self.assertTrue(feed.fanned_out)
+        self.assertTrue(TimelineEntry.objects.filter(owner=feed.author).exists())
+        self.assertIn("Fanned out 1 feeds.", out.getvalue())
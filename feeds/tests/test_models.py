@@ -2,12 +2,21 @@
 Tests for models defined in feeds app.
 """
 import uuid
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from feeds.factories import FeedFactory
-from feeds.models import Feed
+from feeds.models import Feed, TimelineEntry
+from feeds.pagination import TimelinePaginator
 from users.factories import UserFactory
 
 
+def timeline(user, per_page=100):
+    """
+    Returns the first page of the home timeline of user.
+    """
+    entries = TimelineEntry.objects.filter(owner=user)
+    return TimelinePaginator(Feed.objects.pulled(user), entries, per_page).page()
+
+
 class FeedTestCase(TestCase):
     """
     Tets class for Feed model.
@@ -44,3 +53,149 @@ class FeedTestCase(TestCase):
         feeds = Feed.objects.all()
         self.assertEqual(feed1, feeds[1])
         self.assertEqual(feed2, feeds[0])
+
+    def test_root_feed_starts_a_thread(self):
+        """
+        Tests that a feed without parent is the root of its own thread.
+        """
+        feed = FeedFactory()
+        self.assertEqual(feed.thread_id, feed.pk)
+        self.assertEqual(feed.depth, 0)
+
+    def test_reply_belongs_to_thread_of_parent(self):
+        """
+        Tests that a reply belongs to the thread of its parent one level deeper.
+        """
+        root = FeedFactory()
+        reply = FeedFactory(parent=root)
+        reply_to_reply = FeedFactory(parent=reply)
+        self.assertEqual(reply.thread_id, root.pk)
+        self.assertEqual(reply.depth, 1)
+        self.assertEqual(reply_to_reply.thread_id, root.pk)
+        self.assertEqual(reply_to_reply.depth, 2)
+
+    def test_get_thread_returns_feeds_in_depth_first_order(self):
+        """
+        Tests that get_thread returns the whole thread in depth first order
+        with one query.
+        """
+        root = FeedFactory()
+        reply1 = FeedFactory(parent=root)
+        reply2 = FeedFactory(parent=root)
+        reply_to_reply1 = FeedFactory(parent=reply1)
+        FeedFactory()
+        with self.assertNumQueries(1):
+            thread = reply2.get_thread()
+        self.assertEqual(thread, [root, reply1, reply_to_reply1, reply2])
+
+
+class TimelineTestCase(TestCase):
+    """
+    Test class for the home timeline of feeds.
+    """
+
+    def test_fan_out_adds_feed_to_timelines_of_followers_and_author(self):
+        """
+        Tests that fan_out adds the feed to the timelines of the followers and
+        the author.
+        """
+        author = UserFactory()
+        follower = UserFactory()
+        author.follow(user=follower)
+        feed = FeedFactory(author=author)
+        feed.fan_out()
+        self.assertTrue(feed.fanned_out)
+        self.assertEqual(TimelineEntry.objects.filter(feed=feed).count(), 2)
+        self.assertIn(feed, timeline(follower))
+        self.assertIn(feed, timeline(author))
+
+    @override_settings(FEEDS_FANOUT_LIMIT=1)
+    def test_fan_out_skips_authors_with_too_many_followers(self):
+        """
+        Tests that feeds of authors over the fan out limit are not fanned out
+        but are still pulled into the timelines of their followers.
+        """
+        author = UserFactory()
+        follower1 = UserFactory()
+        follower2 = UserFactory()
+        author.follow(user=follower1)
+        author.follow(user=follower2)
+        feed = FeedFactory(author=author)
+        feed.fan_out()
+        self.assertFalse(feed.fanned_out)
+        self.assertTrue(feed.pulled)
+        self.assertEqual(TimelineEntry.objects.count(), 0)
+        self.assertEqual(Feed.objects.fan_out_pending(), 0)
+        self.assertIn(feed, timeline(follower1))
+        self.assertIn(feed, timeline(follower2))
+
+    def test_timeline_excludes_feeds_of_users_not_followed(self):
+        """
+        Tests that timeline excludes feeds of users who are not followed.
+        """
+        user = UserFactory()
+        fanned_out_feed = FeedFactory()
+        fanned_out_feed.fan_out()
+        pulled_feed = FeedFactory()
+        page = timeline(user)
+        self.assertNotIn(fanned_out_feed, page)
+        self.assertNotIn(pulled_feed, page)
+
+    def test_backfill_and_purge(self):
+        """
+        Tests that backfill adds the author's feeds to a timeline and purge
+        removes them.
+        """
+        author = UserFactory()
+        owner = UserFactory()
+        feed = FeedFactory(author=author)
+        feed.fan_out()
+        TimelineEntry.objects.backfill(owner=owner, author=author)
+        self.assertIn(feed, timeline(owner))
+        TimelineEntry.objects.purge(owner=owner, author=author)
+        self.assertNotIn(feed, timeline(owner))
+
+    def test_pending_feeds_are_pulled_until_fanned_out(self):
+        """
+        Tests that new feeds are pulled into the timelines until fan_out_pending
+        adds them to the timeline entries.
+        """
+        author = UserFactory()
+        follower = UserFactory()
+        author.follow(user=follower)
+        feed = FeedFactory(author=author)
+        self.assertIn(feed, timeline(follower))
+        self.assertIn(feed, timeline(author))
+        self.assertEqual(Feed.objects.fan_out_pending(batch_size=1), 1)
+        feed.refresh_from_db()
+        self.assertTrue(feed.fanned_out)
+        self.assertEqual(TimelineEntry.objects.filter(feed=feed).count(), 2)
+        self.assertEqual(list(timeline(follower)), [feed])
+
+    @override_settings(FEEDS_FANOUT_LIMIT=1)
+    def test_timeline_merges_entries_and_pulled_feeds(self):
+        """
+        Tests that the pages of the timeline merge the fanned out and the pulled
+        feeds in order without repeating any.
+        """
+        user = UserFactory()
+        pushed_author = UserFactory()
+        pulled_author = UserFactory()
+        pushed_author.follow(user=user)
+        pulled_author.follow(user=user)
+        pulled_author.follow(user=UserFactory())
+        feeds = [
+            FeedFactory(author=pushed_author if number % 3 else pulled_author)
+            for number in range(7)
+        ]
+        Feed.objects.fan_out_pending()
+        self.assertEqual(TimelineEntry.objects.filter(owner=user).count(), 4)
+        entries = TimelineEntry.objects.filter(owner=user)
+        paginator = TimelinePaginator(Feed.objects.pulled(user), entries, 3)
+        pages = [paginator.page()]
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_cursor))
+        listed = [feed for page in pages for feed in page]
+        self.assertEqual(listed, feeds[::-1])
+        previous = paginator.page(pages[1].previous_cursor)
+        self.assertEqual(list(previous), list(pages[0]))
@@ -8,8 +8,8 @@ from django.urls import reverse
 from faker import Faker
 from feeds.factories import FeedFactory
 from feeds.forms import FeedModelForm
-from feeds.models import Feed
-from feeds.views import FeedCreate, FeedList
+from feeds.models import Feed, TimelineEntry
+from feeds.views import FeedCreate, FeedList, FeedThread, TimelineList
 from users.factories import UserFactory
 
 fake = Faker()
@@ -45,6 +45,60 @@ class FeedListTestCase(TestCase):
         self.assertIsInstance(form, FeedModelForm)
 
 
+class TimelineListTestCase(TestCase):
+    """
+    Test class for TimelineList.
+    """
+
+    def test_GET_returns_feeds_of_followed_users(self):
+        """
+        Tests that GET returns feeds of followed users only.
+        """
+        user = UserFactory()
+        followee = UserFactory()
+        followee.follow(user=user)
+        followed_feed = FeedFactory(author=followee)
+        followed_feed.fan_out()
+        other_feed = FeedFactory()
+        other_feed.fan_out()
+        request = RequestFactory().get("")
+        request.user = user
+        response = TimelineList.as_view()(request)
+        feeds = response.context_data["feeds"]
+        self.assertIn(followed_feed, feeds)
+        self.assertNotIn(other_feed, feeds)
+        self.assertEqual(response.context_data["mode"], "following")
+
+    def test_unauthenticated_users_are_redirected_to_login_page(self):
+        """
+        Tests that unauthenticated users are redirected to login page.
+        """
+        request = RequestFactory().get("")
+        request.user = AnonymousUser()
+        response = TimelineList.as_view()(request)
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(reverse("users:login"), response.url)
+
+
+class FeedThreadTestCase(TestCase):
+    """
+    Test class for FeedThread.
+    """
+
+    def test_GET_returns_whole_thread_of_feed(self):
+        """
+        Tests that GET returns the feed and the whole thread it belongs to.
+        """
+        root = FeedFactory()
+        reply = FeedFactory(parent=root)
+        other_feed = FeedFactory()
+        request = RequestFactory().get("")
+        response = FeedThread.as_view()(request, pk=reply.pk)
+        self.assertEqual(response.context_data["feed"], reply)
+        self.assertEqual(response.context_data["thread"], [root, reply])
+        self.assertNotIn(other_feed, response.context_data["thread"])
+
+
 class FeedCreateTestCase(TestCase):
     """
     Test class for FeedCreate.
@@ -63,6 +117,23 @@ class FeedCreateTestCase(TestCase):
         feed = Feed.objects.first()
         self.assertEqual(feed.text, text)
 
+    def test_valid_POST_leaves_fan_out_to_the_command(self):
+        """
+        Tests that POSTing valid data doesn't fan out the feed in the request,
+        the feed is pulled into the author's timeline until it's fanned out.
+        """
+        request = RequestFactory().post("", {"text": fake.text()})
+        user = UserFactory()
+        request.user = user
+        FeedCreate.as_view()(request)
+        feed = Feed.objects.first()
+        self.assertFalse(feed.fanned_out)
+        self.assertFalse(TimelineEntry.objects.exists())
+        request = RequestFactory().get("")
+        request.user = user
+        response = TimelineList.as_view()(request)
+        self.assertIn(feed, response.context_data["feeds"])
+
     def test_only_authenticated_users_can_POST(self):
         """
         Tests that only authenticated users can POST.
@@ -2,10 +2,12 @@
 Urls for feeds app.
 """
 from django.urls import path
-from feeds.views import FeedCreate, FeedList
+from feeds.views import FeedCreate, FeedList, FeedThread, TimelineList
 
 app_name = "feeds"
 urlpatterns = [
     path("", FeedList.as_view(), name="home"),
+    path("following/", TimelineList.as_view(), name="following"),
     path("create/", FeedCreate.as_view(), name="create"),
+    path("<uuid:pk>/", FeedThread.as_view(), name="thread"),
 ]
@@ -4,28 +4,65 @@ Views for feeds app.
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.http import HttpResponseRedirect
 from django.views import generic
+from core.pagination import CursorPaginationMixin
 from .forms import FeedModelForm
-from .models import Feed
+from .models import Feed, TimelineEntry
+from .pagination import TimelinePaginator
 
 
-class FeedList(generic.ListView):
+class FeedList(CursorPaginationMixin, generic.ListView):
     """
     View for listing feeds.
     """
 
-    queryset = Feed.objects.all()
+    queryset = Feed.objects.for_list()
     paginate_by = 10
     context_object_name = "feeds"
+    mode = "all"
 
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
         context_data["form"] = FeedModelForm()
+        context_data["mode"] = self.mode
+        return context_data
+
+
+class TimelineList(LoginRequiredMixin, FeedList):
+    """
+    View for listing feeds of the users followed by the logged-in user.
+    """
+
+    mode = "following"
+
+    def get_queryset(self):
+        return Feed.objects.pulled(self.request.user).for_list()
+
+    def get_cursor_paginator(self, queryset, page_size):
+        entries = TimelineEntry.objects.filter(owner=self.request.user)
+        return TimelinePaginator(queryset, entries, page_size)
+
+
+class FeedThread(generic.DetailView):
+    """
+    View for a feed and the whole thread of replies it belongs to.
+    """
+
+    queryset = Feed.objects.all()
+    context_object_name = "feed"
+    template_name = "feeds/feed_thread.html"
+
+    def get_context_data(self, **kwargs):
+        context_data = super().get_context_data(**kwargs)
+        context_data["thread"] = self.object.get_thread()
         return context_data
 
 
 class FeedCreate(LoginRequiredMixin, generic.CreateView):
     """
     View for creating feeds.
+
+    New feeds are fanned out by the fan_out_feeds command rather than in the
+    request, until then they're pulled into the timelines.
     """
 
     queryset = Feed.objects.all()
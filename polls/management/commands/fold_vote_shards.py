@@ -0,0 +1,17 @@
+"""
+Management command folding sharded votes into the choices.
+"""
+from django.core.management.base import BaseCommand
+from polls.models import VoteShard
+
+
+class Command(BaseCommand):
+    """
+    Moves the votes held in vote shards into Choice.votes.
+    """
+
+    help = "Folds the votes held in vote shards into the vote counts of choices."
+
+    def handle(self, *args, **options):
+        folded = VoteShard.objects.fold()
+        self.stdout.write(self.style.SUCCESS("Folded %d votes." % folded))
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:46
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("polls", "0003_auto_20201231_0906"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VoteShard",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("shard", models.PositiveSmallIntegerField()),
+                ("votes", models.PositiveIntegerField(default=0)),
+                (
+                    "choice",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="shards",
+                        to="polls.choice",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="voteshard",
+            constraint=models.UniqueConstraint(
+                fields=("choice", "shard"), name="unique_vote_shard"
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:55
+
+import core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("polls", "0004_voteshard"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="choice",
+            name="id",
+            field=models.UUIDField(
+                default=core.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="question",
+            name="id",
+            field=models.UUIDField(
+                default=core.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -1,11 +1,13 @@
 """
 Models for polls app.
 """
-import uuid
+import random
 from django.conf import settings
-from django.db import models
+from django.core.cache import cache
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Now
 from django.urls import reverse
-from core.models import TimeStampedModel
+from core.models import AuthoredQuerySet, TimeStampedModel, uuid7
 
 
 class Question(TimeStampedModel):
@@ -13,15 +15,23 @@ class Question(TimeStampedModel):
     Model class for questions.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     question_text = models.CharField(max_length=255)
     author = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="polls"
     )
     voters = models.ManyToManyField(settings.AUTH_USER_MODEL)
 
+    objects = AuthoredQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="poll_created_idx"),
+            models.Index(
+                fields=["author", "-created_at", "-id"], name="poll_author_created_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.question_text
@@ -31,13 +41,53 @@ class Question(TimeStampedModel):
 
     def vote(self, choice=None, user=None):
         """
-        Increments the vote count by 1 and saves the user as a voter.
+        Increments the vote count of choice by 1 and saves the user as a voter.
+
+        The voter row, which is unique per question and user, and the atomic
+        increment are written in one transaction. Returns True if the vote was
+        counted and False if the user had already voted on the question.
+        """
+        if user is None or choice is None:
+            return False
+        if choice.question_id != self.pk:
+            raise ValueError("The choice must belong to the question.")
+        sharded = settings.POLLS_VOTE_SHARDS > 0
+        try:
+            with transaction.atomic():
+                self.voters.through.objects.create(question=self, user=user)
+                if sharded:
+                    VoteShard.objects.increment(choice)
+                else:
+                    Choice.objects.filter(pk=choice.pk).update(
+                        votes=models.F("votes") + 1, modified_at=Now()
+                    )
+        except IntegrityError:
+            return False
+        if not sharded:
+            choice.refresh_from_db(fields=["votes", "modified_at"])
+        return True
+
+    def choices_with_totals(self):
+        """
+        Returns the choices with their total votes as total_votes.
+
+        Votes still held in shards are added to the stored counts, the shard
+        sums are cached for POLLS_VOTE_STALENESS seconds under the stored
+        counts they're added to, so that sums cached before a fold aren't
+        added to the folded counts.
         """
-        if user is not None and choice is not None and user not in self.voters.all():
-            choice.votes += 1
-            self.voters.add(user)
-            self.save()
-            choice.save()
+        choices = list(self.choices.all())
+        shard_totals = {}
+        if settings.POLLS_VOTE_SHARDS > 0:
+            folded = sum(choice.votes for choice in choices)
+            key = VoteShard.objects.cache_key(self.pk, folded)
+            shard_totals = cache.get(key)
+            if shard_totals is None:
+                shard_totals = VoteShard.objects.totals(self)
+                cache.set(key, shard_totals, settings.POLLS_VOTE_STALENESS)
+        for choice in choices:
+            choice.total_votes = choice.votes + shard_totals.get(choice.pk, 0)
+        return choices
 
 
 class Choice(TimeStampedModel):
@@ -45,7 +95,7 @@ class Choice(TimeStampedModel):
     Model class for choices.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     choice_text = models.CharField(max_length=255)
     question = models.ForeignKey(
         Question, on_delete=models.CASCADE, related_name="choices"
@@ -54,3 +104,81 @@ class Choice(TimeStampedModel):
 
     def __str__(self):
         return self.choice_text
+
+
+class VoteShardManager(models.Manager):
+    """
+    Manager class for VoteShard model.
+    """
+
+    def cache_key(self, question_pk, folded):
+        """
+        Returns the cache key of the shard totals of a question whose choices
+        hold folded votes, which grows with every fold.
+        """
+        return "polls:vote_shards:%s:%d" % (question_pk, folded)
+
+    def increment(self, choice):
+        """
+        Adds a vote to a random shard of choice.
+        """
+        shard = random.randrange(settings.POLLS_VOTE_SHARDS)
+        shards = self.filter(choice=choice, shard=shard)
+        if shards.update(votes=models.F("votes") + 1):
+            return
+        try:
+            with transaction.atomic():
+                self.create(choice=choice, shard=shard, votes=1)
+        except IntegrityError:
+            shards.update(votes=models.F("votes") + 1)
+
+    def totals(self, question):
+        """
+        Returns the sum of the shards of each choice of question.
+        """
+        return dict(
+            self.filter(choice__question=question)
+            .order_by()
+            .values_list("choice")
+            .annotate(total=models.Sum("votes"))
+        )
+
+    def fold(self):
+        """
+        Moves the votes held in shards into Choice.votes and returns the
+        number of votes moved. The cached shard totals don't need deleting
+        since their key depends on Choice.votes.
+        """
+        folded = 0
+        choices = self.filter(votes__gt=0).order_by().values_list("choice", flat=True)
+        for choice_pk in set(choices):
+            with transaction.atomic():
+                shards = list(
+                    self.select_for_update().filter(choice=choice_pk, votes__gt=0)
+                )
+                votes = sum(shard.votes for shard in shards)
+                Choice.objects.filter(pk=choice_pk).update(
+                    votes=models.F("votes") + votes, modified_at=Now()
+                )
+                self.filter(pk__in=[shard.pk for shard in shards]).update(votes=0)
+            folded += votes
+        return folded
+
+
+class VoteShard(models.Model):
+    """
+    One of the counter rows votes of a choice are spread over.
+    """
+
+    choice = models.ForeignKey(Choice, on_delete=models.CASCADE, related_name="shards")
+    shard = models.PositiveSmallIntegerField()
+    votes = models.PositiveIntegerField(default=0)
+
+    objects = VoteShardManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["choice", "shard"], name="unique_vote_shard"
+            ),
+        ]
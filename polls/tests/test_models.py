@@ -2,10 +2,12 @@
 Tests for models defined in polls app.
 """
 import uuid
-from django.test import TestCase
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from polls.factories import ChoiceFactory, QuestionFactory
-from polls.models import Choice, Question
+from polls.models import Choice, Question, VoteShard
 from users.factories import UserFactory
 
 
@@ -80,6 +82,51 @@ class QuestionModelTestCase(TestCase):
         self.assertEqual(choice1.votes, 1)
         self.assertEqual(choice2.votes, 0)
 
+    def test_vote_returns_whether_vote_was_counted(self):
+        """
+        Tests that vote returns True for a new vote and False for a repeated one.
+        """
+        user = UserFactory()
+        question = QuestionFactory()
+        choice = ChoiceFactory(question=question)
+        self.assertTrue(question.vote(choice=choice, user=user))
+        self.assertFalse(question.vote(choice=choice, user=user))
+        choice.refresh_from_db()
+        self.assertEqual(choice.votes, 1)
+
+    def test_vote_does_not_modify_question(self):
+        """
+        Tests that voting doesn't rewrite the question.
+        """
+        user = UserFactory()
+        question = QuestionFactory()
+        modified_at = question.modified_at
+        choice = ChoiceFactory(question=question)
+        question.vote(choice=choice, user=user)
+        question.refresh_from_db()
+        self.assertEqual(question.modified_at, modified_at)
+
+    def test_vote_increments_stored_count_atomically(self):
+        """
+        Tests that votes from stale instances are all counted.
+        """
+        question = QuestionFactory()
+        choice = ChoiceFactory(question=question)
+        stale_choice = Choice.objects.get(pk=choice.pk)
+        question.vote(choice=choice, user=UserFactory())
+        question.vote(choice=stale_choice, user=UserFactory())
+        choice.refresh_from_db()
+        self.assertEqual(choice.votes, 2)
+
+    def test_vote_on_choice_of_another_question_raises_value_error(self):
+        """
+        Tests that voting on a choice of another question raises ValueError.
+        """
+        question = QuestionFactory()
+        choice = ChoiceFactory()
+        with self.assertRaises(ValueError):
+            question.vote(choice=choice, user=UserFactory())
+
     def test_questions_are_ordered_from_new_to_old(self):
         """
         Tests that questions are ordered from new to old.
@@ -126,3 +173,75 @@ class ChoiceModelTestCase(TestCase):
         choice = ChoiceFactory(question=question)
         self.assertEqual(question.choices.count(), 1)
         self.assertIn(choice, question.choices.all())
+
+
+@override_settings(POLLS_VOTE_SHARDS=4, POLLS_VOTE_STALENESS=0)
+class VoteShardTestCase(TestCase):
+    """
+    Test class for sharded vote counters.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_votes_are_counted_in_shards(self):
+        """
+        Tests that votes go to the shards and not to the choice row.
+        """
+        question = QuestionFactory()
+        choice = ChoiceFactory(question=question)
+        for _ in range(5):
+            question.vote(choice=choice, user=UserFactory())
+        choice.refresh_from_db()
+        self.assertEqual(choice.votes, 0)
+        self.assertEqual(VoteShard.objects.totals(question), {choice.pk: 5})
+
+    def test_choices_with_totals_sums_shards(self):
+        """
+        Tests that choices_with_totals adds the shards to the stored votes.
+        """
+        question = QuestionFactory()
+        choice1 = ChoiceFactory(question=question, votes=2)
+        choice2 = ChoiceFactory(question=question)
+        question.vote(choice=choice1, user=UserFactory())
+        totals = {
+            choice: choice.total_votes for choice in question.choices_with_totals()
+        }
+        self.assertEqual(totals, {choice1: 3, choice2: 0})
+
+    def test_fold_moves_shard_votes_into_choices(self):
+        """
+        Tests that fold moves the votes from the shards into the choices.
+        """
+        question = QuestionFactory()
+        choice = ChoiceFactory(question=question)
+        for _ in range(3):
+            question.vote(choice=choice, user=UserFactory())
+        self.assertEqual(VoteShard.objects.fold(), 3)
+        choice.refresh_from_db()
+        self.assertEqual(choice.votes, 3)
+        self.assertEqual(VoteShard.objects.totals(question), {choice.pk: 0})
+        self.assertEqual(question.choices_with_totals()[0].total_votes, 3)
+
+    @override_settings(POLLS_VOTE_STALENESS=60)
+    def test_totals_cached_during_fold_are_not_added_to_folded_votes(self):
+        """
+        Tests that shard totals computed before a fold and cached after it
+        aren't added to the folded votes.
+        """
+        question = QuestionFactory()
+        choice = ChoiceFactory(question=question)
+        for _ in range(3):
+            question.vote(choice=choice, user=UserFactory())
+        totals = VoteShard.objects.totals
+
+        def totals_then_fold(question):
+            shard_totals = totals(question)
+            VoteShard.objects.fold()
+            return shard_totals
+
+        with mock.patch.object(
+            VoteShard.objects, "totals", side_effect=totals_then_fold
+        ):
+            self.assertEqual(question.choices_with_totals()[0].total_votes, 3)
+        self.assertEqual(question.choices_with_totals()[0].total_votes, 3)
@@ -3,20 +3,27 @@ Views for polls app.
 """
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
 from django.forms import inlineformset_factory
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
+from django.utils import timezone
 from django.views import generic
+from core.cache import get_version
+from core.conditional import ConditionalGetMixin
+from core.pagination import CursorPaginationMixin
 from polls.forms import QuestionModelForm
 from polls.models import Choice, Question
 
 
-class PollList(generic.ListView):
+class PollList(CursorPaginationMixin, generic.ListView):
     """
     View class for listing polls.
     """
 
-    queryset = Question.objects.all()
+    queryset = Question.objects.for_list()
     paginate_by = 10
     template_name = "polls/poll_list.html"
     context_object_name = "polls"
@@ -59,13 +66,41 @@ class PollCreate(LoginRequiredMixin, generic.CreateView):
         )
 
 
-class PollDetail(generic.DetailView):
+class PollDetail(ConditionalGetMixin, generic.DetailView):
     """
     View class for viewing single poll.
     """
 
     queryset = Question.objects.all()
     template_name = "polls/poll_detail.html"
+    csrf_form = True
+
+    def get_validators(self):
+        row = (
+            Question.objects.filter(pk=self.kwargs["pk"])
+            .annotate(
+                choices_modified_at=Max("choices__modified_at"),
+                choice_count=Count("choices"),
+            )
+            .values_list(
+                "modified_at", "author_id", "choices_modified_at", "choice_count"
+            )
+            .first()
+        )
+        if row is None:
+            return None
+        modified_at, author_id, choices_modified_at, choice_count = row
+        last_modified = max(modified_at, choices_modified_at or modified_at)
+        values = (last_modified, choice_count, get_version("user:%s" % author_id))
+        if settings.POLLS_VOTE_SHARDS:
+            # Sharded votes don't touch the choices until they're folded, the
+            # page may change whenever the cached totals expire, or with every
+            # vote when they aren't cached.
+            if not settings.POLLS_VOTE_STALENESS:
+                return None
+            period = int(timezone.now().timestamp() // settings.POLLS_VOTE_STALENESS)
+            return None, values + (period,)
+        return last_modified, values
 
 
 @login_required
@@ -74,15 +109,9 @@ def vote(request, pk):
     Votes on the poll.
     """
     question = get_object_or_404(Question, pk=pk)
-    if request.user in question.voters.all():
-        return render(
-            request,
-            "polls/poll_detail.html",
-            {"question": question, "error_message": "You have already voted."},
-        )
     try:
         selected_choice = question.choices.get(pk=request.POST["choice"])
-    except (KeyError, Choice.DoesNotExist):
+    except (KeyError, ValidationError, Choice.DoesNotExist):
         # Redisplay the question voting form.
         return render(
             request,
@@ -92,6 +121,10 @@ def vote(request, pk):
                 "error_message": "You did not select a choice.",
             },
         )
-    else:
-        question.vote(choice=selected_choice, user=request.user)
-        return redirect(reverse("polls:detail", args=(question.pk,)))
+    if not question.vote(choice=selected_choice, user=request.user):
+        return render(
+            request,
+            "polls/poll_detail.html",
+            {"question": question, "error_message": "You have already voted."},
+        )
+    return redirect(reverse("polls:detail", args=(question.pk,)))
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("questions", "0003_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="answer",
+            index=models.Index(
+                fields=["question", "-created_at", "-id"],
+                name="answer_question_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="answer",
+            index=models.Index(
+                fields=["author", "-created_at", "-id"],
+                name="answer_author_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="question",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="question_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="question",
+            index=models.Index(
+                fields=["author", "-created_at", "-id"],
+                name="question_author_created_idx",
+            ),
+        ),
+    ]
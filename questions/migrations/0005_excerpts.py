@@ -0,0 +1,49 @@
+# Generated by Django 4.2.16 on 2026-10-18 10:13
+
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+
+def excerpt(text, length=200):
+    """
+    Returns the start of text with its whitespace collapsed, truncated to
+    length characters, as core.models.excerpt did when written.
+    """
+    return Truncator(" ".join(text.split())).chars(length)
+
+
+def set_excerpts(apps, schema_editor):
+    """
+    Sets the excerpts of the existing questions and answers.
+    """
+    for model_name, field in (("Question", "description"), ("Answer", "text")):
+        model = apps.get_model("questions", model_name)
+        batch = []
+        for obj in model.objects.only("pk", field).iterator(1000):
+            obj.excerpt = excerpt(getattr(obj, field))
+            batch.append(obj)
+            if len(batch) == 1000:
+                model.objects.bulk_update(batch, ["excerpt"])
+                batch = []
+        model.objects.bulk_update(batch, ["excerpt"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("questions", "0004_author_created_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="answer",
+            name="excerpt",
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name="question",
+            name="excerpt",
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.RunPython(set_excerpts, migrations.RunPython.noop),
+    ]
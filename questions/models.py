@@ -1,27 +1,56 @@
 """
 Models for questions app.
 """
-import uuid
 from django.conf import settings
 from django.db import models
 from django.urls import reverse
-from core.models import TimeStampedModel
+from core.models import AuthoredQuerySet, ExcerptedModel, TimeStampedModel, uuid7
 
 
-class Question(TimeStampedModel):
+class QuestionQuerySet(AuthoredQuerySet):
+    """
+    QuerySet class for Question model.
+    """
+
+    excerpted_fields = ("description",)
+
+
+class AnswerQuerySet(AuthoredQuerySet):
+    """
+    QuerySet class for Answer model.
+
+    Answer lists show the whole text, only search results show excerpts.
+    """
+
+    excerpted_fields = ("text",)
+    list_excerpts = False
+
+
+class Question(TimeStampedModel, ExcerptedModel):
     """
     Model class for questions.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    excerpt_field = "description"
+
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     title = models.CharField(max_length=255)
     description = models.TextField()
     author = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="questions"
     )
 
+    objects = QuestionQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="question_created_idx"),
+            models.Index(
+                fields=["author", "-created_at", "-id"],
+                name="question_author_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -33,12 +62,12 @@ class Question(TimeStampedModel):
         return reverse("questions:detail", args=[self.pk])
 
 
-class Answer(TimeStampedModel):
+class Answer(TimeStampedModel, ExcerptedModel):
     """
     Model class for answers.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     text = models.TextField()
     question = models.ForeignKey(
         Question, on_delete=models.CASCADE, related_name="answers"
@@ -47,8 +76,20 @@ class Answer(TimeStampedModel):
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="answers"
     )
 
+    objects = AnswerQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["question", "-created_at", "-id"],
+                name="answer_question_created_idx",
+            ),
+            models.Index(
+                fields=["author", "-created_at", "-id"],
+                name="answer_author_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.text[:100]
@@ -2,18 +2,22 @@
 Views for questions app.
 """
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Count, Max
 from django.shortcuts import get_object_or_404, redirect
 from django.views import generic
+from core.cache import get_versions
+from core.conditional import ConditionalGetMixin
+from core.pagination import CursorPaginationMixin
 from questions.forms import AnswerModelForm, QuestionModelForm
 from questions.models import Answer, Question
 
 
-class QuestionList(generic.ListView):
+class QuestionList(CursorPaginationMixin, generic.ListView):
     """
     View class for listing questions.
     """
 
-    queryset = Question.objects.all()
+    queryset = Question.objects.for_list()
     paginate_by = 10
     context_object_name = "questions"
 
@@ -42,13 +46,45 @@ class QuestionEdit(LoginRequiredMixin, generic.UpdateView):
     template_name = "questions/question_create.html"
 
 
-class QuestionDetail(generic.DetailView):
+class QuestionDetail(ConditionalGetMixin, generic.DetailView):
     """
     View class for viewing a single question.
     """
 
     queryset = Question.objects.all()
 
+    def get_validators(self):
+        row = (
+            Question.objects.filter(pk=self.kwargs["pk"])
+            .annotate(
+                answers_modified_at=Max("answers__modified_at"),
+                answer_count=Count("answers"),
+            )
+            .values_list(
+                "modified_at", "author_id", "answers_modified_at", "answer_count"
+            )
+            .first()
+        )
+        if row is None:
+            return None
+        modified_at, author_id, answers_modified_at, answer_count = row
+        last_modified = max(modified_at, answers_modified_at or modified_at)
+        authors = {author_id}
+        if answer_count:
+            authors.update(
+                Answer.objects.filter(question=self.kwargs["pk"])
+                .order_by()
+                .values_list("author_id", flat=True)
+                .distinct()
+            )
+        authors = sorted(authors)
+        return last_modified, (
+            last_modified,
+            answer_count,
+            authors,
+            get_versions(["user:%s" % author for author in authors]),
+        )
+
 
 class AnswerCreate(LoginRequiredMixin, generic.CreateView):
     """
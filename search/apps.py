@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class SearchConfig(AppConfig):
     name = 'search'
+
+    def ready(self):
+        from search.signals import connect_search_index
+
+        connect_search_index()
@@ -0,0 +1,36 @@
+"""
+Management command rebuilding the search index.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from search.models import SearchEntry, indexed_models
+
+
+class Command(BaseCommand):
+    """
+    Recreates the search entries of all the indexable objects.
+    """
+
+    help = "Rebuilds the full-text search index from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "categories",
+            nargs="*",
+            help="Categories to rebuild, all of them if none is given.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of entries inserted per query.",
+        )
+
+    def handle(self, *args, **options):
+        unknown = set(options["categories"]) - set(indexed_models())
+        if unknown:
+            raise CommandError("Unknown categories: %s" % ", ".join(sorted(unknown)))
+        created = SearchEntry.objects.rebuild(
+            categories=options["categories"] or None,
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS("Indexed %d objects." % created))
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchEntry",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("category", models.CharField(max_length=20)),
+                ("object_id", models.UUIDField()),
+                ("text", models.TextField()),
+                ("created_at", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name_plural": "search entries",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="searchentry",
+            constraint=models.UniqueConstraint(
+                fields=("category", "object_id"), name="unique_search_entry"
+            ),
+        ),
+    ]
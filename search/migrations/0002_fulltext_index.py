@@ -0,0 +1,61 @@
+from django.db import migrations
+
+POSTGRESQL_FORWARD = [
+    "ALTER TABLE search_searchentry ADD COLUMN vector tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', text)) STORED",
+    "CREATE INDEX search_searchentry_vector_idx ON search_searchentry "
+    "USING GIN (vector)",
+]
+POSTGRESQL_BACKWARD = [
+    "DROP INDEX search_searchentry_vector_idx",
+    "ALTER TABLE search_searchentry DROP COLUMN vector",
+]
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE search_fts USING fts5("
+    "text, content='search_searchentry', content_rowid='id')",
+    "CREATE TRIGGER search_fts_insert AFTER INSERT ON search_searchentry BEGIN "
+    "INSERT INTO search_fts(rowid, text) VALUES (new.id, new.text); END",
+    "CREATE TRIGGER search_fts_delete AFTER DELETE ON search_searchentry BEGIN "
+    "INSERT INTO search_fts(search_fts, rowid, text) "
+    "VALUES ('delete', old.id, old.text); END",
+    "CREATE TRIGGER search_fts_update AFTER UPDATE ON search_searchentry BEGIN "
+    "INSERT INTO search_fts(search_fts, rowid, text) "
+    "VALUES ('delete', old.id, old.text); "
+    "INSERT INTO search_fts(rowid, text) VALUES (new.id, new.text); END",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER search_fts_update",
+    "DROP TRIGGER search_fts_delete",
+    "DROP TRIGGER search_fts_insert",
+    "DROP TABLE search_fts",
+]
+
+
+def run_statements(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+    """
+    Adds the full-text index of search entries, a GIN indexed tsvector column
+    on PostgreSQL and an FTS5 table kept in sync by triggers on SQLite.
+    """
+
+    dependencies = [
+        ("search", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_statements(
+                {"postgresql": POSTGRESQL_FORWARD, "sqlite": SQLITE_FORWARD}
+            ),
+            run_statements(
+                {"postgresql": POSTGRESQL_BACKWARD, "sqlite": SQLITE_BACKWARD}
+            ),
+        ),
+    ]
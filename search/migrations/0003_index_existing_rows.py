@@ -0,0 +1,64 @@
+from django.db import migrations
+
+# The categories, models, text and date fields and lookups indexed when this
+# migration was written.
+INDEXED = (
+    ("feeds", "feeds", "Feed", "text", "created_at", {}),
+    (
+        "articles",
+        "articles",
+        "Article",
+        "title",
+        "created_at",
+        {"published_at__isnull": False},
+    ),
+    ("questions", "questions", "Question", "title", "created_at", {}),
+    ("answers", "questions", "Answer", "text", "created_at", {}),
+    ("polls", "polls", "Question", "question_text", "created_at", {}),
+    ("users", "users", "User", "name", "date_joined", {}),
+)
+
+
+def index_existing_rows(apps, schema_editor):
+    """
+    Adds the entries of the objects written before search entries were kept
+    in sync, so that they're found right after the migration.
+    """
+    SearchEntry = apps.get_model("search", "SearchEntry")
+    for category, app_label, model_name, field, date_field, lookups in INDEXED:
+        model = apps.get_model(app_label, model_name)
+        rows = (
+            model.objects.filter(**lookups)
+            .order_by()
+            .values_list("pk", field, date_field)
+            .iterator(1000)
+        )
+        batch = []
+        for pk, text, date in rows:
+            batch.append(
+                SearchEntry(category=category, object_id=pk, text=text, created_at=date)
+            )
+            if len(batch) == 1000:
+                SearchEntry.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+        SearchEntry.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+    """
+    Indexes the existing objects, rebuild_search_index isn't needed after
+    deploying the search.
+    """
+
+    dependencies = [
+        ("search", "0002_fulltext_index"),
+        ("articles", "0003_uuid7_primary_keys"),
+        ("feeds", "0006_uuid7_primary_keys"),
+        ("polls", "0005_uuid7_primary_keys"),
+        ("questions", "0003_uuid7_primary_keys"),
+        ("users", "0004_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.RunPython(index_existing_rows, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,206 @@
-from django.db import models
+"""
+Models for search app.
+"""
+import re
+from django.db import connections, models
+from core.models import AuthoredQuerySet
 
-# Create your models here.
+
+def indexed_models():
+    """
+    Returns a mapping of search categories to the indexed model, the indexed
+    text field, the date field and the lookups selecting indexable objects.
+    """
+    from articles.models import Article
+    from feeds.models import Feed
+    from polls.models import Question as Poll
+    from questions.models import Answer, Question
+    from users.models import User
+
+    return {
+        "feeds": (Feed, "text", "created_at", {}),
+        "articles": (Article, "title", "created_at", {"published_at__isnull": False}),
+        "questions": (Question, "title", "created_at", {}),
+        "answers": (Answer, "text", "created_at", {}),
+        "polls": (Poll, "question_text", "created_at", {}),
+        "users": (User, "name", "date_joined", {}),
+    }
+
+
+def is_indexable(instance, lookups):
+    """
+    Returns whether instance matches the exact and isnull lookups.
+    """
+    for lookup, value in lookups.items():
+        field, _, operator = lookup.partition("__")
+        if operator == "isnull":
+            if (getattr(instance, field) is None) != value:
+                return False
+        elif getattr(instance, field) != value:
+            return False
+    return True
+
+
+class SearchEntryQuerySet(models.QuerySet):
+    """
+    QuerySet class for SearchEntry model.
+    """
+
+    def search(self, query):
+        """
+        Returns the entries matching every word of query as a prefix, annotated
+        with their rank and ordered from the most relevant.
+
+        Uses the tsvector column on PostgreSQL and the FTS5 table on SQLite,
+        both are created by the migrations and kept in sync by the database.
+        """
+        terms = re.findall(r"\w+", query or "")
+        if not terms:
+            return self.none()
+        vendor = connections[self.db].vendor
+        if vendor == "postgresql":
+            tsquery = " & ".join("%s:*" % term for term in terms)
+            entries = self.extra(
+                select={
+                    "rank": "ts_rank(search_searchentry.vector, "
+                    "to_tsquery('simple', %s))"
+                },
+                select_params=[tsquery],
+                where=["search_searchentry.vector @@ to_tsquery('simple', %s)"],
+                params=[tsquery],
+            )
+        elif vendor == "sqlite":
+            match = " ".join('"%s"*' % term for term in terms)
+            entries = self.extra(
+                select={"rank": "-bm25(search_fts)"},
+                tables=["search_fts"],
+                where=[
+                    "search_fts.rowid = search_searchentry.id",
+                    "search_fts MATCH %s",
+                ],
+                params=[match],
+            )
+        else:
+            entries = self.extra(select={"rank": "0"})
+            for term in terms:
+                entries = entries.filter(text__icontains=term)
+        return entries.order_by("-rank", "-created_at", "-id")
+
+    def category_counts(self):
+        """
+        Returns the number of entries of each category with one query.
+        """
+        return dict(
+            self.order_by().values_list("category").annotate(count=models.Count("id"))
+        )
+
+    def resolve(self, entries, excerpts=False):
+        """
+        Returns the objects the entries point to, in the order of entries,
+        with the category of each object as search_category.
+
+        Each category is fetched with one query, with the relations rendered in
+        lists selected, and with the excerpted fields deferred if excerpts is
+        True or the lists of the category show excerpts.
+        """
+        models_by_category = indexed_models()
+        pks_by_category = {}
+        for entry in entries:
+            pks_by_category.setdefault(entry.category, []).append(entry.object_id)
+        objects = {}
+        for category, pks in pks_by_category.items():
+            queryset = models_by_category[category][0].objects.all()
+            if isinstance(queryset, AuthoredQuerySet):
+                queryset = queryset.for_excerpts() if excerpts else queryset.for_list()
+            objects[category] = queryset.in_bulk(pks)
+        results = []
+        for entry in entries:
+            obj = objects[entry.category].get(entry.object_id)
+            if obj is not None:
+                obj.search_category = entry.category
+                results.append(obj)
+        return results
+
+
+class SearchEntryManager(models.Manager.from_queryset(SearchEntryQuerySet)):
+    """
+    Manager class for SearchEntry model.
+    """
+
+    def index(self, category, instance):
+        """
+        Adds or updates the entry of instance, or removes it if the instance
+        is no longer indexable.
+        """
+        model, field, date_field, lookups = indexed_models()[category]
+        if not is_indexable(instance, lookups):
+            return self.unindex(category, instance.pk)
+        return self.update_or_create(
+            category=category,
+            object_id=instance.pk,
+            defaults={
+                "text": getattr(instance, field),
+                "created_at": getattr(instance, date_field),
+            },
+        )
+
+    def unindex(self, category, pk):
+        """
+        Removes the entry of the object with pk.
+        """
+        return self.filter(category=category, object_id=pk).delete()
+
+    def rebuild(self, categories=None, batch_size=1000):
+        """
+        Recreates the entries of all the indexable objects of categories, or of
+        every category if None, and returns the number of entries created.
+        """
+        created = 0
+        for category, (model, field, date_field, lookups) in indexed_models().items():
+            if categories is not None and category not in categories:
+                continue
+            self.filter(category=category).delete()
+            rows = (
+                model.objects.filter(**lookups)
+                .order_by()
+                .values_list("pk", field, date_field)
+                .iterator(batch_size)
+            )
+            batch = []
+            for pk, text, date in rows:
+                batch.append(
+                    self.model(
+                        category=category, object_id=pk, text=text, created_at=date
+                    )
+                )
+                if len(batch) == batch_size:
+                    created += len(self.bulk_create(batch))
+                    batch = []
+            if batch:
+                created += len(self.bulk_create(batch))
+        return created
+
+
+class SearchEntry(models.Model):
+    """
+    The searchable text of an object of one of the search categories.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    category = models.CharField(max_length=20)
+    object_id = models.UUIDField()
+    text = models.TextField()
+    created_at = models.DateTimeField()
+
+    objects = SearchEntryManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["category", "object_id"], name="unique_search_entry"
+            ),
+        ]
+        verbose_name_plural = "search entries"
+
+    def __str__(self):
+        return self.text[:100]
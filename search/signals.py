@@ -0,0 +1,38 @@
+"""
+Contains signal receivers for search app.
+"""
+from django.db.models.signals import post_delete, post_save
+from search.models import SearchEntry, indexed_models
+
+CATEGORIES = {}
+
+
+def index_instance(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Updates the search entry of a saved instance.
+    """
+    if raw:
+        return
+    category = CATEGORIES[sender]
+    model, field, date_field, lookups = indexed_models()[category]
+    watched = {field, date_field, *(lookup.split("__")[0] for lookup in lookups)}
+    if update_fields is not None and not watched.intersection(update_fields):
+        return
+    SearchEntry.objects.index(category, instance)
+
+
+def unindex_instance(sender, instance, **kwargs):
+    """
+    Removes the search entry of a deleted instance.
+    """
+    SearchEntry.objects.unindex(CATEGORIES[sender], instance.pk)
+
+
+def connect_search_index():
+    """
+    Connects the receivers keeping the search index up to date.
+    """
+    for category, (model, field, date_field, lookups) in indexed_models().items():
+        CATEGORIES[model] = category
+        post_save.connect(index_instance, sender=model)
+        post_delete.connect(unindex_instance, sender=model)
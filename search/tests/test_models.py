@@ -0,0 +1,94 @@
+"""
+Tests for models defined in search app.
+"""
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from articles.factories import ArticleFactory
+from feeds.factories import FeedFactory
+from search.models import SearchEntry
+from users.factories import UserFactory
+
+
+class SearchEntryTestCase(TestCase):
+    """
+    Test class for SearchEntry model.
+    """
+
+    def test_saving_indexes_object(self):
+        """
+        Tests that saving an object adds its entry to the index.
+        """
+        feed = FeedFactory(text="hello world")
+        entries = SearchEntry.objects.search("hello")
+        self.assertEqual([entry.object_id for entry in entries], [feed.pk])
+
+    def test_updating_reindexes_object(self):
+        """
+        Tests that updating an object updates its entry.
+        """
+        feed = FeedFactory(text="hello world")
+        feed.text = "goodbye world"
+        feed.save()
+        self.assertFalse(SearchEntry.objects.search("hello").exists())
+        self.assertTrue(SearchEntry.objects.search("goodbye").exists())
+
+    def test_deleting_unindexes_object(self):
+        """
+        Tests that deleting an object removes its entry.
+        """
+        feed = FeedFactory(text="hello world")
+        feed.delete()
+        self.assertFalse(SearchEntry.objects.search("hello").exists())
+
+    def test_only_published_articles_are_indexed(self):
+        """
+        Tests that articles are indexed once published.
+        """
+        article = ArticleFactory(title="hello world")
+        self.assertFalse(SearchEntry.objects.search("hello").exists())
+        article.publish()
+        self.assertTrue(SearchEntry.objects.search("hello").exists())
+
+    def test_search_matches_prefixes_of_all_words(self):
+        """
+        Tests that every word of the query must match the start of a word.
+        """
+        FeedFactory(text="searching the index")
+        self.assertTrue(SearchEntry.objects.search("sear ind").exists())
+        self.assertFalse(SearchEntry.objects.search("earch").exists())
+        self.assertFalse(SearchEntry.objects.search("searching other").exists())
+
+    def test_search_orders_by_relevance(self):
+        """
+        Tests that more relevant entries come first.
+        """
+        less_relevant = FeedFactory(text="apple " + "filler " * 30)
+        more_relevant = FeedFactory(text="apple apple apple")
+        entries = SearchEntry.objects.search("apple")
+        self.assertEqual(
+            SearchEntry.objects.resolve(entries), [more_relevant, less_relevant]
+        )
+
+    def test_rebuild_indexes_existing_objects(self):
+        """
+        Tests that rebuild recreates the entries of existing objects.
+        """
+        feed = FeedFactory(text="hello world")
+        UserFactory(name="hello")
+        SearchEntry.objects.all().delete()
+        self.assertEqual(SearchEntry.objects.rebuild(categories=["feeds"]), 1)
+        entries = SearchEntry.objects.search("hello")
+        self.assertEqual(SearchEntry.objects.resolve(entries), [feed])
+
+    def test_rebuild_search_index_command(self):
+        """
+        Tests that the command rebuilds the index.
+        """
+        feed = FeedFactory(text="hello world")
+        SearchEntry.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_search_index", stdout=out)
+        entries = SearchEntry.objects.search("hello")
+        self.assertEqual(SearchEntry.objects.resolve(entries), [feed])
+        self.assertIn("Indexed", out.getvalue())
@@ -109,4 +109,38 @@ class SearchTestCase(TestCase):
         results = response.context_data["results"]
         self.assertEqual(len(results), 1)
         self.assertIn(article, results)
-        self.assertNotIn(feed, results)
\ No newline at end of file
+        self.assertNotIn(feed, results)
+
+    def test_all_category_returns_results_of_every_category(self):
+        """
+        Tests that the all category returns results of every category ranked
+        together.
+        """
+        article = ArticleFactory(title="same")
+        article.publish()
+        feed = FeedFactory(text="same same same")
+        question = QuestionFactory(title="other")
+        request = RequestFactory().get("", {"q": "same"})
+        response = Search.as_view()(request, category="all")
+        results = response.context_data["results"]
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0], feed)
+        self.assertEqual(results[0].search_category, "feeds")
+        self.assertIn(article, results)
+        self.assertNotIn(question, results)
+
+    def test_counts_of_every_category_are_returned(self):
+        """
+        Tests that the number of results of every category is returned.
+        """
+        article = ArticleFactory(title="same")
+        article.publish()
+        FeedFactory(text="same")
+        FeedFactory(text="same")
+        request = RequestFactory().get("", {"q": "same"})
+        response = Search.as_view()(request, category="articles")
+        counts = response.context_data["counts"]
+        self.assertEqual(counts["feeds"], 2)
+        self.assertEqual(counts["articles"], 1)
+        self.assertEqual(counts["all"], 3)
+        self.assertNotIn("questions", counts)
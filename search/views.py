@@ -1,17 +1,12 @@
 """
 Views for search app.
 """
-from django.contrib.auth import get_user_model
 from django.views import generic
-from articles.models import Article
-from feeds.models import Feed
-from polls.models import Question as Poll
-from questions.models import Answer, Question
+from core.pagination import CursorPaginationMixin, OffsetCursorPaginator
+from search.models import SearchEntry, indexed_models
 
-User = get_user_model()
 
-
-class Search(generic.ListView):
+class Search(CursorPaginationMixin, generic.ListView):
     """
     View class for search.
     """
@@ -20,37 +15,41 @@ class Search(generic.ListView):
     context_object_name = "results"
     paginate_by = 10
 
+    def get_category(self):
+        """
+        Returns the searched category, feeds by default.
+        """
+        return self.kwargs.get("category") or "feeds"
+
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
-        if "category" in self.kwargs:
-            context_data["category"] = self.kwargs["category"]
-        else:
-            context_data["category"] = "feeds"
+        context_data["category"] = self.get_category()
+        search_query = self.request.GET.get("q")
+        if search_query:
+            counts = SearchEntry.objects.search(search_query).category_counts()
+            counts["all"] = sum(counts.values())
+            context_data["counts"] = counts
         return context_data
 
     def get_queryset(self):
         search_query = self.request.GET.get("q")
+        category = self.get_category()
         if not search_query:
-            results = []
-        else:
-            if "category" in self.kwargs:
-                category = self.kwargs["category"]
-                if category == "feeds" or category == "":
-                    results = Feed.objects.filter(text__icontains=search_query)
-                elif category == "articles":
-                    results = Article.objects.filter(
-                        title__icontains=search_query
-                    ).exclude(published_at=None)
-                elif category == "questions":
-                    results = Question.objects.filter(title__icontains=search_query)
-                elif category == "answers":
-                    results = Answer.objects.filter(text__icontains=search_query)
-                elif category == "polls":
-                    results = Poll.objects.filter(question_text__icontains=search_query)
-                elif category == "users":
-                    results = User.objects.filter(name__icontains=search_query)
-                else:
-                    results = []
-            else:
-                results = Feed.objects.filter(text__icontains=search_query)
-        return results
+            return SearchEntry.objects.none()
+        if category == "all":
+            return SearchEntry.objects.search(search_query)
+        if category not in indexed_models():
+            return SearchEntry.objects.none()
+        return SearchEntry.objects.filter(category=category).search(search_query)
+
+    def get_cursor_paginator(self, queryset, page_size):
+        return OffsetCursorPaginator(queryset, page_size)
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator, page, entries, is_paginated = super().paginate_queryset(
+            queryset, page_size
+        )
+        page.object_list = SearchEntry.objects.resolve(
+            entries, excerpts=self.get_category() == "all"
+        )
+        return (paginator, page, page.object_list, is_paginated)
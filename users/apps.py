@@ -3,3 +3,9 @@ from django.apps import AppConfig
 
 class UsersConfig(AppConfig):
     name = 'users'
+
+    def ready(self):
+        from users.signals import connect_user_cache, connect_user_stats
+
+        connect_user_stats()
+        connect_user_cache()
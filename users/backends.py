@@ -0,0 +1,99 @@
+"""
+Contains the authentication backends of users app and the cache of the users
+of sessions.
+"""
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth import HASH_SESSION_KEY, SESSION_KEY, get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import get_hasher, identify_hasher
+from django.core.cache import cache
+from django.utils.crypto import salted_hmac
+from users import hashing
+
+
+def session_auth_hash(password):
+    """
+    Returns the session hash of password, like get_session_auth_hash.
+    """
+    key_salt = "django.contrib.auth.models.AbstractBaseUser.get_session_auth_hash"
+    return salted_hmac(key_salt, password, algorithm="sha256").hexdigest()
+
+
+def user_cache_key(pk, session_hash):
+    return "auth_user:%s:%s" % (pk, session_hash[:16])
+
+
+def forget_user(user):
+    """
+    Removes user from the user cache, under its current password and the one
+    it was loaded with.
+    """
+    passwords = {user.password, getattr(user, "_loaded_password", user.password)}
+    cache.delete_many(
+        [
+            user_cache_key(user.pk, session_auth_hash(password))
+            for password in passwords
+            if password
+        ]
+    )
+
+
+def get_user(request):
+    """
+    Returns the user of the session of request like auth.get_user, cached for
+    USER_CACHE_TIMEOUT seconds under its primary key and session hash.
+
+    Sessions hashing another password than the cached user's don't find it,
+    so sessions are ended by password changes even before it's forgotten.
+    """
+    if not hasattr(request, "_cached_user"):
+        pk = request.session.get(SESSION_KEY)
+        session_hash = request.session.get(HASH_SESSION_KEY)
+        user = None
+        if settings.USER_CACHE_TIMEOUT and pk and session_hash:
+            user = cache.get(user_cache_key(pk, session_hash))
+        if user is None:
+            user = auth.get_user(request)
+            if settings.USER_CACHE_TIMEOUT and user.is_authenticated:
+                cache.set(
+                    user_cache_key(user.pk, user.get_session_auth_hash()),
+                    user,
+                    settings.USER_CACHE_TIMEOUT,
+                )
+        request._cached_user = user
+    return request._cached_user
+
+
+class HashingModelBackend(ModelBackend):
+    """
+    ModelBackend checking passwords in the hashing pool.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        UserModel = get_user_model()
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # Hash the password anyway so that unknown emails take as long.
+            hashing.make_password(password)
+            return None
+        if not hashing.check_password(password, user.password):
+            return None
+        if self.must_update(user.password):
+            user.password = hashing.make_password(password)
+            user.save(update_fields=["password"])
+        return user if self.user_can_authenticate(user) else None
+
+    def must_update(self, encoded):
+        """
+        Returns whether encoded must be hashed again, because it wasn't hashed
+        with the preferred hasher or with its current parameters, like
+        check_password does before calling its setter.
+        """
+        hasher = identify_hasher(encoded)
+        return hasher.algorithm != get_hasher().algorithm or hasher.must_update(encoded)
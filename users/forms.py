@@ -6,6 +6,7 @@ from django.contrib.auth import password_validation
 from django.contrib.auth.forms import UserChangeForm as BaseUserChangeForm
 from django.core.exceptions import ValidationError
 from django.utils.text import gettext_lazy as _
+from .hashing import make_password
 from .models import User
 
 
@@ -47,7 +48,7 @@ class UserCreationForm(forms.ModelForm):
 
     def save(self, commit=True):
         user = super().save(commit=False)
-        user.set_password(self.cleaned_data["password"])
+        user.password = make_password(self.cleaned_data["password"])
         if commit:
             user.save()
         return user
@@ -0,0 +1,73 @@
+"""
+Contains the bounded pool password hashes are computed in.
+
+Hashing is CPU bound, so at most PASSWORD_HASHING_WORKERS hashes are computed
+at once and at most PASSWORD_HASHING_QUEUE more requests wait for a worker.
+Requests over the limit are refused with HashingBusy rather than queued, so
+hashing spikes can't tie up every worker of the server.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class HashingBusy(Exception):
+    """
+    Raised when the hashing pool can't admit more requests.
+    """
+
+
+class HashingPool:
+    """
+    Thread pool of workers computing hashes with an admission limit.
+    """
+
+    def __init__(self, workers, queue):
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hashing"
+        )
+        self.slots = threading.BoundedSemaphore(workers + queue)
+
+    def run(self, function, *args):
+        """
+        Returns the result of function called with args in a worker, raising
+        HashingBusy if the pool is full.
+        """
+        if not self.slots.acquire(blocking=False):
+            raise HashingBusy
+        try:
+            return self.executor.submit(function, *args).result()
+        finally:
+            self.slots.release()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def hashing_pool():
+    """
+    Returns the hashing pool of the process.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HashingPool(
+                settings.PASSWORD_HASHING_WORKERS, settings.PASSWORD_HASHING_QUEUE
+            )
+        return _pool
+
+
+def make_password(password):
+    """
+    Returns the hash of password computed in the hashing pool.
+    """
+    return hashing_pool().run(hashers.make_password, password)
+
+
+def check_password(password, encoded):
+    """
+    Returns whether password matches encoded, checked in the hashing pool.
+    """
+    return hashing_pool().run(hashers.check_password, password, encoded)
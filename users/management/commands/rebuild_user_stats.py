@@ -0,0 +1,25 @@
+"""
+Management command rebuilding the denormalized user stats.
+"""
+from django.core.management.base import BaseCommand
+from users.models import UserStats
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the stats of every user from the content tables.
+    """
+
+    help = "Rebuilds the activity counters of all the users from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of users whose stats are rebuilt per batch.",
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = UserStats.objects.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS("Rebuilt stats of %d users." % rebuilt))
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:44
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_auto_20201231_0906"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserStats",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("feeds", models.PositiveIntegerField(default=0)),
+                ("articles", models.PositiveIntegerField(default=0)),
+                ("questions", models.PositiveIntegerField(default=0)),
+                ("answers", models.PositiveIntegerField(default=0)),
+                ("polls", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name_plural": "user stats",
+            },
+        ),
+    ]
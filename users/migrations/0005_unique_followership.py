@@ -0,0 +1,33 @@
+# Generated by Django 4.2.16 on 2026-10-18 10:21
+
+from django.db import migrations, models
+
+
+def delete_duplicates(apps, schema_editor):
+    """
+    Keeps the first followership of each pair of users.
+    """
+    Followership = apps.get_model("users", "Followership")
+    first_ids = (
+        Followership.objects.values("followee", "follower")
+        .annotate(first_id=models.Min("id"))
+        .values("first_id")
+    )
+    Followership.objects.exclude(id__in=first_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0004_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="followership",
+            constraint=models.UniqueConstraint(
+                fields=("followee", "follower"), name="unique_followership"
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-18 10:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0005_unique_followership"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["name", "id"], name="user_name_idx"),
+        ),
+    ]
@@ -1,7 +1,6 @@
 """
 Contains the User model class
 """
-import uuid
 from django.contrib import auth
 from django.contrib.auth.models import (
     AbstractBaseUser,
@@ -10,9 +9,13 @@ from django.contrib.auth.models import (
 )
 from django.core.mail import send_mail
 from django.db import models
+from django.db.models.functions import Greatest
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.text import gettext_lazy as _
+from core.cache import bump_version
+from core.models import uuid7
 
 
 class UserManager(BaseUserManager):
@@ -93,7 +96,7 @@ class User(AbstractBaseUser, PermissionsMixin):
     A class defining the user model
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.EmailField(
         _("email address"),
         unique=True,
@@ -128,12 +131,27 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     class Meta:
         ordering = ["name"]
+        indexes = [models.Index(fields=["name", "id"], name="user_name_idx")]
         verbose_name = _("user")
         verbose_name_plural = _("users")
 
     def __str__(self):
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_name = instance.__dict__.get("name")
+        instance._loaded_password = instance.__dict__.get("password")
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        if getattr(self, "_loaded_name", self.name) != self.name:
+            bump_version("user:%s" % self.pk)
+        self._loaded_name = self.name
+        self._loaded_password = self.__dict__.get("password")
+
     def get_absolute_url(self):
         """
         Returns the url of the object.
@@ -167,6 +185,7 @@ class User(AbstractBaseUser, PermissionsMixin):
         if user is not None:
             self.followers.add(user)
             self.save()
+            self._followed_by_cache[user.pk] = True
 
     def unfollow(self, user=None):
         """
@@ -175,6 +194,26 @@ class User(AbstractBaseUser, PermissionsMixin):
         if user is not None:
             self.followers.remove(user)
             self.save()
+            self._followed_by_cache[user.pk] = False
+
+    @cached_property
+    def _followed_by_cache(self):
+        return {}
+
+    def is_followed_by(self, user):
+        """
+        Returns whether user follows this user.
+
+        The answer is memoized on the instance so repeated checks during a
+        request don't hit the database again.
+        """
+        if user is None or not user.is_authenticated:
+            return False
+        if user.pk not in self._followed_by_cache:
+            self._followed_by_cache[user.pk] = Followership.objects.filter(
+                followee=self, follower=user
+            ).exists()
+        return self._followed_by_cache[user.pk]
 
 
 class Followership(models.Model):
@@ -189,3 +228,114 @@ class Followership(models.Model):
         User, on_delete=models.CASCADE, related_name="followees_followerships"
     )
     start_date = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["followee", "follower"], name="unique_followership"
+            ),
+        ]
+
+
+class UserStatsManager(models.Manager):
+    """
+    Manager class for UserStats model.
+    """
+
+    def for_user(self, user):
+        """
+        Returns the stats of user, computing them if they don't exist yet.
+        """
+        try:
+            return self.get(user=user)
+        except self.model.DoesNotExist:
+            return self._rebuild_batch([user.pk])[0]
+
+    def rebuild(self, users=None, batch_size=1000):
+        """
+        Recomputes the stats of users, or of all the users if None, from the
+        content tables and returns the number of stats rebuilt.
+        """
+        if users is None:
+            pks = User.objects.values_list("pk", flat=True).iterator(batch_size)
+        else:
+            pks = (getattr(user, "pk", user) for user in users)
+        rebuilt = 0
+        batch = []
+        for pk in pks:
+            batch.append(pk)
+            if len(batch) == batch_size:
+                rebuilt += len(self._rebuild_batch(batch))
+                batch = []
+        if batch:
+            rebuilt += len(self._rebuild_batch(batch))
+        return rebuilt
+
+    def _rebuild_batch(self, pks):
+        stats = {pk: self.model(user_id=pk) for pk in pks}
+        for field, related_model in self.model.counted_models().items():
+            counts = (
+                related_model.objects.filter(author__in=pks)
+                .order_by()
+                .values_list("author")
+                .annotate(count=models.Count("pk"))
+            )
+            for pk, count in counts:
+                setattr(stats[pk], field, count)
+        return self.bulk_create(
+            stats.values(),
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=list(self.model.counted_models()),
+        )
+
+    def increment(self, user_id, field, delta=1):
+        """
+        Atomically adds delta to the counter field of the user's stats.
+        """
+        updated = self.filter(user_id=user_id).update(
+            **{field: Greatest(models.F(field) + delta, 0)}
+        )
+        if not updated and delta > 0:
+            self.rebuild(users=[user_id])
+
+
+class UserStats(models.Model):
+    """
+    Denormalized counts of the content created by a user.
+    """
+
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name="stats"
+    )
+    feeds = models.PositiveIntegerField(default=0)
+    articles = models.PositiveIntegerField(default=0)
+    questions = models.PositiveIntegerField(default=0)
+    answers = models.PositiveIntegerField(default=0)
+    polls = models.PositiveIntegerField(default=0)
+
+    objects = UserStatsManager()
+
+    class Meta:
+        verbose_name_plural = _("user stats")
+
+    def __str__(self):
+        return str(self.user_id)
+
+    @staticmethod
+    def counted_models():
+        """
+        Returns a mapping of the counter fields to the models they count.
+        """
+        from articles.models import Article
+        from feeds.models import Feed
+        from polls.models import Question as Poll
+        from questions.models import Answer, Question
+
+        return {
+            "feeds": Feed,
+            "articles": Article,
+            "questions": Question,
+            "answers": Answer,
+            "polls": Poll,
+        }
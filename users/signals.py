@@ -0,0 +1,52 @@
+"""
+Contains signal receivers for users app.
+"""
+from django.contrib.auth.signals import user_logged_out
+from django.db.models.signals import post_delete, post_save
+from users.backends import forget_user
+from users.models import User, UserStats
+
+STATS_FIELDS = {}
+
+
+def increment_user_stats(sender, instance, created, raw=False, **kwargs):
+    """
+    Increments the author's counter when content is created.
+    """
+    if created and not raw:
+        UserStats.objects.increment(instance.author_id, STATS_FIELDS[sender])
+
+
+def decrement_user_stats(sender, instance, **kwargs):
+    """
+    Decrements the author's counter when content is deleted.
+    """
+    UserStats.objects.increment(instance.author_id, STATS_FIELDS[sender], delta=-1)
+
+
+def connect_user_stats():
+    """
+    Connects the receivers keeping UserStats up to date.
+    """
+    for field, model in UserStats.counted_models().items():
+        STATS_FIELDS[model] = field
+        post_save.connect(increment_user_stats, sender=model)
+        post_delete.connect(decrement_user_stats, sender=model)
+
+
+def forget_cached_user(sender, instance=None, user=None, **kwargs):
+    """
+    Removes a saved, deleted or logged out user from the user cache.
+    """
+    user = instance or user
+    if user is not None:
+        forget_user(user)
+
+
+def connect_user_cache():
+    """
+    Connects the receivers keeping the user cache up to date.
+    """
+    post_save.connect(forget_cached_user, sender=User)
+    post_delete.connect(forget_cached_user, sender=User)
+    user_logged_out.connect(forget_cached_user)
@@ -0,0 +1,137 @@
+"""
+Tests for the authentication backends defined in users app.
+"""
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from users.backends import HashingModelBackend, user_cache_key
+from users.factories import UserFactory
+from users.models import User
+
+
+class UserCacheTestCase(TestCase):
+    """
+    Test class for the cache of the users of sessions.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+
+    def test_authenticated_request_skips_session_and_user_queries(self):
+        """
+        Tests that the session and the user of a request come from the cache.
+        """
+        self.client.force_login(self.user)
+        self.client.get(reverse("articles:create"))
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("articles:create"))
+        self.assertEqual(response.status_code, 200)
+
+    def test_caches_user_under_session_hash(self):
+        """
+        Tests that users are cached under their primary key and session hash.
+        """
+        self.client.force_login(self.user)
+        self.client.get(reverse("articles:create"))
+        key = user_cache_key(self.user.pk, self.user.get_session_auth_hash())
+        self.assertEqual(cache.get(key), self.user)
+
+    def test_save_forgets_user(self):
+        """
+        Tests that saved users are loaded again.
+        """
+        self.client.force_login(self.user)
+        self.client.get(reverse("articles:create"))
+        user = User.objects.get(pk=self.user.pk)
+        user.name = "New name"
+        user.save()
+        response = self.client.get(reverse("articles:create"))
+        self.assertContains(response, "New name")
+
+    def test_logout_forgets_user(self):
+        """
+        Tests that logging out removes the user from the cache.
+        """
+        self.client.force_login(self.user)
+        self.client.get(reverse("articles:create"))
+        self.client.get(reverse("users:logout"))
+        key = user_cache_key(self.user.pk, self.user.get_session_auth_hash())
+        self.assertIsNone(cache.get(key))
+
+    def test_password_change_ends_sessions(self):
+        """
+        Tests that sessions end when the password of their user changes.
+        """
+        self.client.force_login(self.user)
+        self.client.get(reverse("articles:create"))
+        user = User.objects.get(pk=self.user.pk)
+        user.set_password("new password")
+        user.save()
+        response = self.client.get(reverse("articles:create"))
+        self.assertEqual(response.status_code, 302)
+
+    def test_password_change_misses_cached_user(self):
+        """
+        Tests that sessions hashing the old password don't find the user cached
+        under the new one.
+        """
+        self.client.force_login(self.user)
+        old_hash = self.user.get_session_auth_hash()
+        self.user.set_password("new password")
+        User.objects.filter(pk=self.user.pk).update(password=self.user.password)
+        cache.set(
+            user_cache_key(self.user.pk, self.user.get_session_auth_hash()), self.user
+        )
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk, old_hash)))
+        response = self.client.get(reverse("articles:create"))
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(USER_CACHE_TIMEOUT=0)
+    def test_disabled_cache_loads_user(self):
+        """
+        Tests that users aren't cached if USER_CACHE_TIMEOUT is 0.
+        """
+        self.client.force_login(self.user)
+        self.client.get(reverse("articles:create"))
+        key = user_cache_key(self.user.pk, self.user.get_session_auth_hash())
+        self.assertIsNone(cache.get(key))
+
+
+class HashingModelBackendTestCase(TestCase):
+    """
+    Test class for HashingModelBackend.
+    """
+
+    def test_authenticate_checks_password(self):
+        """
+        Tests that users are only authenticated with their password.
+        """
+        user = UserFactory(password="password")
+        backend = HashingModelBackend()
+        self.assertEqual(
+            backend.authenticate(None, username=user.email, password="password"), user
+        )
+        self.assertIsNone(
+            backend.authenticate(None, username=user.email, password="wrong")
+        )
+        self.assertIsNone(
+            backend.authenticate(None, username="unknown@example.com", password="x")
+        )
+
+    def test_authenticate_upgrades_hashes_of_other_hashers(self):
+        """
+        Tests that passwords hashed with another hasher than the preferred one
+        are hashed again with it when users log in.
+        """
+        md5 = "django.contrib.auth.hashers.MD5PasswordHasher"
+        sha1 = "django.contrib.auth.hashers.SHA1PasswordHasher"
+        with override_settings(PASSWORD_HASHERS=[sha1, md5]):
+            user = UserFactory(password="password")
+        self.assertTrue(user.password.startswith("sha1$"))
+        backend = HashingModelBackend()
+        with override_settings(PASSWORD_HASHERS=[md5, sha1]):
+            backend.authenticate(None, username=user.email, password="password")
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith("md5$"))
+        self.assertTrue(user.check_password("password"))
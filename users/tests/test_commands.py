@@ -0,0 +1,27 @@
+"""
+Contains tests for management commands defined in users app.
+"""
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from feeds.factories import FeedFactory
+from users.factories import UserFactory
+from users.models import UserStats
+
+
+class RebuildUserStatsTestCase(TestCase):
+    """
+    Test class for rebuild_user_stats command.
+    """
+
+    def test_command_rebuilds_stats(self):
+        """
+        Tests that the command rebuilds the stats of every user.
+        """
+        user = UserFactory()
+        FeedFactory(author=user)
+        UserStats.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_user_stats", stdout=out)
+        self.assertEqual(UserStats.objects.get(user=user).feeds, 1)
+        self.assertIn("Rebuilt stats of 1 users.", out.getvalue())
@@ -0,0 +1,52 @@
+"""
+Tests for the password hashing pool defined in users app.
+"""
+import threading
+from django.contrib.auth.hashers import check_password as django_check_password
+from django.test import SimpleTestCase
+from users.hashing import HashingBusy, HashingPool, check_password, make_password
+
+
+class HashingPoolTestCase(SimpleTestCase):
+    """
+    Test class for HashingPool.
+    """
+
+    def test_runs_function_in_worker(self):
+        """
+        Tests that functions run in a worker thread.
+        """
+        pool = HashingPool(1, 0)
+        name = pool.run(lambda: threading.current_thread().name)
+        self.assertTrue(name.startswith("password-hashing"))
+
+    def test_full_pool_refuses_requests(self):
+        """
+        Tests that requests over the admission limit raise HashingBusy.
+        """
+        pool = HashingPool(1, 0)
+        started, release = threading.Event(), threading.Event()
+
+        def hold():
+            started.set()
+            release.wait()
+
+        thread = threading.Thread(target=pool.run, args=(hold,))
+        thread.start()
+        started.wait()
+        try:
+            with self.assertRaises(HashingBusy):
+                pool.run(lambda: None)
+        finally:
+            release.set()
+            thread.join()
+        self.assertIsNone(pool.run(lambda: None))
+
+    def test_passwords_round_trip(self):
+        """
+        Tests that hashes computed in the pool check against their passwords.
+        """
+        encoded = make_password("password")
+        self.assertTrue(django_check_password("password", encoded))
+        self.assertTrue(check_password("password", encoded))
+        self.assertFalse(check_password("wrong", encoded))
@@ -3,11 +3,15 @@ Contains tests for models defined in users app
 """
 import uuid
 from unittest import mock
+from django.contrib.auth.models import AnonymousUser
 from django.db import IntegrityError
 from django.test import TestCase
 from faker import Faker
+from articles.factories import ArticleFactory
+from feeds.factories import FeedFactory
+from questions.factories import AnswerFactory
 from users.factories import UserFactory
-from users.models import Followership, User
+from users.models import Followership, User, UserStats
 
 fake = Faker()
 
@@ -148,6 +152,41 @@ class UserModelTestCase(TestCase):
         self.assertEqual(anotherUser.followees.count(), 0)
         self.assertNotIn(user, anotherUser.followees.all())
 
+    def test_is_followed_by(self):
+        """
+        Tests that is_followed_by returns whether the user is a follower.
+        """
+        user = UserFactory()
+        follower = UserFactory()
+        other_user = UserFactory()
+        user.follow(user=follower)
+        user = User.objects.get(pk=user.pk)
+        self.assertTrue(user.is_followed_by(follower))
+        self.assertFalse(user.is_followed_by(other_user))
+        self.assertFalse(user.is_followed_by(AnonymousUser()))
+
+    def test_is_followed_by_is_memoized(self):
+        """
+        Tests that is_followed_by queries the database once per user.
+        """
+        user = UserFactory()
+        follower = UserFactory()
+        with self.assertNumQueries(1):
+            user.is_followed_by(follower)
+            user.is_followed_by(follower)
+
+    def test_is_followed_by_is_updated_on_follow_and_unfollow(self):
+        """
+        Tests that the memoized answer is updated by follow and unfollow.
+        """
+        user = UserFactory()
+        follower = UserFactory()
+        self.assertFalse(user.is_followed_by(follower))
+        user.follow(user=follower)
+        self.assertTrue(user.is_followed_by(follower))
+        user.unfollow(user=follower)
+        self.assertFalse(user.is_followed_by(follower))
+
     def test_users_are_ordered_alphabetically(self):
         """
         Tests that users are ordered alphabetically.
@@ -175,3 +214,69 @@ class FollowershipTestCase(TestCase):
         self.assertEqual(Followership.objects.first(), followership)
         self.assertIn(follower, followee.followers.all())
         self.assertIn(followee, follower.followees.all())
+
+    def test_duplicate_followership_is_refused(self):
+        """
+        Tests that a user can't follow the same user twice.
+        """
+        followee = UserFactory()
+        follower = UserFactory()
+        followee.follow(follower)
+        followee.follow(follower)
+        self.assertEqual(Followership.objects.count(), 1)
+        with self.assertRaises(IntegrityError):
+            Followership.objects.create(followee=followee, follower=follower)
+
+
+class UserStatsTestCase(TestCase):
+    """
+    Tests for UserStats model.
+    """
+
+    def test_for_user_computes_missing_stats(self):
+        """
+        Tests that for_user computes the stats of a user who has none yet.
+        """
+        user = UserFactory()
+        FeedFactory(author=user)
+        UserStats.objects.all().delete()
+        stats = UserStats.objects.for_user(user)
+        self.assertEqual(stats.feeds, 1)
+        self.assertEqual(stats.articles, 0)
+
+    def test_creating_content_increments_counters(self):
+        """
+        Tests that creating content increments the author's counters.
+        """
+        user = UserFactory()
+        FeedFactory(author=user)
+        FeedFactory(author=user)
+        ArticleFactory(author=user)
+        AnswerFactory(author=user)
+        stats = UserStats.objects.get(user=user)
+        self.assertEqual(stats.feeds, 2)
+        self.assertEqual(stats.articles, 1)
+        self.assertEqual(stats.answers, 1)
+        self.assertEqual(stats.questions, 0)
+
+    def test_deleting_content_decrements_counters(self):
+        """
+        Tests that deleting content decrements the author's counters.
+        """
+        user = UserFactory()
+        feed = FeedFactory(author=user)
+        FeedFactory(author=user)
+        feed.delete()
+        self.assertEqual(UserStats.objects.get(user=user).feeds, 1)
+
+    def test_rebuild_recomputes_stats_of_all_users(self):
+        """
+        Tests that rebuild recomputes the stats of all users.
+        """
+        user1 = UserFactory()
+        user2 = UserFactory()
+        FeedFactory(author=user1)
+        UserStats.objects.filter(user=user1).update(feeds=10)
+        self.assertEqual(UserStats.objects.rebuild(batch_size=1), 2)
+        self.assertEqual(UserStats.objects.get(user=user1).feeds, 1)
+        self.assertEqual(UserStats.objects.get(user=user2).feeds, 0)
@@ -4,13 +4,15 @@ Contains tests for views defined in users app.
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import PermissionDenied
-from django.test import RequestFactory, TestCase
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
+from unittest import mock
 from faker import Faker
 from articles.factories import ArticleFactory
 from feeds.factories import FeedFactory
 from users.factories import UserFactory
 from users.forms import UserCreationForm
+from users.hashing import HashingBusy
 from users.models import Followership, User
 from users.views import Follow, Login, Network, Profile, SignUp, Unfollow
 
@@ -67,6 +69,24 @@ class SignUpTestCase(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response.url, reverse("users:login"))
 
+    def test_busy_hashing_pool_refuses_signup(self):
+        """
+        Tests that signups refused by the hashing pool get 429 responses.
+        """
+        request = RequestFactory().post(
+            "",
+            data={
+                "name": fake.name(),
+                "email": fake.email(),
+                "password": fake.password(),
+            },
+        )
+        request.user = AnonymousUser()
+        with mock.patch("users.hashing.HashingPool.run", side_effect=HashingBusy):
+            response = SignUp.as_view()(request)
+        self.assertEqual(response.status_code, 429)
+        self.assertFalse(User.objects.exists())
+
     def test_invalid_POST_returns_bound_form_with_errors(self):
         """
         Tests that POSTing invalid data returns the bound form with errors.
@@ -115,6 +135,72 @@ class LoginTestCase(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response.url, settings.LOGIN_REDIRECT_URL)
 
+    def test_valid_credentials_log_in(self):
+        """
+        Tests that users are logged in with valid credentials.
+        """
+        user = UserFactory(password="password")
+        response = self.client.post(
+            reverse("users:login"), {"username": user.email, "password": "password"}
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.client.session["_auth_user_id"], str(user.pk))
+
+    @override_settings(LOGIN_THROTTLE_EMAIL_BURST=2, LOGIN_THROTTLE_IP_BURST=10)
+    def test_attempts_are_throttled_per_email(self):
+        """
+        Tests that attempts on an email over its burst get 429 responses.
+        """
+        data = {"username": "throttled@example.com", "password": "wrong"}
+        for _ in range(2):
+            response = self.client.post(reverse("users:login"), data)
+            self.assertEqual(response.status_code, 200)
+        response = self.client.post(reverse("users:login"), data)
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+
+    @override_settings(LOGIN_THROTTLE_EMAIL_BURST=10, LOGIN_THROTTLE_IP_BURST=2)
+    def test_attempts_are_throttled_per_address(self):
+        """
+        Tests that attempts from an address over its burst get 429 responses.
+        """
+        url = reverse("users:login")
+        self.client.post(url, {"username": "a@example.com", "password": "wrong"})
+        self.client.post(url, {"username": "b@example.com", "password": "wrong"})
+        response = self.client.post(
+            url, {"username": "c@example.com", "password": "wrong"}
+        )
+        self.assertEqual(response.status_code, 429)
+
+    @override_settings(
+        LOGIN_THROTTLE_EMAIL_BURST=10,
+        LOGIN_THROTTLE_IP_BURST=1,
+        LOGIN_THROTTLE_PROXIES=1,
+    )
+    def test_attempts_behind_proxy_are_throttled_per_forwarded_address(self):
+        """
+        Tests that behind a proxy attempts are throttled per forwarded address.
+        """
+        url = reverse("users:login")
+        data = {"username": "a@example.com", "password": "wrong"}
+        response = self.client.post(url, data, HTTP_X_FORWARDED_FOR="1.2.3.4")
+        self.assertEqual(response.status_code, 200)
+        response = self.client.post(url, data, HTTP_X_FORWARDED_FOR="1.2.3.5")
+        self.assertEqual(response.status_code, 200)
+        response = self.client.post(url, data, HTTP_X_FORWARDED_FOR="1.2.3.4")
+        self.assertEqual(response.status_code, 429)
+
+    def test_busy_hashing_pool_refuses_login(self):
+        """
+        Tests that logins refused by the hashing pool get 429 responses.
+        """
+        user = UserFactory()
+        with mock.patch("users.hashing.HashingPool.run", side_effect=HashingBusy):
+            response = self.client.post(
+                reverse("users:login"), {"username": user.email, "password": "x"}
+            )
+        self.assertEqual(response.status_code, 429)
+
 
 class ProfileTestCase(TestCase):
     """
@@ -131,6 +217,29 @@ class ProfileTestCase(TestCase):
         self.assertIn("user", response.context_data)
         self.assertEqual(response.context_data["user"], user)
 
+    def test_GET_returns_stats_of_user(self):
+        """
+        Tests that GET returns the activity counts of the user.
+        """
+        user = UserFactory()
+        FeedFactory(author=user)
+        request = RequestFactory().get("")
+        response = Profile.as_view()(request, pk=user.pk)
+        self.assertIn("stats", response.context_data)
+        self.assertEqual(response.context_data["stats"].feeds, 1)
+
+    def test_GET_returns_whether_request_user_follows_user(self):
+        """
+        Tests that GET returns whether the logged-in user follows the user.
+        """
+        user = UserFactory()
+        follower = UserFactory()
+        user.follow(user=follower)
+        request = RequestFactory().get("")
+        request.user = follower
+        response = Profile.as_view()(request, pk=user.pk)
+        self.assertTrue(response.context_data["is_followed"])
+
     def test_GET_returns_posts_made_by_user(self):
         """
         Tests that GET returns posts made by user.
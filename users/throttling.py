@@ -0,0 +1,41 @@
+"""
+Contains the throttling of login attempts per email and per client address.
+"""
+import functools
+from django.conf import settings
+from core.throttle import TokenBucket, client_ip
+
+
+@functools.lru_cache(maxsize=None)
+def login_bucket(name, capacity, refill_seconds, cache):
+    return TokenBucket("login:%s" % name, capacity, refill_seconds, cache)
+
+
+def throttle_login(request):
+    """
+    Consumes a login attempt of the email and the address of request, returning
+    0 or the seconds to wait if either has no attempts left.
+    """
+    keys = (
+        (
+            "ip",
+            client_ip(request, settings.LOGIN_THROTTLE_PROXIES),
+            settings.LOGIN_THROTTLE_IP_BURST,
+        ),
+        (
+            "email",
+            request.POST.get("username", "").strip().lower(),
+            settings.LOGIN_THROTTLE_EMAIL_BURST,
+        ),
+    )
+    wait = 0
+    for name, key, capacity in keys:
+        if key and capacity:
+            bucket = login_bucket(
+                name,
+                capacity,
+                settings.LOGIN_THROTTLE_REFILL_SECONDS,
+                settings.LOGIN_THROTTLE_CACHE,
+            )
+            wait = max(wait, bucket.consume(key))
+    return wait
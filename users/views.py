@@ -7,16 +7,33 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.views import generic, View
 from articles.models import Article
-from feeds.models import Feed
+from core.pagination import CursorPaginationMixin
+from core.throttle import too_many_requests
+from feeds.models import Feed, TimelineEntry
 from polls.models import Question as Poll
 from questions.models import Question, Answer
 from users.forms import UserCreationForm
-from users.models import User
+from users.hashing import HashingBusy
+from users.models import User, UserStats
+from users.throttling import throttle_login
 
 
-class SignUp(generic.CreateView):
+class HashingAdmissionMixin:
+    """
+    Mixin answering with 429 responses the posts refused by the hashing pool.
+    """
+
+    def post(self, request, *args, **kwargs):
+        try:
+            return super().post(request, *args, **kwargs)
+        except HashingBusy:
+            return too_many_requests(1)
+
+
+class SignUp(HashingAdmissionMixin, generic.CreateView):
     """
     View class for signing up a user.
     """
@@ -34,7 +51,7 @@ class SignUp(generic.CreateView):
         return reverse("users:login")
 
 
-class Login(LoginView):
+class Login(HashingAdmissionMixin, LoginView):
     """
     View class for logging in a user.
     """
@@ -46,8 +63,14 @@ class Login(LoginView):
             return redirect(settings.LOGIN_REDIRECT_URL)
         return super().dispatch(request, *args, **kwargs)
 
+    def post(self, request, *args, **kwargs):
+        wait = throttle_login(request)
+        if wait:
+            return too_many_requests(wait)
+        return super().post(request, *args, **kwargs)
+
 
-class Profile(generic.ListView):
+class Profile(CursorPaginationMixin, generic.ListView):
     """
     View class for user profile.
     """
@@ -56,10 +79,21 @@ class Profile(generic.ListView):
     context_object_name = "posts"
     paginate_by = 10
 
+    @cached_property
+    def profile_user(self):
+        """
+        Returns the user of the profile, fetched once per request.
+        """
+        return get_object_or_404(User, pk=self.kwargs["pk"])
+
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
-        user = get_object_or_404(User, pk=self.kwargs["pk"])
+        user = self.profile_user
         context_data["user"] = user
+        context_data["stats"] = UserStats.objects.for_user(user)
+        context_data["is_followed"] = user.is_followed_by(
+            getattr(self.request, "user", None)
+        )
         if "category" in self.kwargs:
             context_data["category"] = self.kwargs["category"]
         else:
@@ -67,7 +101,7 @@ class Profile(generic.ListView):
         return context_data
 
     def get_queryset(self):
-        user = get_object_or_404(User, pk=self.kwargs["pk"])
+        user = self.kwargs["pk"]
         if "category" in self.kwargs:
             category = self.kwargs["category"]
             if category == "feeds" or category == "":
@@ -81,10 +115,10 @@ class Profile(generic.ListView):
             elif category == "polls":
                 posts = Poll.objects.filter(author=user)
             else:
-                posts = []
+                return []
         else:
             posts = Feed.objects.filter(author=user)
-        return posts
+        return posts.for_list()
 
 
 class Follow(LoginRequiredMixin, View):
@@ -96,6 +130,7 @@ class Follow(LoginRequiredMixin, View):
         user = get_object_or_404(User, pk=kwargs["pk"])
         if user != request.user:
             user.follow(request.user)
+            TimelineEntry.objects.backfill(owner=request.user, author=user)
         return redirect(user)
 
 
@@ -108,10 +143,11 @@ class Unfollow(LoginRequiredMixin, View):
         user = get_object_or_404(User, pk=kwargs["pk"])
         if user != request.user:
             user.unfollow(request.user)
+            TimelineEntry.objects.purge(owner=request.user, author=user)
         return redirect(user)
 
 
-class Network(generic.ListView):
+class Network(CursorPaginationMixin, generic.ListView):
     """
     View class for listing folllowers and followees.
     """